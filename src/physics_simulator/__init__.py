@@ -1,3 +1,18 @@
 __version__ = "0.1.0"
 
-from .simulator import MujocoSimulator as PhysicsSimulator
\ No newline at end of file
+# Heavy dependencies (mujoco, synthnova_config, auro_utils...) are only
+# imported when PhysicsSimulator is first accessed (PEP 562)
+__all__ = ["PhysicsSimulator"]
+
+
+def __getattr__(name):
+    if name == "PhysicsSimulator":
+        from .simulator import MujocoSimulator
+
+        globals()[name] = MujocoSimulator
+        return MujocoSimulator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
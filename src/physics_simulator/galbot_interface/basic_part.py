@@ -143,6 +143,11 @@ class BasicLimb:
     def get_joint_positions(self):
         if not self.initialized:
             raise RuntimeError(f"{self.__class__.__name__} is not initialized")
+        if self.simulator.is_publishing_state():
+            # Served from the published snapshot, never waits for a step
+            return self.simulator.get_joint_positions(
+                robot=self.robot, joint_names=self.joint_names
+            )
         with self.simulator.lock:
             return self.simulator.get_joint_positions(
                 robot=self.robot, joint_names=self.joint_names
@@ -58,5 +58,7 @@ class Robot:
         """Get the current state of the robot"""
         if not self.initialized:
             raise RuntimeError(f"{self.__class__.__name__} is not initialized")
+        if self.simulator.is_publishing_state():
+            return self.simulator.get_robot_state(self.galbot_interface_config.robot.prim_path)
         with self.simulator.lock:
             return self.simulator.get_robot_state(self.galbot_interface_config.robot.prim_path) 
\ No newline at end of file
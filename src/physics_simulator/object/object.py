@@ -35,8 +35,8 @@ import copy
 import xml.etree.ElementTree as ET
 from copy import deepcopy
 
+import mujoco
 import numpy as np
-import gc
 
 from physics_simulator.object import MujocoModel, MujocoXML
 from physics_simulator.utils.mjcf_utils import (
@@ -92,6 +92,11 @@ class MujocoObject(MujocoModel):
 
     """
 
+    # Simulator handle and main body id, set by initialize(). Class defaults
+    # because MujocoXMLObject does not run this __init__
+    _simulator = None
+    _body_id = -1
+
     def __init__(self, obj_type="all", duplicate_collision_geoms=True):
         super().__init__()
         self.asset = ET.Element("asset")
@@ -333,76 +338,41 @@ class MujocoObject(MujocoModel):
         """
         return 2.0 * self.get_bounding_box_half_size()
 
+    def initialize(self, simulator):
+        """Bind the object to a simulator and cache the id of its main body.
+
+        Called by the simulator after every model compilation, so pose reads
+        index the MuJoCo arrays directly.
+
+        Args:
+            simulator: Initialized MujocoSimulator holding this object
+        """
+        self._simulator = simulator
+        self._body_id = mujoco.mj_name2id(
+            simulator.model._model, mujoco.mjtObj.mjOBJ_BODY, f"{self.naming_prefix}main"
+        )
+
     def get_position(self):
         """Get the position of the object in world frame.
         
         Returns:
-            np.ndarray: 3D position [x, y, z]
+            np.ndarray: 3D position [x, y, z], zeros if the object is not in a running simulation
         """
-        # Get the object position from MuJoCo if simulation is running
-        # First check if the simulator and data are available
-        from physics_simulator.simulator import MujocoSimulator as PhysicsSimulator
-        
-        sim = None
-        
-        # Try to get simulator reference
-        try:
-            for obj in gc.get_objects():
-                if isinstance(obj, PhysicsSimulator):
-                    if hasattr(obj, 'data') and obj.data is not None:
-                        sim = obj
-                        break
-        except:
-            pass
-        
-        if sim is not None and sim.data is not None:
-            try:
-                # Try to get position of the main body of this object
-                body_name = f"{self.naming_prefix}main"
-                return sim.data.get_body_xpos(body_name)
-            except Exception as e:
-                # Fall back to default position if that fails
-                return np.array([0.0, 0.0, 0.0])
-        else:
-            # Return default position if simulator is not running
+        sim = self._simulator
+        if sim is None or sim.data is None or self._body_id < 0:
             return np.array([0.0, 0.0, 0.0])
+        return sim.data._data.xpos[self._body_id].copy()
         
     def get_orientation(self):
         """Get the orientation of the object in world frame.
         
         Returns:
-            np.ndarray: Quaternion in xyzw format
+            np.ndarray: Quaternion in xyzw format, identity if the object is not in a running simulation
         """
-        # Get the object orientation from MuJoCo if simulation is running
-        # First check if the simulator and data are available
-        from physics_simulator.simulator import MujocoSimulator as PhysicsSimulator
-        
-        sim = None
-        
-        # Try to get simulator reference
-        try:
-            for obj in gc.get_objects():
-                if isinstance(obj, PhysicsSimulator):
-                    if hasattr(obj, 'data') and obj.data is not None:
-                        sim = obj
-                        break
-        except:
-            pass
-        
-        if sim is not None and sim.data is not None:
-            try:
-                # Try to get orientation from MuJoCo data
-                body_name = f"{self.naming_prefix}main"
-                # Get quaternion in wxyz format
-                quat_wxyz = sim.data.get_body_xquat(body_name)
-                # Convert to xyzw format
-                return wxyz_to_xyzw(quat_wxyz)
-            except Exception as e:
-                # Fall back to default orientation if that fails
-                return np.array([0.0, 0.0, 0.0, 1.0])
-        else:
-            # Return default orientation if simulator is not running
+        sim = self._simulator
+        if sim is None or sim.data is None or self._body_id < 0:
             return np.array([0.0, 0.0, 0.0, 1.0])
+        return wxyz_to_xyzw(sim.data._data.xquat[self._body_id].copy())
 
     def get_translation(self):
         """Get the translation of the object in local frame.
@@ -1 +1,2 @@
 from .mujoco_robot import MujocoRobot
+from .kinematics import KinematicsEngine, manipulability
@@ -0,0 +1,227 @@
+#####################################################################################
+#
+# Description: Side-effect-free batched kinematics on scratch MjData instances
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, Tuple
+
+import mujoco
+import numpy as np
+
+# Below this many configurations per thread, splitting a batch costs more than it saves
+_MIN_CHUNK_SIZE = 16
+
+
+def manipulability(jacobians: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the Yoshikawa manipulability index of Jacobians.
+
+    Args:
+        jacobians: Array of shape (..., 6, nv)
+
+    Returns:
+        tuple: (manipulability of shape (...), singular values of shape
+            (..., min(6, nv)) in descending order), the index being the product
+            of the singular values
+    """
+    singular_values = np.linalg.svd(jacobians, compute_uv=False)
+    return np.prod(singular_values, axis=-1), singular_values
+
+
+class KinematicsEngine:
+    """Batched forward kinematics that never touches the simulation data.
+
+    Every worker thread owns a scratch ``MjData`` of the model. A
+    configuration is evaluated by copying the reference ``qpos`` (taken from
+    the live data with ``sync()``), writing the joint values through
+    precomputed ``qpos`` addresses and running ``mj_kinematics`` only, so FK
+    can be called from physics callbacks without perturbing the running
+    simulation and without full forward passes. Batches are split across a
+    thread pool, MuJoCo releases the GIL while it computes.
+
+    Calls are serialized, one batch is evaluated at a time.
+    """
+
+    def __init__(
+        self,
+        model: mujoco.MjModel,
+        joint_names: Sequence[str],
+        link_names: Sequence[str],
+        num_threads: Optional[int] = None,
+    ):
+        """Initialize the engine.
+
+        Args:
+            model: Compiled MuJoCo model
+            joint_names: Joints set by every configuration, in column order
+            link_names: Bodies whose poses are returned, in output order
+            num_threads: Number of worker threads, defaults to the CPU count (at most 8)
+
+        Raises:
+            ValueError: If a joint or link does not exist in the model
+        """
+        self.model = model
+        self.joint_names = tuple(joint_names)
+        self.link_names = tuple(link_names)
+        joint_ids = [self._name2id(mujoco.mjtObj.mjOBJ_JOINT, name) for name in self.joint_names]
+        self.qpos_indexes = np.asarray(model.jnt_qposadr[joint_ids], dtype=np.intp)
+        self.body_ids = self.link_ids(self.link_names)
+        if num_threads is None:
+            num_threads = min(os.cpu_count() or 1, 8)
+        self.num_threads = max(1, num_threads)
+
+        self._datas = [mujoco.MjData(model) for _ in range(self.num_threads)]
+        self._reference_qpos = model.qpos0.copy()
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _name2id(self, obj_type, name: str) -> int:
+        object_id = mujoco.mj_name2id(self.model, obj_type, name)
+        if object_id < 0:
+            kind = "Joint" if obj_type == mujoco.mjtObj.mjOBJ_JOINT else "Link"
+            raise ValueError(f"{kind} {name} not found in model")
+        return object_id
+
+    def link_ids(self, link_names: Sequence[str]) -> np.ndarray:
+        """Get the body ids of links.
+
+        Args:
+            link_names: Body names
+
+        Returns:
+            np.ndarray: Body ids, in the given order
+
+        Raises:
+            ValueError: If a link does not exist in the model
+        """
+        return np.array(
+            [self._name2id(mujoco.mjtObj.mjOBJ_BODY, name) for name in link_names],
+            dtype=np.intp,
+        )
+
+    def sync(self, data: mujoco.MjData):
+        """Take the configuration of joints not set by the batch, and mocap poses, from a data instance.
+
+        Args:
+            data: mujoco.MjData of the model, typically the live simulation data
+        """
+        with self._lock:
+            np.copyto(self._reference_qpos, data.qpos)
+            for scratch in self._datas:
+                scratch.mocap_pos[:] = data.mocap_pos
+                scratch.mocap_quat[:] = data.mocap_quat
+
+    def _as_batch(self, q: np.ndarray) -> Tuple[np.ndarray, bool]:
+        q = np.asarray(q, dtype=np.float64)
+        single = q.ndim == 1
+        q = np.atleast_2d(q)
+        if q.ndim != 2 or q.shape[1] != len(self.joint_names):
+            raise ValueError(
+                f"Configurations must have shape (B, {len(self.joint_names)}), got {q.shape}"
+            )
+        return q, single
+
+    def _pose(self, data: mujoco.MjData, q: np.ndarray):
+        data.qpos[:] = self._reference_qpos
+        data.qpos[self.qpos_indexes] = q
+        mujoco.mj_kinematics(self.model, data)
+
+    def _map_batch(self, batch_size: int, evaluate: Callable[[mujoco.MjData, int, int], None]):
+        """Run evaluate(data, start, stop) over the batch, one contiguous chunk per thread."""
+        num_chunks = min(self.num_threads, max(1, batch_size // _MIN_CHUNK_SIZE))
+        if num_chunks == 1:
+            evaluate(self._datas[0], 0, batch_size)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_threads, thread_name_prefix="kinematics"
+            )
+        bounds = np.linspace(0, batch_size, num_chunks + 1).astype(int)
+        futures = [
+            self._executor.submit(evaluate, self._datas[i], bounds[i], bounds[i + 1])
+            for i in range(num_chunks)
+        ]
+        for future in futures:
+            future.result()
+
+    def forward(
+        self, q: np.ndarray, body_ids: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute the world poses of the links for a batch of configurations.
+
+        Args:
+            q: Joint values of shape (B, J), or (J,) for a single configuration
+            body_ids: Bodies to return instead of the engine links, see link_ids()
+
+        Returns:
+            tuple: (positions, rotations) of shapes (B, L, 3) and (B, L, 3, 3),
+                or (L, 3) and (L, 3, 3) for a single configuration
+
+        Raises:
+            ValueError: If q does not have one column per joint
+        """
+        q, single = self._as_batch(q)
+        body_ids = self.body_ids if body_ids is None else body_ids
+        positions = np.empty((len(q), len(body_ids), 3))
+        rotations = np.empty((len(q), len(body_ids), 3, 3))
+
+        def evaluate(data, start, stop):
+            for b in range(start, stop):
+                self._pose(data, q[b])
+                positions[b] = data.xpos[body_ids]
+                rotations[b] = data.xmat[body_ids].reshape(-1, 3, 3)
+
+        with self._lock:
+            self._map_batch(len(q), evaluate)
+        if single:
+            return positions[0], rotations[0]
+        return positions, rotations
+
+    def jacobians(self, q: np.ndarray, body_ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute the body Jacobians of the links for a batch of configurations.
+
+        Every configuration runs ``mj_kinematics`` and ``mj_comPos``, which is
+        all ``mj_jacBody`` needs.
+
+        Args:
+            q: Joint values of shape (B, J), or (J,) for a single configuration
+            body_ids: Bodies to evaluate instead of the engine links, see link_ids()
+
+        Returns:
+            np.ndarray: Jacobians of shape (B, L, 6, nv), translation rows first,
+                or (L, 6, nv) for a single configuration
+
+        Raises:
+            ValueError: If q does not have one column per joint
+        """
+        q, single = self._as_batch(q)
+        body_ids = self.body_ids if body_ids is None else body_ids
+        jacobians = np.empty((len(q), len(body_ids), 6, self.model.nv))
+
+        def evaluate(data, start, stop):
+            for b in range(start, stop):
+                self._pose(data, q[b])
+                mujoco.mj_comPos(self.model, data)
+                for link, body_id in enumerate(body_ids):
+                    jacobian = jacobians[b, link]
+                    mujoco.mj_jacBody(self.model, data, jacobian[:3], jacobian[3:], body_id)
+
+        with self._lock:
+            self._map_batch(len(q), evaluate)
+        return jacobians[0] if single else jacobians
+
+    def close(self):
+        """Shut the worker threads down."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
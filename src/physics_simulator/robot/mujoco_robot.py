@@ -30,13 +30,32 @@
 #####################################################################################
 
 import mujoco
+from physics_simulator.robot.kinematics import manipulability
 from physics_simulator.robot.robot_model import MujocoRobotModel
 # from physics_simulator import PhysicsSimulator
 import numpy as np
 from synthnova_config import RobotConfig
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from auro_utils import wxyz_to_xyzw
 
+
+class JointIndexTable(NamedTuple):
+    """Precomputed MuJoCo indexes of an ordered list of joints.
+
+    Attributes:
+        qpos: Address of every joint in ``data.qpos``
+        dof: Address of every joint in ``data.qvel``
+        actuated: Positions, in the joint list, of the joints driven by an
+            actuator of the same name
+        actuators: Actuator id in ``data.ctrl`` of every actuated joint
+    """
+
+    qpos: np.ndarray
+    dof: np.ndarray
+    actuated: np.ndarray
+    actuators: np.ndarray
+
+
 class MujocoRobot(object):
     """A wrapper class for manipulating robots in MuJoCo simulations.
     
@@ -62,6 +81,7 @@ class MujocoRobot(object):
         self.name = robot_config.name
         self.joint_names = None
         self.joint_indexes = None
+        self._joint_index_tables = {}
         self.model = None
         self.data = None
         # Store initial world pose until MuJoCo is initialized
@@ -99,11 +119,14 @@ class MujocoRobot(object):
         self.mujoco_data = self.data._data
         
         # Initialize robot model with mujoco model and data
-        self.robot_model.initialize(self.mujoco_model, self.mujoco_data)
+        self.robot_model.initialize(self.mujoco_model, self.mujoco_data, lock=self.sim.lock)
         
-        # Get joint names and indexes
+        # Get joint names and indexes, tables of a previous model are stale
+        self._joint_index_tables = {}
         self.joint_names = self.robot_model.joint_names
-        self.joint_indexes = self.get_joint_indexes(self.joint_names)
+        self._joint_set = frozenset(self.joint_names)
+        self._all_joints = self.get_joint_index_table()
+        self.joint_indexes = self._all_joints.qpos.tolist()
         
         # Find the robot's root/base body (first body that's not 'world' or 'ground')
         self.root_body_id = None
@@ -213,9 +236,48 @@ class MujocoRobot(object):
 
     def get_joint_indexes(self, joint_names):
         """Get the indexes for a list of joints by name."""
-        return [
-            self.get_joint_index(joint_name) for joint_name in joint_names
-        ]
+        return self.get_joint_index_table(joint_names).qpos.tolist()
+
+    def get_joint_index_table(self, joint_names=None) -> JointIndexTable:
+        """Get the qpos, dof and actuator indexes of a list of joints.
+
+        Tables are built on first use and cached per joint name tuple until
+        the robot is initialized again, so repeated reads and writes of the
+        same joints are single fancy-indexed operations.
+
+        Args:
+            joint_names: Ordered joint names (defaults to all joints)
+
+        Returns:
+            JointIndexTable: Indexes of the joints, in the given order
+
+        Raises:
+            ValueError: If a joint does not exist in the model
+        """
+        key = self.joint_names if joint_names is None else joint_names
+        key = key if isinstance(key, tuple) else tuple(key)
+        table = self._joint_index_tables.get(key)
+        if table is not None:
+            return table
+
+        joint_ids = [self.model.joint_name2id(joint_name) for joint_name in key]
+        actuated = []
+        actuators = []
+        for position, joint_name in enumerate(key):
+            actuator_id = mujoco.mj_name2id(
+                self.mujoco_model, mujoco.mjtObj.mjOBJ_ACTUATOR, joint_name
+            )
+            if actuator_id >= 0:
+                actuated.append(position)
+                actuators.append(actuator_id)
+        table = JointIndexTable(
+            qpos=np.asarray(self.mujoco_model.jnt_qposadr[joint_ids], dtype=np.intp),
+            dof=np.asarray(self.mujoco_model.jnt_dofadr[joint_ids], dtype=np.intp),
+            actuated=np.asarray(actuated, dtype=np.intp),
+            actuators=np.asarray(actuators, dtype=np.intp),
+        )
+        self._joint_index_tables[key] = table
+        return table
 
     def get_dof_index(self, joint_name):
         """Get the DOF index for a joint by name (alias for get_joint_index)."""
@@ -238,18 +300,8 @@ class MujocoRobot(object):
         Returns:
             numpy.ndarray: Array of joint positions in radians/meters
         """
-        if joint_names is None:
-            joint_names = self.joint_names
-            
-        joint_positions = []
-        for joint_name in joint_names:
-            joint_idx = self.get_joint_index(joint_name)
-            if joint_idx >= 0:
-                joint_positions.append(self.data.qpos[joint_idx])
-            else:
-                raise ValueError(f"Joint {joint_name} not found")
-                
-        return np.array(joint_positions)
+        table = self._all_joints if joint_names is None else self.get_joint_index_table(joint_names)
+        return self.mujoco_data.qpos[table.qpos]
 
     def get_joint_velocities(self, joint_names=None):
         """Get current velocities of specified joints.
@@ -261,19 +313,17 @@ class MujocoRobot(object):
             numpy.ndarray: Array of joint velocities
         """
         if joint_names is None:
-            joint_names = self.joint_names
-            
-        joint_velocities = []
-        for joint_name in joint_names:
-            joint_id = mujoco.mj_name2id(self.mujoco_model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
-            if joint_id >= 0:
-                dof_idx = self.mujoco_model.jnt_dofadr[joint_id]
-                joint_velocities.append(self.data.qvel[dof_idx])
-            else:
-                # If joint not found, add a default value (0)
-                joint_velocities.append(0.0)
-                
-        return np.array(joint_velocities)
+            return self.mujoco_data.qvel[self._all_joints.dof]
+        try:
+            table = self.get_joint_index_table(joint_names)
+        except ValueError:
+            # Joints missing from the model read as 0
+            return np.array([
+                self.mujoco_data.qvel[self.get_joint_index_table([joint_name]).dof[0]]
+                if joint_name in self.model.joint_names else 0.0
+                for joint_name in joint_names
+            ])
+        return self.mujoco_data.qvel[table.dof]
 
     def set_joint_positions(self, positions, joint_names, immediate=False):
         """Set positions of specified joints.
@@ -283,18 +333,10 @@ class MujocoRobot(object):
             joint_names: List of joint names to set positions for
             immediate: If True, set positions immediately without interpolation
         """
-        # Process each joint and its target position
-        for joint_name, position in zip(joint_names, positions):
-            if joint_name in self.joint_names:
-                # Set actuator control target if one exists for this joint
-                actuator_id = self.model.actuator_name2id(joint_name)
-                if actuator_id >= 0:  # -1 indicates no actuator found
-                    self.data.ctrl[actuator_id] = position
-            else:
-                raise ValueError(f"Joint {joint_name} not found")
+        self._write_ctrl(positions, joint_names)
 
         if immediate:
-            mujoco.mj_forward(self.mujoco_model, self.mujoco_data)
+            self.sim.forward()
 
     # NOTE@Chenyu: Basically same as set_joint_positions, but for velocities
     def set_joint_velocities(self, velocities, joint_names, immediate=False):
@@ -308,18 +350,30 @@ class MujocoRobot(object):
         Raises:
             ValueError: If a joint is not found
         """
-
-        for joint_name, position in zip(joint_names, velocities):
-            if joint_name in self.joint_names:
-                # Set actuator control target if one exists for this joint
-                actuator_id = self.model.actuator_name2id(joint_name)
-                if actuator_id >= 0:  # -1 indicates no actuator found
-                    self.data.ctrl[actuator_id] = position
-            else:
-                raise ValueError(f"Joint {joint_name} not found")
+        self._write_ctrl(velocities, joint_names)
 
         if immediate:
-            mujoco.mj_forward(self.mujoco_model, self.mujoco_data)
+            self.sim.forward()
+
+    def _write_ctrl(self, values, joint_names):
+        """Scatter per-joint values into the controls of the joints' actuators.
+
+        Joints without an actuator of the same name are skipped.
+
+        Raises:
+            ValueError: If a joint is not part of the robot
+        """
+        if not self._joint_set.issuperset(joint_names):
+            missing = next(name for name in joint_names if name not in self._joint_set)
+            raise ValueError(f"Joint {missing} not found")
+        values = np.asarray(values, dtype=np.float64).reshape(-1)
+        table = self.get_joint_index_table(joint_names)
+        if len(values) < len(table.qpos):
+            # zip() semantics: joints without a value are left untouched
+            keep = table.actuated < len(values)
+            self.mujoco_data.ctrl[table.actuators[keep]] = values[table.actuated[keep]]
+        else:
+            self.mujoco_data.ctrl[table.actuators] = values[table.actuated]
 
     def get_state(self):
         """Get the complete state of the robot.
@@ -454,6 +508,29 @@ class MujocoRobot(object):
         """
         return self.robot_model.fk_all_link(q)
     
+    def fk_batch(
+        self, q: np.ndarray, link_names: Optional[List[str]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute forward kinematics for a batch of joint configurations.
+
+        Configurations are evaluated on scratch data by the robot's
+        KinematicsEngine, split across its worker threads, so the simulation
+        is left untouched. Joints outside the robot and mocap bodies keep
+        their current values.
+
+        Args:
+            q: Joint configurations of shape (B, J), in get_joint_names() order
+            link_names: Links to return (defaults to all links of the robot)
+
+        Returns:
+            tuple: (positions, rotations) of shapes (B, L, 3) and (B, L, 3, 3)
+        """
+        engine = self.robot_model.kinematics
+        with self.sim.lock:
+            engine.sync(self.mujoco_data)
+        body_ids = None if link_names is None else engine.link_ids(link_names)
+        return engine.forward(q, body_ids=body_ids)
+
     def fk_jacobian(self, q: np.ndarray, link: str) -> np.ndarray:
         """Compute the Jacobian matrix for a specific link.
         
@@ -469,6 +546,42 @@ class MujocoRobot(object):
         """
         return self.robot_model.fk_jacobian(q, link)
     
+    def compute_jacobians(
+        self,
+        q: np.ndarray,
+        link_names,
+        return_manipulability: bool = False,
+    ):
+        """Compute link Jacobians for a batch of joint configurations.
+
+        Configurations are evaluated on per-thread scratch data by the robot's
+        KinematicsEngine, so the simulation is left untouched.
+
+        Args:
+            q: Joint configurations of shape (B, J), in get_joint_names() order
+            link_names: Link name, or list of L link names
+            return_manipulability: If True, also return the manipulability
+                index and singular values of every Jacobian, restricted to the
+                columns of the robot joints
+
+        Returns:
+            np.ndarray: Jacobians of shape (B, 6, nv) for one link or (B, L, 6, nv),
+                translation rows first; with return_manipulability, a tuple
+                (jacobians, manipulability (B,) or (B, L), singular values
+                (B, K) or (B, L, K) with K = min(6, J))
+        """
+        engine = self.robot_model.kinematics
+        with self.sim.lock:
+            engine.sync(self.mujoco_data)
+        single_link = isinstance(link_names, str)
+        body_ids = engine.link_ids([link_names] if single_link else link_names)
+        jacobians = engine.jacobians(np.atleast_2d(q), body_ids=body_ids)
+        if single_link:
+            jacobians = jacobians[:, 0]
+        if not return_manipulability:
+            return jacobians
+        return (jacobians,) + manipulability(jacobians[..., self._all_joints.dof])
+
     def generate_random_qpos(self) -> np.ndarray:
         """Generate a random joint configuration within joint limits.
         
@@ -30,9 +30,12 @@
 #####################################################################################
 
 
+import threading
+
 import mujoco
 from auro_utils.math.transform import xyzw_to_wxyz
 from physics_simulator.object import MujocoXMLModel
+from physics_simulator.robot.kinematics import KinematicsEngine
 # from physics_simulator.robot.gripper_model import GripperModel
 from physics_simulator.utils.mjcf_utils import (
     MOUNT_COLLISION_COLOR,
@@ -57,6 +60,8 @@ class MujocoRobotModel(MujocoXMLModel):
         self._actuators = []  # Use private attribute with property
         self._mujoco_model = None
         self._mujoco_data = None
+        self._kinematics = None
+        self._lock = threading.RLock()
         self._root_body = None  # Use private attribute with property
     
     @property
@@ -74,7 +79,7 @@ class MujocoRobotModel(MujocoXMLModel):
         """Set root body name"""
         self._root_body = value
         
-    def initialize(self, model, data):
+    def initialize(self, model, data, lock=None):
         """
         Initialize model with MuJoCo model and data.
         
@@ -84,9 +89,16 @@ class MujocoRobotModel(MujocoXMLModel):
             MuJoCo model
         data: mujoco.MjData
             MuJoCo data
+        lock: threading.RLock, optional
+            Lock guarding the live data, e.g. the simulator lock
         """
         self._mujoco_model = model
         self._mujoco_data = data
+        if lock is not None:
+            self._lock = lock
+        if self._kinematics is not None:
+            self._kinematics.close()
+            self._kinematics = None
         
         # Get all joint information, filtering by namespace
         self.joint_names = []
@@ -163,6 +175,37 @@ class MujocoRobotModel(MujocoXMLModel):
             "quat", array_to_string(rot)
         )
     
+    @property
+    def kinematics(self) -> KinematicsEngine:
+        """Scratch-data kinematics engine over all joints and links of the robot."""
+        if self._mujoco_model is None or self._mujoco_data is None:
+            raise ValueError("MuJoCo model and data not initialized")
+        if self._kinematics is None:
+            self._kinematics = KinematicsEngine(
+                self._mujoco_model, self.joint_names, self.links_name
+            )
+        return self._kinematics
+
+    def _synced_kinematics(self, q: np.ndarray) -> Tuple[KinematicsEngine, np.ndarray]:
+        """Get the kinematics engine synced with the live data, and q completed with the live joint values.
+
+        The live data is read under the lock so that stepping threads cannot modify it meanwhile.
+        """
+        engine = self.kinematics
+        with self._lock:
+            engine.sync(self._mujoco_data)
+            return engine, self._full_q(q)
+
+    def _full_q(self, q: np.ndarray) -> np.ndarray:
+        """Complete a configuration of the first len(q) joints with the live joint values."""
+        q = np.asarray(q, dtype=np.float64)
+        if q.shape[-1] >= len(self.joint_names):
+            return q[..., :len(self.joint_names)]
+        live_q = self._mujoco_data.qpos[self.kinematics.qpos_indexes]
+        full_q = np.broadcast_to(live_q, q.shape[:-1] + live_q.shape).copy()
+        full_q[..., :q.shape[-1]] = q
+        return full_q
+
     def fk_link(self, q: np.ndarray, link: str) -> Tuple[np.ndarray, np.ndarray]:
         """
         Compute the forward kinematics for a specific link.
@@ -181,33 +224,9 @@ class MujocoRobotModel(MujocoXMLModel):
         link_rot: np.ndarray (3, 3)
             The rotation of the link.
         """
-        if self._mujoco_model is None or self._mujoco_data is None:
-            raise ValueError("MuJoCo model and data not initialized")
-            
-        # Save original positions
-        original_qpos = self._mujoco_data.qpos.copy()
-        
-        # Set joint positions
-        for i, joint_name in enumerate(self.joint_names):
-            if i < len(q):
-                joint_id = mujoco.mj_name2id(self._mujoco_model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
-                if joint_id >= 0:
-                    self._mujoco_data.qpos[self._mujoco_model.jnt_qposadr[joint_id]] = q[i]
-        
-        # Forward kinematics
-        mujoco.mj_forward(self._mujoco_model, self._mujoco_data)
-        
-        # Get link position and orientation
-        body_id = mujoco.mj_name2id(self._mujoco_model, mujoco.mjtObj.mjOBJ_BODY, link)
-        if body_id < 0:
-            raise ValueError(f"Link {link} not found in model")
-            
-        link_trans = self._mujoco_data.xpos[body_id].copy()
-        link_rot = self._mujoco_data.xmat[body_id].reshape(3, 3).copy()
-        
-        # Restore original positions
-        self._mujoco_data.qpos[:] = original_qpos
-        mujoco.mj_forward(self._mujoco_model, self._mujoco_data)
+        engine, q = self._synced_kinematics(q)
+        positions, rotations = engine.forward(q, body_ids=engine.link_ids([link]))
+        link_trans, link_rot = positions[0], rotations[0]
         
         return link_trans, link_rot
     
@@ -227,35 +246,10 @@ class MujocoRobotModel(MujocoXMLModel):
         link_rot: Dict[str, np.ndarray (3, 3)]
             The rotation of each link.
         """
-        if self._mujoco_model is None or self._mujoco_data is None:
-            raise ValueError("MuJoCo model and data not initialized")
-            
-        # Save original positions
-        original_qpos = self._mujoco_data.qpos.copy()
-        
-        # Set joint positions
-        for i, joint_name in enumerate(self.joint_names):
-            if i < len(q):
-                joint_id = mujoco.mj_name2id(self._mujoco_model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
-                if joint_id >= 0:
-                    self._mujoco_data.qpos[self._mujoco_model.jnt_qposadr[joint_id]] = q[i]
-        
-        # Forward kinematics
-        mujoco.mj_forward(self._mujoco_model, self._mujoco_data)
-        
-        # Get all link positions and orientations
-        link_trans = {}
-        link_rot = {}
-        
-        for link in self.links_name:
-            body_id = mujoco.mj_name2id(self._mujoco_model, mujoco.mjtObj.mjOBJ_BODY, link)
-            if body_id >= 0:
-                link_trans[link] = self._mujoco_data.xpos[body_id].copy()
-                link_rot[link] = self._mujoco_data.xmat[body_id].reshape(3, 3).copy()
-        
-        # Restore original positions
-        self._mujoco_data.qpos[:] = original_qpos
-        mujoco.mj_forward(self._mujoco_model, self._mujoco_data)
+        engine, q = self._synced_kinematics(q)
+        positions, rotations = engine.forward(q)
+        link_trans = dict(zip(engine.link_names, positions))
+        link_rot = dict(zip(engine.link_names, rotations))
         
         return link_trans, link_rot
     
@@ -275,39 +269,8 @@ class MujocoRobotModel(MujocoXMLModel):
         link_jacobian: np.ndarray (6, J)
             The jacobian of the link.
         """
-        if self._mujoco_model is None or self._mujoco_data is None:
-            raise ValueError("MuJoCo model and data not initialized")
-            
-        # Save original positions
-        original_qpos = self._mujoco_data.qpos.copy()
-        
-        # Set joint positions
-        for i, joint_name in enumerate(self.joint_names):
-            if i < len(q):
-                joint_id = mujoco.mj_name2id(self._mujoco_model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
-                if joint_id >= 0:
-                    self._mujoco_data.qpos[self._mujoco_model.jnt_qposadr[joint_id]] = q[i]
-        
-        # Forward kinematics
-        mujoco.mj_forward(self._mujoco_model, self._mujoco_data)
-        
-        # Get body ID for the link
-        body_id = mujoco.mj_name2id(self._mujoco_model, mujoco.mjtObj.mjOBJ_BODY, link)
-        if body_id < 0:
-            raise ValueError(f"Link {link} not found in model")
-            
-        # Compute Jacobian
-        jacp = np.zeros((3, self._mujoco_model.nv))
-        jacr = np.zeros((3, self._mujoco_model.nv))
-        
-        mujoco.mj_jacBody(self._mujoco_model, self._mujoco_data, jacp, jacr, body_id)
-        
-        # Combine translational and rotational Jacobians
-        jacobian = np.vstack((jacp, jacr))
-        
-        # Restore original positions
-        self._mujoco_data.qpos[:] = original_qpos
-        mujoco.mj_forward(self._mujoco_model, self._mujoco_data)
+        engine, q = self._synced_kinematics(q)
+        jacobian = engine.jacobians(q, body_ids=engine.link_ids([link]))[0]
         
         return jacobian
     
@@ -31,16 +31,24 @@ class MujocoDepthCamera(MujocoRgbCamera):
 
     def get_depth(self):
         """Get the depth map from the current camera view.
-        
+
+        The depth map is rendered at the camera frequency like get_rgb(), and
+        the RGB image of the same render is cached for get_rgb().
+
         Returns:
             np.ndarray: Depth map as a numpy array, with values representing
                        distance from the camera in meters
         """
-        _, depth = self.render(depth=True, segmentation=False)
+        return self.scheduler.get("depth", self._render_depth)
+
+    def _render_depth(self):
+        rgb, depth = self.render(depth=True, segmentation=False)
         from physics_simulator.utils.camera_utils import get_real_depth_map
 
-        depth = get_real_depth_map(self.simulator, depth)
-        return depth
+        rgb = self._to_rgb(rgb)
+        if rgb is not None:
+            self.scheduler.store("rgb", rgb)
+        return get_real_depth_map(self.simulator, depth)
     
     def get_point_cloud(self) -> np.ndarray:
         """Generate a 3D point cloud from the depth data in world coordinates.
@@ -118,9 +126,7 @@ class MujocoDepthCamera(MujocoRgbCamera):
         from scipy.spatial.transform import Rotation as R
         
         # Get depth map once
-        _, depth_map = self.render(depth=True, segmentation=False)
-        from physics_simulator.utils.camera_utils import get_real_depth_map
-        depth_map = get_real_depth_map(self.simulator, depth_map)
+        depth_map = self.get_depth()
         
         # Downsample for performance if requested
         if downsample_factor > 1:
@@ -0,0 +1,231 @@
+#####################################################################################
+#
+# Description: Buffered IMU for MuJoCo simulation
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import xml.etree.ElementTree as ET
+from typing import NamedTuple, Optional
+
+import mujoco
+import numpy as np
+
+from physics_simulator.simulator import MujocoSimulator as PhysicsSimulator
+from synthnova_config import ImuConfig
+
+
+class ImuSamples(NamedTuple):
+    """Batch of IMU samples in chronological order."""
+
+    time: np.ndarray  # (M,) simulation time of every reading
+    linear_acceleration: np.ndarray  # (M, 3) specific force in the IMU frame, m/s^2
+    angular_velocity: np.ndarray  # (M, 3) angular velocity in the IMU frame, rad/s
+
+
+class MujocoImu:
+    """IMU sampled after every physics step into a ring buffer.
+
+    An ``accelerometer`` and a ``gyro`` MuJoCo sensor are added on a site at
+    the configured pose, so MuJoCo computes the readings during the step. The
+    simulator calls ``on_physics_step()`` after every physics step, which
+    copies the six readings into a preallocated ring buffer once every
+    sampling period. Noise and bias are applied in one vectorized pass over
+    the samples buffered since the previous read, so consumers can drain
+    high-rate data in batches with ``get_samples(since_time)``.
+
+    The buffer holds one second of samples by default; older samples are
+    overwritten. A reset of the simulation time clears the buffer.
+    """
+
+    def __init__(
+        self,
+        simulator: PhysicsSimulator,
+        imu_config: ImuConfig,
+        buffer_size: int = None,
+        seed: int = None,
+    ):
+        """Initialize an IMU in the MuJoCo simulation.
+
+        Args:
+            simulator: The physics simulator instance
+            imu_config: Configuration object for the IMU
+            buffer_size: Number of buffered samples, defaults to one second of samples
+            seed: Seed of the noise model
+
+        Raises:
+            ValueError: If the pose configuration is invalid
+        """
+        from physics_simulator.sensor.sensor_model import MujocoSiteSensorModel
+
+        self.simulator = simulator
+        self.name = imu_config.name
+        self.prim_path = imu_config.prim_path
+        self.parent_entity_name = imu_config.parent_entity_name
+
+        use_global_pose = imu_config.position is not None and imu_config.orientation is not None
+        use_local_pose = imu_config.translation is not None and imu_config.rotation is not None
+        if use_global_pose == use_local_pose:
+            raise ValueError(
+                "Invalid pose input, must be either local(translation, rotation) or global(position, orientation)"
+            )
+
+        # Sampling period in physics steps, every step if no frequency is set
+        sensor_config = imu_config.sensor_config
+        timestep = simulator.config.mujoco_config.timestep
+        self.frequency = sensor_config.frequency or 1.0 / timestep
+        self.period = max(1, int(round(1.0 / (self.frequency * timestep))))
+        if buffer_size is None:
+            buffer_size = max(1, int(round(self.frequency)))
+
+        self.accelerometer_noise_std = sensor_config.accelerometer_noise_std or 0.0
+        self.gyroscope_noise_std = sensor_config.gyroscope_noise_std or 0.0
+        self.accelerometer_bias = np.zeros(3)
+        self.gyroscope_bias = np.zeros(3)
+        if sensor_config.accelerometer_bias is not None:
+            self.accelerometer_bias[:] = sensor_config.accelerometer_bias
+        if sensor_config.gyroscope_bias is not None:
+            self.gyroscope_bias[:] = sensor_config.gyroscope_bias
+        self.rng = np.random.default_rng(seed)
+
+        # Rows of [time, ax, ay, az, wx, wy, wz]
+        self._buffer = np.zeros((buffer_size, 7))
+        self._count = 0
+        self._processed = 0
+        self._step = 0
+        self._sensor_indexes = np.zeros(6, dtype=np.intp)
+
+        self.sensor_model = MujocoSiteSensorModel(
+            name=self.name,
+            parent_entity_name=self.parent_entity_name,
+            position=imu_config.position if use_global_pose else imu_config.translation,
+            orientation=imu_config.orientation if use_global_pose else imu_config.rotation,
+        )
+        self.sensor_model.mount_to_parent(self.simulator.world.worldbody)
+        self.accelerometer_name = f"{self.name}_accelerometer"
+        self.gyroscope_name = f"{self.name}_gyro"
+        sensor_section = self.simulator.world.sensor
+        # Elements of the world <sensor> section, attached to the spec on a runtime add
+        self.sensor_elements = [
+            ET.SubElement(
+                sensor_section, "accelerometer", name=self.accelerometer_name, site=self.sensor_model.site_name
+            ),
+            ET.SubElement(sensor_section, "gyro", name=self.gyroscope_name, site=self.sensor_model.site_name),
+        ]
+
+    def initialize(self, simulator):
+        """Bind the IMU to a simulator and cache the addresses of its readings.
+
+        Args:
+            simulator: Initialized MujocoSimulator holding this IMU
+
+        Raises:
+            ValueError: If the IMU site or sensors are not part of the compiled model
+        """
+        self.sensor_model.initialize(simulator)
+        model = simulator.model._model
+        addresses = []
+        for name in (self.accelerometer_name, self.gyroscope_name):
+            sensor_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_SENSOR, name)
+            if sensor_id < 0:
+                raise ValueError(f"Sensor {name} of IMU {self.name} is not in the compiled model")
+            addresses.append(model.sensor_adr[sensor_id])
+        self._sensor_indexes = np.concatenate([address + np.arange(3) for address in addresses])
+        self._timestep = model.opt.timestep
+
+    @property
+    def buffer_size(self) -> int:
+        return len(self._buffer)
+
+    def clear(self):
+        """Drop every buffered sample and restart the sampling period."""
+        self._count = 0
+        self._processed = 0
+        self._step = 0
+
+    def on_physics_step(self):
+        """Buffer the readings of the step that just completed, once per sampling period."""
+        data = self.simulator.data._data
+        # Sensors are evaluated before the step integrates the time
+        time = data.time - self._timestep
+        if self._count and time < self._buffer[(self._count - 1) % len(self._buffer), 0]:
+            self.clear()
+        step = self._step
+        self._step += 1
+        if step % self.period:
+            return
+        row = self._buffer[self._count % len(self._buffer)]
+        row[0] = time
+        np.take(data.sensordata, self._sensor_indexes, out=row[1:])
+        self._count += 1
+
+    def _rows(self, start: int) -> np.ndarray:
+        """Ring buffer rows of samples start..count-1, clipped to the samples still buffered."""
+        start = max(start, self._count - len(self._buffer))
+        return np.arange(start, self._count) % len(self._buffer)
+
+    def _apply_noise(self):
+        """Add bias and white noise to the samples buffered since the last read."""
+        rows = self._rows(self._processed)
+        self._processed = self._count
+        if len(rows) == 0:
+            return
+        readings = self._buffer[rows, 1:]
+        readings[:, :3] += self.accelerometer_bias
+        readings[:, 3:] += self.gyroscope_bias
+        if self.accelerometer_noise_std > 0:
+            readings[:, :3] += self.rng.normal(0.0, self.accelerometer_noise_std, (len(rows), 3))
+        if self.gyroscope_noise_std > 0:
+            readings[:, 3:] += self.rng.normal(0.0, self.gyroscope_noise_std, (len(rows), 3))
+        self._buffer[rows, 1:] = readings
+
+    def get_samples(self, since_time: Optional[float] = None) -> ImuSamples:
+        """Get the buffered samples, oldest first.
+
+        Args:
+            since_time: Only return samples taken strictly after this time,
+                e.g. the time of the last sample of the previous batch. Defaults
+                to every buffered sample
+
+        Returns:
+            ImuSamples: (time, linear_acceleration, angular_velocity) arrays
+        """
+        with self.simulator.lock:
+            self._apply_noise()
+            samples = self._buffer[self._rows(0)]
+        if since_time is not None:
+            samples = samples[samples[:, 0] > since_time]
+        return ImuSamples(samples[:, 0], samples[:, 1:4], samples[:, 4:7])
+
+    def get_data(self) -> Optional[dict]:
+        """Get the latest sample.
+
+        Returns:
+            dict: time, linear_acceleration and angular_velocity, None before the first sample
+        """
+        if self._count == 0:
+            return None
+        with self.simulator.lock:
+            self._apply_noise()
+            sample = self._buffer[(self._count - 1) % len(self._buffer)].copy()
+        return {
+            "time": sample[0],
+            "linear_acceleration": sample[1:4],
+            "angular_velocity": sample[4:7],
+        }
+
+    def get_position(self) -> np.ndarray:
+        """Get the position of the IMU in world frame.
+
+        Returns:
+            np.ndarray: 3D position [x, y, z]
+        """
+        return self.sensor_model.get_position()
+
+    def get_orientation(self) -> np.ndarray:
+        """Get the orientation of the IMU in world frame.
+
+        Returns:
+            np.ndarray: Quaternion in xyzw format
+        """
+        return self.sensor_model.get_orientation()
@@ -271,6 +271,11 @@ class MujocoRgbCamera:
             "frequency": self.frequency,
         }
 
+        from physics_simulator.sensor.scheduler import SensorScheduler
+
+        # Frames are rendered at the camera frequency and shared between readers
+        self.scheduler = SensorScheduler(self.simulator, self.frequency)
+
     def rotation_matrix_to_quaternion(self, R):
         """Convert a 3x3 rotation matrix to a quaternion.
         
@@ -338,12 +343,19 @@ class MujocoRgbCamera:
 
     def get_rgb(self):
         """Get the latest RGB image data (alias for get_data).
-        
+
+        A new image is rendered once per camera period in simulation time
+        (see SensorScheduler), calls in between return the cached image.
+
         Returns:
             np.ndarray: RGB image as a numpy array
         """
-        rgb = self.render(depth=False, segmentation=False)
-        data = rgb
+        return self.scheduler.get("rgb", self._render_rgb)
+
+    def _render_rgb(self):
+        return self._to_rgb(self.render(depth=False, segmentation=False))
+
+    def _to_rgb(self, data):
         # Check if data is valid
         if data is None or data.size == 0:
             return None
@@ -366,11 +378,13 @@ class MujocoRgbCamera:
 
     def get_segmentation(self):
         """Get the segmentation mask for the current view.
-        
+
+        The mask is rendered at the camera frequency like get_rgb().
+
         Returns:
             np.ndarray: Segmentation mask as a numpy array
         """
-        segmentation = self.render(depth=False, segmentation=True)
+        segmentation = self.scheduler.get("segmentation", self._render_segmentation)
         if segmentation is None:
             self.logger.log_warning(
                 f"[get_segmentation][{self.prim_path}] WARNING: Annotator 'instance_segmentation' contains no data. Returning None"
@@ -379,6 +393,20 @@ class MujocoRgbCamera:
 
         return segmentation
 
+    def _render_segmentation(self):
+        return self.render(depth=False, segmentation=True)
+
+    def get_frame_time(self, frame: str = "rgb"):
+        """Get the simulation time of the latest frame of a kind.
+
+        Args:
+            frame: Frame kind, "rgb", "segmentation" or "depth"
+
+        Returns:
+            float: Time in seconds, None if no frame was rendered yet
+        """
+        return self.scheduler.get_time(frame)
+
     def get_world_pose(self, camera_axes="world"):
         """Get the camera's pose in world coordinates.
         
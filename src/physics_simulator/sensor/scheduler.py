@@ -0,0 +1,121 @@
+#####################################################################################
+#
+# Description: Frequency-aware frame scheduling and caching for sensors
+# Date: 2026-10-18
+#
+#####################################################################################
+
+from typing import Any, Callable, Hashable, Optional
+
+import numpy as np
+
+
+class SensorScheduler:
+    """Renders sensor frames at the sensor frequency in simulation time.
+
+    Every frame kind of a sensor (e.g. "rgb", "depth", "segmentation") is
+    cached with the simulation time it was rendered at. ``get()`` returns the
+    cached frame until one sensor period has elapsed since it was rendered,
+    so repeated reads within a step, or from several consumers, cost a single
+    render. Without a frequency a frame is rendered at most once per physics
+    step. A reset of the simulation time renders a new frame.
+
+    Frames are also keyed on the scene version of the simulator, which
+    ``forward()``, ``reset()``, ``restore_state()``, ``set_objects_pose()``
+    and the other state writers bump, so changing the scene without stepping
+    renders a new frame as well. Cached arrays are handed out as read-only
+    views shared by every reader, copy them before drawing on them.
+    """
+
+    def __init__(self, simulator, frequency: Optional[float] = None):
+        """Initialize the scheduler.
+
+        Args:
+            simulator: MujocoSimulator whose simulation time drives the schedule
+            frequency: Sensor frequency in Hz, None renders once per physics step
+        """
+        self.simulator = simulator
+        self.frequency = frequency
+        self._frames = {}
+
+    @property
+    def period(self) -> float:
+        """Simulated seconds between two renders, 0 without a frequency."""
+        return 1.0 / self.frequency if self.frequency else 0.0
+
+    def is_due(self, key: Hashable) -> bool:
+        """Check whether a frame kind must be rendered again.
+
+        Args:
+            key: Frame kind
+
+        Returns:
+            bool: True if no frame is cached, the scene changed without
+                stepping, the simulation time went back or a sensor period
+                has elapsed since the cached frame
+        """
+        if key not in self._frames:
+            return True
+        frame_time, scene_version, _ = self._frames[key]
+        if scene_version != self.simulator._scene_version:
+            return True
+        time = self.simulator.data._data.time
+        timestep = self.simulator.model._model.opt.timestep
+        # Half a step of tolerance absorbs the float drift of the simulation time
+        return time < frame_time or time - frame_time >= max(self.period, timestep) - 0.5 * timestep
+
+    def get(self, key: Hashable, render: Callable[[], Any]) -> Any:
+        """Get the latest frame of a kind, rendering it only when due.
+
+        Args:
+            key: Frame kind
+            render: Function rendering a new frame, None results are not cached
+
+        Returns:
+            Any: The cached or newly rendered frame
+        """
+        with self.simulator.lock:
+            if self.is_due(key):
+                frame = render()
+                if frame is None:
+                    return None
+                self.store(key, frame)
+            return self._frames[key][2]
+
+    def store(self, key: Hashable, frame: Any, time: Optional[float] = None):
+        """Cache a frame rendered as a by-product of another one.
+
+        Args:
+            key: Frame kind
+            frame: Frame data, arrays are cached as read-only views
+            time: Simulation time of the frame, defaults to the current time
+        """
+        if time is None:
+            time = self.simulator.data._data.time
+        if isinstance(frame, np.ndarray):
+            frame = frame.view()
+            frame.setflags(write=False)
+        self._frames[key] = (time, self.simulator._scene_version, frame)
+
+    def get_time(self, key: Hashable) -> Optional[float]:
+        """Get the simulation time of the cached frame of a kind.
+
+        Args:
+            key: Frame kind
+
+        Returns:
+            float: Time in seconds, None if no frame is cached
+        """
+        entry = self._frames.get(key)
+        return None if entry is None else entry[0]
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop cached frames so the next read renders.
+
+        Args:
+            key: Frame kind to drop, defaults to every kind
+        """
+        if key is None:
+            self._frames.clear()
+        else:
+            self._frames.pop(key, None)
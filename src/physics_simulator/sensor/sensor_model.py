@@ -44,8 +44,6 @@ from physics_simulator.utils.mjcf_utils import (
 import numpy as np
 import xml.etree.ElementTree as ET
 from physics_simulator.object import MujocoObject
-import gc
-from physics_simulator.simulator import MujocoSimulator as PhysicsSimulator
 
 
 class MujocoSensorModel(MujocoObject):
@@ -73,6 +71,7 @@ class MujocoSensorModel(MujocoObject):
             height (int, optional): Image height in pixels. Defaults to None.
         """
         super().__init__(obj_type="visual")  # Camera is purely visual
+        self._camera_id = -1
         self._name = name
         self.camera_name = camera_name if camera_name is not None else name
         self.parent_entity_name = parent_entity_name
@@ -222,68 +221,163 @@ class MujocoSensorModel(MujocoObject):
         # xml quat assumes w,x,y,z so we need to convert to this format from outputted x,y,z,w format from fcn
         self.orientation = xyzw_to_wxyz(rot)
         
+    def initialize(self, simulator):
+        """Bind the sensor model to a simulator and cache the id of its camera.
+
+        Args:
+            simulator: Initialized MujocoSimulator holding this sensor
+
+        Raises:
+            ValueError: If the camera is not part of the compiled model
+        """
+        camera_id = mujoco.mj_name2id(
+            simulator.model._model, mujoco.mjtObj.mjOBJ_CAMERA, self.camera_name
+        )
+        if camera_id < 0:
+            raise ValueError(f"Camera {self.camera_name} of sensor {self._name} is not in the compiled model")
+        self._simulator = simulator
+        self._camera_id = camera_id
+
     def get_position(self):
         """Get the position of the object in world frame.
         
         Returns:
-            np.ndarray: 3D position [x, y, z]
+            np.ndarray: 3D position [x, y, z], the stored position if the
+                sensor is not in a running simulation
         """
-        # Get the camera position from MuJoCo if simulation is running
-        # First check if the simulator and data are available
-        sim = None
-        
-        # Try to get simulator reference
-        try:
-            for obj in gc.get_objects():
-                if isinstance(obj, PhysicsSimulator):
-                    if hasattr(obj, 'data') and obj.data is not None:
-                        sim = obj
-                        break
-        except:
-            pass
-        
-        if sim is not None and sim.data is not None:
-            try:
-                # Try to get camera position from MuJoCo data
-                return sim.data.get_camera_xpos(self.camera_name)
-            except:
-                # Fall back to stored position if that fails
-                return self.position
-        else:
-            # Return stored position if simulator is not running
+        sim = self._simulator
+        if sim is None or sim.data is None or self._camera_id < 0:
             return self.position
+        return sim.data._data.cam_xpos[self._camera_id].copy()
         
     def get_orientation(self):
         """Get the orientation of the object in world frame.
         
         Returns:
-            np.ndarray: Quaternion in xyzw format
+            np.ndarray: Quaternion in xyzw format, the stored orientation if
+                the sensor is not in a running simulation
         """
-        # Get the camera orientation from MuJoCo if simulation is running
-        # First check if the simulator and data are available
-        sim = None
-        
-        # Try to get simulator reference
-        try:
-            for obj in gc.get_objects():
-                if isinstance(obj, PhysicsSimulator):
-                    if hasattr(obj, 'data') and obj.data is not None:
-                        sim = obj
-                        break
-        except:
-            pass
-        
-        if sim is not None and sim.data is not None:
-            try:
-                # Get rotation matrix
-                rot_mat = sim.data.get_camera_xmat(self.camera_name)
-                # Convert to quaternion (xyzw)
-                from scipy.spatial.transform import Rotation as R
-                quat = R.from_matrix(rot_mat).as_quat()  # Returns xyzw format
-                return quat
-            except:
-                # Fall back to stored orientation if that fails
-                return wxyz_to_xyzw(self.orientation) if self.orientation is not None else np.array([0.0, 0.0, 0.0, 1.0])
-        else:
-            # Return stored orientation if simulator is not running
+        sim = self._simulator
+        if sim is None or sim.data is None or self._camera_id < 0:
             return wxyz_to_xyzw(self.orientation) if self.orientation is not None else np.array([0.0, 0.0, 0.0, 1.0])
+        quat_wxyz = np.empty(4)
+        mujoco.mju_mat2Quat(quat_wxyz, sim.data._data.cam_xmat[self._camera_id])
+        return wxyz_to_xyzw(quat_wxyz)
+
+
+class MujocoSiteSensorModel:
+    """Site a ray or inertial sensor is attached to, mounted on a parent body or the world.
+
+    The sensor frame is the frame of the site: the model adds a body holding
+    the site to the parent body, and reads the site pose from the simulation
+    data once bound to a simulator.
+    """
+
+    def __init__(self, name: str, parent_entity_name: str = None, position: np.ndarray = None, orientation: np.ndarray = None):
+        """
+        Initialize a site sensor model.
+
+        Args:
+            name (str): Name of the sensor, the site is named after it
+            parent_entity_name (str, optional): Name of the parent body, the world if None. Defaults to None.
+            position (np.ndarray, optional): Position relative to the parent. Defaults to the origin.
+            orientation (np.ndarray, optional): Orientation relative to the parent (xyzw quaternion). Defaults to identity.
+        """
+        self.name = name
+        self.site_name = f"{name}_site"
+        self.parent_entity_name = parent_entity_name
+        self.position = np.zeros(3) if position is None else np.asarray(position, dtype=np.float64)
+        self.orientation = (
+            np.array([0.0, 0.0, 0.0, 1.0]) if orientation is None else np.asarray(orientation, dtype=np.float64)
+        )
+        self._simulator = None
+        self._site_id = -1
+
+        self._obj = new_body(
+            name=f"{name}_main", pos=self.position, quat=xyzw_to_wxyz(self.orientation)
+        )
+        self._obj.append(new_site(name=self.site_name, rgba=(0, 0, 0, 0)))
+
+    def mount_to_parent(self, worldbody):
+        """
+        Add the sensor body to its parent body, or to the worldbody if there is no parent.
+
+        Args:
+            worldbody: The worldbody element of the MuJoCo XML model
+
+        Raises:
+            ValueError: If the parent body does not exist
+        """
+        if self.parent_entity_name is None:
+            worldbody.append(self._obj)
+            return
+        parent_body = find_elements(
+            root=worldbody,
+            tags="body",
+            attribs={"name": self.parent_entity_name},
+            return_first=True
+        )
+        if parent_body is None:
+            raise ValueError(f"Parent body (link) {self.parent_entity_name} not found in the worldbody")
+        parent_body.append(self._obj)
+
+    def get_obj(self):
+        """Get the sensor body element holding the site.
+
+        Returns:
+            ET.Element: The sensor body
+        """
+        return self._obj
+
+    def initialize(self, simulator):
+        """Bind the sensor model to a simulator and cache the id of its site.
+
+        Args:
+            simulator: Initialized MujocoSimulator holding this sensor
+
+        Raises:
+            ValueError: If the site is not part of the compiled model
+        """
+        site_id = mujoco.mj_name2id(
+            simulator.model._model, mujoco.mjtObj.mjOBJ_SITE, self.site_name
+        )
+        if site_id < 0:
+            raise ValueError(f"Site {self.site_name} of sensor {self.name} is not in the compiled model")
+        self._simulator = simulator
+        self._site_id = site_id
+
+    @property
+    def site_id(self) -> int:
+        return self._site_id
+
+    @property
+    def parent_body_id(self) -> int:
+        """Id of the body the sensor is mounted on, 0 for the world."""
+        model = self._simulator.model._model
+        return int(model.body_parentid[model.site_bodyid[self._site_id]])
+
+    def get_position(self):
+        """Get the position of the sensor in world frame.
+
+        Returns:
+            np.ndarray: 3D position [x, y, z]
+        """
+        return self._simulator.data._data.site_xpos[self._site_id].copy()
+
+    def get_rotation_matrix(self):
+        """Get the orientation of the sensor in world frame.
+
+        Returns:
+            np.ndarray: 3x3 rotation matrix from the sensor frame to the world frame
+        """
+        return self._simulator.data._data.site_xmat[self._site_id].reshape(3, 3).copy()
+
+    def get_orientation(self):
+        """Get the orientation of the sensor in world frame.
+
+        Returns:
+            np.ndarray: Quaternion in xyzw format
+        """
+        quat_wxyz = np.empty(4)
+        mujoco.mju_mat2Quat(quat_wxyz, self._simulator.data._data.site_xmat[self._site_id])
+        return wxyz_to_xyzw(quat_wxyz)
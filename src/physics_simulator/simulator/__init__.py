@@ -1,3 +1,34 @@
-from .mujoco import *
+import importlib
 
-from .base_sim import *
+# Public names resolved lazily on first access (PEP 562), importing the
+# package does not load mujoco or the configuration models
+_LAZY_ATTRIBUTES = {
+    "MujocoSimulator": ".mujoco",
+    "BaseSim": ".base_sim",
+    "VectorizedMujocoSimulator": ".vectorized",
+    "MujocoEnvFarm": ".env_farm",
+    "RealTimeScheduler": ".scheduler",
+    "PhysicsCallback": ".callbacks",
+    "AsyncMujocoSimulator": ".async_simulator",
+    "TrajectoryRecorder": ".recorder",
+    "TrajectoryReader": ".recorder",
+    "KinematicReplay": ".replay",
+    "StateSchema": ".state_schema",
+    "DomainRandomizer": ".domain_randomizer",
+    "SceneQuery": ".scene_query",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,281 @@
+#####################################################################################
+#
+# Description: asyncio front-end running a MujocoSimulator on executor threads
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence
+
+
+class AsyncSensor:
+    """Awaitable view of a sensor, every method call runs on the render thread.
+
+    ``await camera.get_rgb()`` calls ``get_rgb()`` of the wrapped sensor on the
+    render executor. Non-callable attributes are returned as is.
+    """
+
+    def __init__(self, sensor, run_render: Callable):
+        self.sensor = sensor
+        self._run_render = run_render
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.sensor, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+            return await self._run_render(attribute, *args, **kwargs)
+
+        return call
+
+
+class AsyncMujocoSimulator:
+    """asyncio facade of a MujocoSimulator.
+
+    Physics runs on a dedicated physics thread and rendering on a dedicated
+    render thread, so coroutines never block the event loop, and several
+    simulators and network clients can be driven from one process
+    (``mj_step`` and rendering release the GIL). The simulator lock keeps
+    stepping and rendering from overlapping on the same data.
+
+    GL contexts are bound to the thread that created them, so call
+    ``initialize()`` on this facade to create the render context on the render
+    thread, and apply runtime scene edits (``add_robot``, ``add_object``...) on
+    it with ``run_in_render_thread()``.
+
+    Cancelling ``step()`` stops the physics thread after its current step, and
+    ``stream()`` only runs ahead of its consumer by ``max_pending`` frames.
+    """
+
+    def __init__(self, simulator):
+        """Initialize the facade.
+
+        Args:
+            simulator: MujocoSimulator to drive, initialized or not
+        """
+        self.simulator = simulator
+        self._physics_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="physics"
+        )
+        self._render_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="render"
+        )
+        self._sensors = {}
+
+    async def __aenter__(self):
+        if not self.simulator.is_running():
+            await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.close()
+
+    async def run_in_physics_thread(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking function on the physics thread.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments of fn
+            **kwargs: Keyword arguments of fn
+
+        Returns:
+            The return value of fn
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._physics_executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def run_in_render_thread(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run a blocking function on the render thread.
+
+        Args:
+            fn: Function to call
+            *args: Positional arguments of fn
+            **kwargs: Keyword arguments of fn
+
+        Returns:
+            The return value of fn
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._render_executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def initialize(self):
+        """Initialize the simulator on the render thread, which owns the GL context."""
+        await self.run_in_render_thread(self.simulator.initialize)
+
+    def _run_steps(self, num_steps: int, cancelled: threading.Event) -> int:
+        simulator = self.simulator
+        done = 0
+        while done < num_steps and not cancelled.is_set() and simulator.is_running():
+            simulator._physics_step()
+            done += 1
+        if done and simulator.is_running():
+            simulator._sync_viewer()
+        return done
+
+    async def step(self, num_steps: int = 1) -> int:
+        """Advance the simulation on the physics thread.
+
+        Physics callbacks are dispatched as in ``loop()``. If the awaiting task
+        is cancelled, the physics thread stops after its current step and the
+        cancellation is raised once it has.
+
+        Args:
+            num_steps: Number of physics steps
+
+        Returns:
+            int: Number of steps taken, fewer if the simulator was closed
+
+        Raises:
+            RuntimeError: If the simulator is not running
+        """
+        if not self.simulator.is_running():
+            raise RuntimeError("Simulator is not running, please call initialize() first")
+
+        cancelled = threading.Event()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._physics_executor, self._run_steps, num_steps, cancelled
+        )
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            cancelled.set()
+            # Never hand control back while the physics thread is mid-step
+            await asyncio.wait({future})
+            raise
+
+    async def render(self, **kwargs):
+        """Render on the render thread, see MujocoSimulator.render().
+
+        Args:
+            **kwargs: Arguments of MujocoSimulator.render()
+
+        Returns:
+            numpy.ndarray: The rendered image
+        """
+        return await self.run_in_render_thread(self.simulator.render, **kwargs)
+
+    def get_sensor(self, prim_path: str) -> AsyncSensor:
+        """Get an awaitable view of a sensor.
+
+        Args:
+            prim_path: Path of the sensor
+
+        Returns:
+            AsyncSensor: Sensor whose methods are coroutines running on the render thread
+
+        Raises:
+            KeyError: If the sensor does not exist
+        """
+        sensor = self.simulator.get_sensor(prim_path)
+        cached = self._sensors.get(prim_path)
+        if cached is None or cached.sensor is not sensor:
+            cached = self._sensors[prim_path] = AsyncSensor(
+                sensor, self.run_in_render_thread
+            )
+        return cached
+
+    def _capture(self, prim_paths: Sequence[str], method: str) -> Dict[str, Any]:
+        simulator = self.simulator
+        with simulator.lock:
+            frame = {"time": simulator.data.time}
+            for prim_path in prim_paths:
+                frame[prim_path] = getattr(simulator.get_sensor(prim_path), method)()
+        return frame
+
+    async def stream(
+        self,
+        prim_paths: Sequence[str],
+        steps_per_frame: int = 1,
+        num_frames: Optional[int] = None,
+        method: str = "get_data",
+        max_pending: int = 2,
+        drop_oldest: bool = False,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Step the simulation and yield sensor frames as they are captured.
+
+        A producer task steps ``steps_per_frame`` physics steps, captures all
+        sensors on the render thread and queues the frame. With a full queue
+        the producer waits for the consumer (backpressure), or discards the
+        oldest frame if ``drop_oldest`` is set so the simulation keeps running.
+        Leaving the ``async for`` loop cancels the producer.
+
+        Args:
+            prim_paths: Sensors captured in every frame
+            steps_per_frame: Physics steps between two frames
+            num_frames: Number of frames to yield, None streams until the simulator is closed
+            method: Sensor method called for every frame, e.g. "get_rgb" or "get_depth"
+            max_pending: Maximum number of frames waiting for the consumer
+            drop_oldest: Whether to drop frames instead of pausing the simulation
+
+        Yields:
+            dict: ``time`` of the capture and the result of ``method`` per prim path
+
+        Raises:
+            ValueError: If steps_per_frame or max_pending is not positive
+        """
+        if steps_per_frame < 1:
+            raise ValueError(f"steps_per_frame must be positive, got {steps_per_frame}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be positive, got {max_pending}")
+
+        prim_paths = list(prim_paths)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        done = object()
+
+        async def produce():
+            produced = 0
+            try:
+                while num_frames is None or produced < num_frames:
+                    if await self.step(steps_per_frame) < steps_per_frame:
+                        break
+                    frame = await self.run_in_render_thread(
+                        self._capture, prim_paths, method
+                    )
+                    if drop_oldest and queue.full():
+                        queue.get_nowait()
+                    await queue.put(frame)
+                    produced += 1
+            finally:
+                if not queue.full():
+                    queue.put_nowait(done)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                if producer.done() and queue.empty():
+                    break
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    # Producer finished or failed without queueing anything more
+                    getter.cancel()
+                    continue
+                frame = getter.result()
+                if frame is done:
+                    break
+                yield frame
+            # Re-raise producer failures
+            if producer.done() and not producer.cancelled():
+                producer.result()
+        finally:
+            if not producer.done():
+                producer.cancel()
+                await asyncio.wait({producer})
+
+    async def close(self):
+        """Close the simulator and shut the executor threads down."""
+        if self.simulator.is_running():
+            await self.run_in_render_thread(self.simulator.close)
+        self._physics_executor.shutdown(wait=True)
+        self._render_executor.shutdown(wait=True)
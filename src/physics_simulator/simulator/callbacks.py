@@ -0,0 +1,95 @@
+#####################################################################################
+#
+# Description: Rate-divided, prioritized physics callbacks with timing statistics
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import time
+from typing import Callable
+
+# Phases of a physics step a callback can run in
+PRE_STEP = "pre_step"
+POST_STEP = "post_step"
+CALLBACK_PHASES = (PRE_STEP, POST_STEP)
+
+
+class PhysicsCallback:
+    """A physics callback with its rate, priority, phase and timing statistics.
+
+    ``pre_step`` callbacks run between ``mj_step1`` and ``mj_step2``, after
+    positions and velocities dependent quantities are computed and before
+    controls are integrated, which is where controllers write ``ctrl``.
+    ``post_step`` callbacks run after the step has completed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        callback_fn: Callable[[], None],
+        period: int = 1,
+        priority: int = 0,
+        phase: str = POST_STEP,
+        order: int = 0,
+    ):
+        """Initialize the callback.
+
+        Args:
+            name: Unique name of the callback
+            callback_fn: Function called without arguments
+            period: Run every `period` physics steps
+            priority: Callbacks with lower values run first within a phase
+            phase: "pre_step" or "post_step"
+            order: Registration index, breaks ties between equal priorities
+
+        Raises:
+            ValueError: If period is not positive or phase is unknown
+        """
+        if period < 1:
+            raise ValueError(f"Callback period must be at least one step, got {period}")
+        if phase not in CALLBACK_PHASES:
+            raise ValueError(f"Unknown callback phase '{phase}', expected one of {CALLBACK_PHASES}")
+
+        self.name = name
+        self.callback_fn = callback_fn
+        self.period = int(period)
+        self.priority = priority
+        self.phase = phase
+        self.order = order
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def sort_key(self):
+        return self.priority, self.order
+
+    def is_due(self, step_index: int) -> bool:
+        """Whether the callback runs at the given physics step index."""
+        return step_index % self.period == 0
+
+    def __call__(self):
+        start = time.perf_counter()
+        try:
+            return self.callback_fn()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.calls += 1
+            self.total_time += elapsed
+            self.max_time = max(self.max_time, elapsed)
+
+    def get_stats(self) -> dict:
+        """Get the configuration and execution time statistics of the callback.
+
+        Returns:
+            dict: period, priority, phase, calls, and total/mean/max time in seconds
+        """
+        return {
+            "period": self.period,
+            "priority": self.priority,
+            "phase": self.phase,
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+            "max_time": self.max_time,
+        }
@@ -0,0 +1,389 @@
+#####################################################################################
+#
+# Description: Process-based farm of headless MuJoCo simulators with shared-memory buffers
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import multiprocessing as mp
+import os
+import threading
+import time
+import traceback
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import wait
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from synthnova_config import PhysicsSimulatorConfig, ScenarioConfig
+
+# Worker commands, written by the master into the shared command array
+CMD_IDLE = 0
+CMD_STEP = 1
+CMD_RESET = 2
+CMD_CLOSE = 3
+
+# Seconds the master waits for the error message of a worker that aborted a round
+_ERROR_TIMEOUT = 5.0
+
+
+def _posix_shm_name(name: str) -> str:
+    """Name of a shared memory block as passed to shm_open, with its leading slash."""
+    return name if name.startswith("/") else "/" + name
+
+
+class _SharedArray:
+    """NumPy array backed by a named ``multiprocessing.shared_memory`` block."""
+
+    def __init__(self, shape, dtype, name: str = None):
+        dtype = np.dtype(dtype)
+        nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=nbytes)
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        if self.owner:
+            self.array.fill(0)
+        elif os.name == "posix":
+            # Only the creating process may unlink the block. The resource tracker
+            # registers POSIX blocks under their "/"-prefixed name, .name strips it
+            resource_tracker.unregister(_posix_shm_name(self.shm.name), "shared_memory")
+
+    @property
+    def spec(self):
+        """Picklable description used by workers to attach to the block."""
+        return self.shm.name, self.array.shape, self.array.dtype.str
+
+    def close(self):
+        # Drop the view before closing, the buffer cannot be released otherwise
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _env_worker(
+    worker_id: int,
+    physics_simulator_config: PhysicsSimulatorConfig,
+    camera_prim_paths: List[str],
+    conn,
+    barrier,
+):
+    """Entry point of a farm worker process.
+
+    Builds a headless simulator, reports its dimensions to the master, attaches
+    to the shared buffers and then serves lockstep commands until CMD_CLOSE.
+    """
+    from physics_simulator.simulator import MujocoSimulator
+
+    buffers = {}
+    simulator = None
+    try:
+        simulator = MujocoSimulator(physics_simulator_config)
+        simulator.initialize()
+        mujoco_data = simulator.data._data
+        cameras = [simulator.get_sensor(prim_path) for prim_path in camera_prim_paths]
+
+        conn.send(
+            {
+                "nq": simulator.model.nq,
+                "nv": simulator.model.nv,
+                "nu": simulator.model.nu,
+                "nsensordata": simulator.model.nsensordata,
+                "cameras": [(camera.height, camera.width) for camera in cameras],
+            }
+        )
+        specs = conn.recv()
+        buffers = {
+            key: _SharedArray(shape, dtype, name=name)
+            for key, (name, shape, dtype) in specs.items()
+        }
+        conn.send("ready")
+
+        commands = buffers["commands"].array
+        while True:
+            barrier.wait()
+            command = int(commands[worker_id])
+            if command == CMD_CLOSE:
+                barrier.wait()
+                break
+
+            start = time.perf_counter()
+            if command == CMD_STEP:
+                mujoco_data.ctrl[:] = buffers["actions"].array[worker_id]
+                simulator.step(int(buffers["num_steps"].array[0]))
+            elif command == CMD_RESET:
+                simulator.reset()
+
+            if command != CMD_IDLE:
+                buffers["qpos"].array[worker_id] = mujoco_data.qpos
+                buffers["qvel"].array[worker_id] = mujoco_data.qvel
+                buffers["sensordata"].array[worker_id] = mujoco_data.sensordata
+                buffers["time"].array[worker_id] = mujoco_data.time
+                for camera_index, camera in enumerate(cameras):
+                    buffers[f"camera_{camera_index}"].array[worker_id] = camera.get_rgb()
+                buffers["latency"].array[worker_id] = time.perf_counter() - start
+            barrier.wait()
+    except Exception:
+        traceback.print_exc()
+        barrier.abort()
+        try:
+            conn.send({"error": traceback.format_exc()})
+        except OSError:
+            pass
+    finally:
+        for buffer in buffers.values():
+            buffer.close()
+        if simulator is not None and simulator.is_running():
+            simulator.close()
+        conn.close()
+
+
+class MujocoEnvFarm:
+    """Farm of K headless ``MujocoSimulator`` worker processes.
+
+    Every worker builds its own simulator from the same configuration, so
+    rendering and Python-side work scale across cores. Actions and observations
+    are exchanged through ``multiprocessing.shared_memory`` arrays with a
+    leading worker dimension, no per-step pickling takes place. All workers are
+    stepped in lockstep through a barrier.
+
+    Observations exposed after each ``step()``/``reset()``:
+        - ``qpos`` (K, nq), ``qvel`` (K, nv), ``sensordata`` (K, nsensordata), ``time`` (K,)
+        - ``camera_rgb[prim_path]`` (K, H, W, 3) for each requested camera
+    """
+
+    def __init__(
+        self,
+        physics_simulator_config: PhysicsSimulatorConfig,
+        num_workers: int,
+        scenario_config: Optional[ScenarioConfig] = None,
+        camera_prim_paths: Optional[Sequence[str]] = None,
+        start_method: str = "spawn",
+        timeout: Optional[float] = 300.0,
+    ):
+        """Spawn the workers and allocate the shared buffers.
+
+        Args:
+            physics_simulator_config: Configuration used by every worker, forced to headless
+            num_workers: Number of worker processes
+            scenario_config: Optional scenario overriding the one in the config
+            camera_prim_paths: Prim paths of RGB cameras whose frames are shared
+            start_method: Multiprocessing start method ("spawn", "forkserver" or "fork")
+            timeout: Seconds to wait for workers on each lockstep round, None waits forever
+
+        Raises:
+            ValueError: If num_workers is not positive
+            RuntimeError: If a worker fails to start or workers disagree on model sizes
+        """
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be positive, got {num_workers}")
+
+        config = physics_simulator_config.model_copy(deep=True)
+        config.mujoco_config.headless = True
+        if scenario_config is not None:
+            config.scenario_config = scenario_config
+
+        self.num_workers = num_workers
+        self.timeout = timeout
+        self.camera_prim_paths = list(camera_prim_paths or [])
+        self._buffers: Dict[str, _SharedArray] = {}
+        self._processes = []
+        self._conns = []
+        self._closed = False
+        self._latency_sum = np.zeros(num_workers)
+        self._latency_max = np.zeros(num_workers)
+        self._latency_count = np.zeros(num_workers, dtype=np.int64)
+
+        context = mp.get_context(start_method)
+        self._barrier = context.Barrier(num_workers + 1)
+        try:
+            for worker_id in range(num_workers):
+                parent_conn, child_conn = context.Pipe()
+                process = context.Process(
+                    target=_env_worker,
+                    args=(worker_id, config, self.camera_prim_paths, child_conn, self._barrier),
+                    name=f"mujoco_env_{worker_id}",
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                self._processes.append(process)
+                self._conns.append(parent_conn)
+
+            dims = [self._recv(conn) for conn in self._conns]
+            if any(dim != dims[0] for dim in dims):
+                raise RuntimeError(f"Workers built models of different sizes: {dims}")
+            self.dims = dims[0]
+            self._allocate_buffers()
+
+            specs = {key: buffer.spec for key, buffer in self._buffers.items()}
+            for conn in self._conns:
+                conn.send(specs)
+            for conn in self._conns:
+                self._recv(conn)
+        except Exception:
+            self.close()
+            raise
+
+    def _recv(self, conn):
+        if self.timeout is not None and not conn.poll(self.timeout):
+            raise RuntimeError("Timed out waiting for environment worker")
+        message = conn.recv()
+        if isinstance(message, dict) and "error" in message:
+            raise RuntimeError(f"Environment worker failed:\n{message['error']}")
+        return message
+
+    def _worker_errors(self) -> str:
+        """Collect the error messages of workers that aborted the lockstep barrier."""
+        errors = []
+        for conn in wait(self._conns, timeout=_ERROR_TIMEOUT):
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                continue
+            if isinstance(message, dict) and "error" in message:
+                worker_id = self._conns.index(conn)
+                errors.append(f"Environment worker {worker_id} failed:\n{message['error']}")
+        if not errors:
+            return "Environment workers did not complete the lockstep round (timeout or exit)"
+        return "\n".join(errors)
+
+    def _allocate_buffers(self):
+        k = self.num_workers
+        shapes = {
+            "commands": ((k,), np.int32),
+            "num_steps": ((1,), np.int64),
+            "actions": ((k, self.dims["nu"]), np.float64),
+            "qpos": ((k, self.dims["nq"]), np.float64),
+            "qvel": ((k, self.dims["nv"]), np.float64),
+            "sensordata": ((k, self.dims["nsensordata"]), np.float64),
+            "time": ((k,), np.float64),
+            "latency": ((k,), np.float64),
+        }
+        for camera_index, (height, width) in enumerate(self.dims["cameras"]):
+            shapes[f"camera_{camera_index}"] = ((k, height, width, 3), np.uint8)
+        for key, (shape, dtype) in shapes.items():
+            self._buffers[key] = _SharedArray(shape, dtype)
+
+    def _run(self, commands: np.ndarray):
+        """Run one lockstep round with the given per-worker commands."""
+        if self._closed:
+            raise RuntimeError("Environment farm is closed")
+        self._buffers["commands"].array[:] = commands
+        try:
+            self._barrier.wait(self.timeout)
+            self._barrier.wait(self.timeout)
+        except threading.BrokenBarrierError as e:
+            raise RuntimeError(self._worker_errors()) from e
+
+        active = (commands == CMD_STEP) | (commands == CMD_RESET)
+        latency = self._buffers["latency"].array
+        self._latency_sum[active] += latency[active]
+        self._latency_count[active] += 1
+        self._latency_max[active] = np.maximum(self._latency_max[active], latency[active])
+
+    @property
+    def actions(self) -> np.ndarray:
+        """Shared (K, nu) control buffer, written into worker ctrl on the next step."""
+        return self._buffers["actions"].array
+
+    @property
+    def qpos(self) -> np.ndarray:
+        """Shared (K, nq) joint positions after the last round."""
+        return self._buffers["qpos"].array
+
+    @property
+    def qvel(self) -> np.ndarray:
+        """Shared (K, nv) joint velocities after the last round."""
+        return self._buffers["qvel"].array
+
+    @property
+    def sensordata(self) -> np.ndarray:
+        """Shared (K, nsensordata) sensor readings after the last round."""
+        return self._buffers["sensordata"].array
+
+    @property
+    def time(self) -> np.ndarray:
+        """Shared (K,) simulation times after the last round."""
+        return self._buffers["time"].array
+
+    @property
+    def camera_rgb(self) -> Dict[str, np.ndarray]:
+        """Shared (K, H, W, 3) RGB frames keyed by camera prim path."""
+        return {
+            prim_path: self._buffers[f"camera_{camera_index}"].array
+            for camera_index, prim_path in enumerate(self.camera_prim_paths)
+        }
+
+    def step(self, actions: Optional[np.ndarray] = None, num_steps: int = 1):
+        """Step every worker in lockstep.
+
+        Args:
+            actions: Optional (K, nu) controls copied into the shared action buffer
+            num_steps: Number of physics steps each worker advances
+
+        Raises:
+            RuntimeError: If a worker fails or times out, with the worker traceback
+        """
+        if actions is not None:
+            self.actions[:] = actions
+        self._buffers["num_steps"].array[0] = num_steps
+        self._run(np.full(self.num_workers, CMD_STEP, dtype=np.int32))
+
+    def reset(self, worker_ids: Optional[Sequence[int]] = None):
+        """Reset the selected workers, the others stay idle for this round.
+
+        Args:
+            worker_ids: Workers to reset, defaults to all
+
+        Raises:
+            RuntimeError: If a worker fails or times out, with the worker traceback
+        """
+        commands = np.full(self.num_workers, CMD_IDLE, dtype=np.int32)
+        if worker_ids is None:
+            commands[:] = CMD_RESET
+        else:
+            commands[np.asarray(worker_ids, dtype=np.int64)] = CMD_RESET
+        self._run(commands)
+
+    def get_step_latency(self) -> Dict[str, np.ndarray]:
+        """Get per-worker latency statistics of step/reset rounds.
+
+        Returns:
+            dict: ``last``, ``mean`` and ``max`` latency in seconds and ``count``, each of shape (K,)
+        """
+        return {
+            "last": self._buffers["latency"].array.copy(),
+            "mean": self._latency_sum / np.maximum(self._latency_count, 1),
+            "max": self._latency_max.copy(),
+            "count": self._latency_count.copy(),
+        }
+
+    def close(self):
+        """Stop all workers and release the shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+        if "commands" in self._buffers and not self._barrier.broken:
+            try:
+                self._buffers["commands"].array[:] = CMD_CLOSE
+                self._barrier.wait(self.timeout)
+                self._barrier.wait(self.timeout)
+            except Exception:
+                pass
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._conns:
+            conn.close()
+        for buffer in self._buffers.values():
+            buffer.close()
+        self._buffers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
@@ -69,13 +69,14 @@ class MjData(metaclass=_MjDataMeta):
     The properties without docstrings are defined in mujoco source code from https://github.com/deepmind/mujoco/blob/062cb53a4a14b2a7a900453613a7ce498728f9d8/include/mujoco/mjdata.h#L126.
     """
 
-    def __init__(self, model):
+    def __init__(self, model, data=None):
         """Construct a new MjData instance.
         Args:
           model: An MjModel instance.
+          data: Optional existing mujoco.MjData to wrap instead of allocating one.
         """
         self._model = model
-        self._data = mujoco.MjData(model._model)
+        self._data = data if data is not None else mujoco.MjData(model._model)
 
     @property
     def model(self):
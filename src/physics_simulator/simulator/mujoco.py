@@ -12,7 +12,9 @@ import time
 import os
 
 import gc
+import numpy as np
 from typing import List
+from contextlib import nullcontext
 from auro_utils import xyzw_to_wxyz
 from auro_utils import Logger
 from threading import RLock
@@ -30,6 +32,8 @@ from synthnova_config import (
     SensorConfig,
     RgbCameraConfig,
     DepthCameraConfig,
+    Lidar3DConfig,
+    ImuConfig,
     ScenarioConfig
 )
 
@@ -38,6 +42,26 @@ from auro_utils import wxyz_to_xyzw
 
 from physics_simulator.utils.path_manager import PathManager
 
+# Returned by _profile_span() while profiling is disabled
+_NO_SPAN = nullcontext()
+
+# Record of one active contact returned by get_contacts()
+CONTACT_DTYPE = np.dtype(
+    [
+        ("geom1", np.int32),
+        ("geom2", np.int32),
+        ("body1", np.int32),
+        ("body2", np.int32),
+        ("entity1", np.int32),
+        ("entity2", np.int32),
+        ("pos", np.float64, (3,)),
+        ("frame", np.float64, (9,)),
+        ("dist", np.float64),
+        ("force", np.float64, (6,)),
+    ],
+    align=True,
+)
+
 class MujocoSimulator(BaseSim):
     def __init__(self, physics_simulator_config: PhysicsSimulatorConfig):
         """Initialize the MuJoCo-based physics simulator.
@@ -45,8 +69,6 @@ class MujocoSimulator(BaseSim):
         Args:
             physics_simulator_config: Configuration object containing all simulator settings
         """
-        from mujoco import viewer
-
         super().__init__(physics_simulator_config)
         self.root_directory = PathManager.get_root_path()
         self.synthnova_assets_directory = self.get_synthnova_assets_directory()
@@ -63,8 +85,25 @@ class MujocoSimulator(BaseSim):
         self._objects = {}
         self._ground_planes = {}
         self._physics_callbacks = {}
+        # Sensors sampling the data after every physics step, by prim path
+        self._step_samplers = {}
+        self._sorted_physics_callbacks = None
+        self._physics_callback_order = 0
+        self._physics_callback_step = 0
+        self._state_publisher = None
+        self._object_index_tables = {}
+        self._contact_entities = None
+        self._contact_buffer = np.empty(0, dtype=CONTACT_DTYPE)
+        self._scene_query = None
+        self._profiler = None
+        self._profiler_installed_clock = False
+        self._scheduler = None
+        # Bumped when the scene changes without stepping, invalidates cached camera frames
+        self._scene_version = 0
         self.lock = RLock()
         self._render_context_offscreen = None
+        # Wall-clock seconds spent in each phase of initialize()
+        self.init_timings = {}
 
         # Add signal handler for graceful shutdown
         import signal
@@ -139,29 +178,30 @@ class MujocoSimulator(BaseSim):
         with self.lock:
             # Load the world
             # Initialize the MjModel and MjData
-            mujoco_model = self.world.get_model(mode="mujoco")
+            start = time.perf_counter()
+            mujoco_model = self._compile_world()
             self.model = MjModel(mujoco_model)
             self.data = MjData(self.model)
+            self.init_timings["compile"] = time.perf_counter() - start
+
+            start = time.perf_counter()
             for robot in self._robots.values():
                 robot["instance"].initialize()
+            self.init_timings["robots"] = time.perf_counter() - start
+            self._bind_entities()
 
             headless = self.config.mujoco_config.headless
 
+            start = time.perf_counter()
             if headless:
                 self.viewer = None
-            else:
-                if self.viewer is None:
-                    self.viewer = mujoco.viewer.launch_passive(
-                        self.model._model, self.data._data
-                    )
-                
-                self.viewer.opt.geomgroup[0] = False  # collision
-                self.viewer.opt.geomgroup[1] = True   # visual
-                self.viewer.opt.geomgroup[2] = True   # visual
-                self.viewer.opt.geomgroup[3] = False  # collision
+            elif self.viewer is None:
+                self._launch_viewer()
+            self.init_timings["viewer"] = time.perf_counter() - start
 
             self._mujoco_timestep = self.model._model.opt.timestep
 
+            start = time.perf_counter()
             with self.lock:
                 try:
                     # Create render context with proper error handling
@@ -174,9 +214,114 @@ class MujocoSimulator(BaseSim):
                 except Exception as e:
                     self.logger.log_error(f"Error initializing render context: {e}")
                     raise
+            self.init_timings["render_context"] = time.perf_counter() - start
 
+            self._reset_state_publisher()
             self._running = True
 
+    def _bind_entities(self):
+        """Bind objects and sensor models to the current model, caching their body and camera ids."""
+        self._object_index_tables = {}
+        self._contact_entities = None
+        for obj in self._objects.values():
+            self._bind_entity(obj["instance"])
+        for sensor in self._sensors.values():
+            self._bind_entity(sensor["instance"])
+
+    def _bind_entity(self, instance):
+        # Cameras and lidars wrap the sensor model that is part of the scene
+        if not hasattr(instance, "initialize"):
+            instance = getattr(instance, "sensor_model", instance)
+        if hasattr(instance, "initialize"):
+            instance.initialize(self)
+
+    def _launch_viewer(self):
+        """Launch the passive viewer on the current model and data."""
+        import mujoco.viewer
+
+        self.viewer = mujoco.viewer.launch_passive(self.model._model, self.data._data)
+        self.viewer.opt.geomgroup[0] = False  # collision
+        self.viewer.opt.geomgroup[1] = True   # visual
+        self.viewer.opt.geomgroup[2] = True   # visual
+        self.viewer.opt.geomgroup[3] = False  # collision
+
+    def _recompile(self):
+        """Recompile the world spec after a runtime scene edit.
+
+        ``spec.recompile`` maps the current simulation state onto the new
+        model, so bodies that were not edited keep their pose and velocity.
+        Robots are re-bound to the new model and data, the render context is
+        recreated and the passive viewer, which cannot switch models, is
+        relaunched.
+        """
+        import mujoco
+        from physics_simulator.simulator.mj_wrapper import (
+            MjRenderContextOffscreen,
+            MjModel,
+            MjData
+        )
+
+        with self.lock:
+            mujoco_model, mujoco_data = self.world.get_spec().recompile(
+                self.model._model, self.data._data
+            )
+            mujoco.mj_forward(mujoco_model, mujoco_data)
+            self.model = MjModel(mujoco_model)
+            self.data = MjData(self.model, mujoco_data)
+            for robot in self._robots.values():
+                robot["instance"].initialize()
+            self._bind_entities()
+
+            if self.viewer is not None:
+                self.viewer.close()
+                self._launch_viewer()
+            self.add_render_context(MjRenderContextOffscreen(self, device_id=-1))
+            self._scene_changed()
+            self._reset_state_publisher()
+
+        self.logger.log_debug(
+            f"Recompiled world: {mujoco_model.nbody} bodies, {mujoco_model.nq} qpos"
+        )
+
+    def _compile_world(self):
+        """Compile the merged world into a mujoco.MjModel, going through the
+        on-disk model cache unless it is disabled in the MuJoCo config.
+
+        Returns:
+            mujoco.MjModel: The compiled model
+        """
+        mujoco_config = self.config.mujoco_config
+        if not mujoco_config.use_model_cache:
+            return self.world.get_model(mode="mujoco")
+
+        from physics_simulator.utils.model_cache import ModelCache
+
+        cache = ModelCache(
+            cache_dir=mujoco_config.model_cache_dir,
+            max_size_bytes=mujoco_config.model_cache_size_mb * 1024 * 1024,
+        )
+        xml = self.world.get_xml()
+        key = cache.compute_key(xml)
+        if key is None:
+            self.logger.log_warning("Model cache bypassed, a file referenced by the world cannot be read")
+            return self.world.get_model(mode="mujoco")
+        try:
+            mujoco_model = cache.load(key)
+        except OSError as e:
+            self.logger.log_warning(f"Failed to read model cache: {e}")
+            mujoco_model = None
+        if mujoco_model is not None:
+            self.logger.log_info(f"Model cache hit ({key[:12]}), skipped XML compilation")
+            return mujoco_model
+
+        self.logger.log_info(f"Model cache miss ({key[:12]}), compiling world XML")
+        mujoco_model = self.world.get_model(mode="mujoco")
+        try:
+            cache.store(key, mujoco_model)
+        except OSError as e:
+            self.logger.log_warning(f"Failed to write model cache: {e}")
+        return mujoco_model
+
     def forward(self):
         """Run forward dynamics to synchronize derived quantities in MuJoCo.
         This updates all computed quantities in the simulation without advancing time."""
@@ -184,6 +329,11 @@ class MujocoSimulator(BaseSim):
 
         with self.lock:
             mujoco.mj_forward(self.model._model, self.data._data)
+            self._scene_changed()
+
+    def _scene_changed(self):
+        """Record a scene change that did not step the simulation, so cached sensor frames are rendered again."""
+        self._scene_version += 1
 
     def step(self, num_steps: int = 1, render: bool = True):
         """Step simulation and execute physics callbacks."""
@@ -192,11 +342,9 @@ class MujocoSimulator(BaseSim):
         if self._running:
             if not render:
                 self.logger.log_warning("Render parameter is ignored in Mujoco")
-            for _ in range(num_steps):
-                mujoco.mj_step(self.model._model, self.data._data)
-
-            if self.viewer is not None:
-                self.viewer.sync()
+            self._step_data(num_steps)
+            self._run_step_hooks()
+            self._sync_viewer()
 
         else:
             raise RuntimeError(
@@ -218,6 +366,29 @@ class MujocoSimulator(BaseSim):
 
         with self.lock:
             mujoco.mj_step2(self.model._model, self.data._data)
+            self._run_step_samplers()
+
+    def _run_step_samplers(self):
+        for sample in self._step_samplers.values():
+            sample()
+
+    def _step_data(self, num_steps: int):
+        """Step the simulator's own data, running the step samplers after every step."""
+        import mujoco
+
+        model, data = self.model._model, self.data._data
+        if not self._step_samplers:
+            mujoco.mj_step(model, data, num_steps)
+            return
+        for _ in range(num_steps):
+            mujoco.mj_step(model, data)
+            self._run_step_samplers()
+
+    def _run_step_hooks(self):
+        """Record the profiler timers and publish the state after the steps of one call."""
+        if self._profiler is not None:
+            self._profiler.sample_timers(self.data._data)
+        self._publish_state()
 
     def render(
         self,
@@ -251,7 +422,7 @@ class MujocoSimulator(BaseSim):
 
         assert mode == "offscreen", "only offscreen supported for now"
         assert self._render_context_offscreen is not None
-        with self.lock:
+        with self.lock, self._profile_span("render"):
             self._render_context_offscreen.render(
                 width=width,
                 height=height,
@@ -282,39 +453,330 @@ class MujocoSimulator(BaseSim):
         if not self._running:
             self.initialize()
 
-    def loop(self):
-        """Run the simulation loop."""
-        last_time = time.time()
-        while self._running:
-            current_time = time.time()
-            elapsed = current_time - last_time
-            
-            num_steps = int(elapsed / self.config.mujoco_config.timestep)
+    def loop(
+        self,
+        real_time_factor: float = 1.0,
+        max_catch_up_steps: int = 10,
+        duration: float = None,
+    ) -> dict:
+        """Run the simulation loop on a fixed-rate real-time scheduler.
+
+        Physics callbacks are dispatched at their own period and phase. The loop
+        runs until the simulator is closed or the given duration is simulated,
+        in the former case the simulator is closed when the loop returns.
 
-            self.step(num_steps)
+        Args:
+            real_time_factor: Simulated seconds per wall-clock second, None runs as fast as possible
+            max_catch_up_steps: Maximum number of steps run back to back when behind schedule
+            duration: Simulated seconds to run, None runs until interrupted
 
-            if self._physics_callbacks:
-                callbacks = list(self._physics_callbacks.values())
-                for callback in callbacks:
-                    callback()
+        Returns:
+            dict: Scheduler statistics (steps, overruns, dropped_steps, lag, achieved real_time_factor)
+        """
+        from physics_simulator.simulator.scheduler import RealTimeScheduler
 
-            last_time = current_time
+        self._scheduler = RealTimeScheduler(
+            self,
+            real_time_factor=real_time_factor,
+            max_catch_up_steps=max_catch_up_steps,
+        )
+        stats = self._scheduler.run(duration=duration)
+        self.logger.log_info(
+            f"Simulation loop finished: {stats['steps']} steps at "
+            f"{stats['real_time_factor']:.2f}x real time, {stats['overruns']} overruns, "
+            f"{stats['dropped_steps']} dropped steps"
+        )
+        if not self._running:
+            self.close()
+        return stats
 
-            time.sleep(self.config.mujoco_config.timestep)
-        self.close()
+    def stop_loop(self):
+        """Make a running loop() return after its current tick without closing the simulator."""
+        if self._scheduler is not None:
+            self._scheduler.stop()
 
     def reset(self):
         """Reset the simulation to its initial state."""
         import mujoco
 
         with self.lock:
-            mujoco.mj_resetData(self.model, self.data)
+            mujoco.mj_resetData(self.model._model, self.data._data)
+            mujoco.mj_forward(self.model._model, self.data._data)
+            self._scene_changed()
+            self._publish_state()
+
+    def get_state_size(self) -> int:
+        """Get the number of float64 values in a full physics state snapshot.
+
+        Returns:
+            int: Size of the mjSTATE_FULLPHYSICS state vector
+        """
+        import mujoco
+
+        return mujoco.mj_stateSize(
+            self.model._model, mujoco.mjtState.mjSTATE_FULLPHYSICS
+        )
+
+    def save_state(self, out: np.ndarray = None) -> np.ndarray:
+        """Snapshot the full physics state (time, qpos, qvel, act, warmstart,
+        mocap, user data...) into a flat float64 buffer.
+
+        Pass a previously returned buffer as ``out`` to overwrite it in place,
+        so repeated snapshots do not allocate.
+
+        Args:
+            out: Optional preallocated buffer of size get_state_size()
+
+        Returns:
+            np.ndarray: State handle to pass to restore_state()
+
+        Raises:
+            ValueError: If out has the wrong size or dtype
+        """
+        import mujoco
+
+        if out is None:
+            out = np.empty(self.get_state_size(), dtype=np.float64)
+        else:
+            self._check_state_buffer(out)
+        with self.lock:
+            mujoco.mj_getState(
+                self.model._model,
+                self.data._data,
+                out,
+                mujoco.mjtState.mjSTATE_FULLPHYSICS,
+            )
+        return out
+
+    def restore_state(self, state: np.ndarray, forward: bool = True):
+        """Restore a full physics state saved with save_state().
+
+        Args:
+            state: State handle returned by save_state()
+            forward: If True, run mj_forward so derived quantities (body poses,
+                sensor readings...) match the restored state
+
+        Raises:
+            ValueError: If the state does not match the current model
+        """
+        import mujoco
+
+        self._check_state_buffer(state)
+        with self.lock:
+            mujoco.mj_setState(
+                self.model._model,
+                self.data._data,
+                state,
+                mujoco.mjtState.mjSTATE_FULLPHYSICS,
+            )
+            if forward:
+                mujoco.mj_forward(self.model._model, self.data._data)
+            self._scene_changed()
+            self._publish_state()
+
+    def _check_state_buffer(self, state: np.ndarray):
+        size = self.get_state_size()
+        if (
+            not isinstance(state, np.ndarray)
+            or state.dtype != np.float64
+            or state.shape != (size,)
+        ):
+            raise ValueError(
+                f"State must be a float64 array of shape ({size},) for the current model"
+            )
+
+    def branch(self):
+        """Copy the live simulation data for what-if lookahead.
+
+        The copy shares the compiled model but can be stepped with
+        ``mujoco.mj_step(sim.model._model, branch)`` without disturbing the live
+        simulation.
+
+        Returns:
+            mujoco.MjData: Independent copy of the current data
+        """
+        import copy
+
+        with self.lock:
+            return copy.copy(self.data._data)
+
+    def _reset_state_publisher(self):
+        """Allocate the state buffers for the current model if publishing is enabled."""
+        from physics_simulator.simulator.state_publisher import StatePublisher
+
+        if self.config.mujoco_config.publish_state:
+            self._state_publisher = StatePublisher(self.model._model)
+            self._state_publisher.publish(self.data._data)
+        else:
+            self._state_publisher = None
+
+    def _publish_state(self):
+        if self._state_publisher is not None:
+            self._state_publisher.publish(self.data._data)
+
+    def is_publishing_state(self) -> bool:
+        """Check whether a state snapshot is published after every step.
+
+        Returns:
+            bool: True if ``publish_state`` is enabled and the simulator is initialized
+        """
+        return self._state_publisher is not None
+
+    def get_published_state(self, copy: bool = False):
+        """Get the state published after the latest step without taking the simulator lock.
+
+        The returned snapshot is read-only and shared with other readers. It
+        remains valid until two more steps are published, pass copy=True to keep
+        the values longer.
+
+        Args:
+            copy: If True, return a dict of independent arrays
+
+        Returns:
+            StateSnapshot or dict: time, step, qpos, qvel, xpos, xquat (wxyz) and sensordata
+
+        Raises:
+            RuntimeError: If state publishing is disabled or the simulator is not initialized
+        """
+        if self._state_publisher is None:
+            raise RuntimeError(
+                "State publishing is disabled, set mujoco_config.publish_state and call initialize()"
+            )
+        return self._state_publisher.read(copy=copy)
+
+    def compile_state_schema(self, prim_paths=None, dtype=np.float64):
+        """Compile the layout of a flat state vector, see StateSchema.
+
+        Args:
+            prim_paths: Robots, objects and cameras to include in this order,
+                defaults to all robots, objects and cameras
+            dtype: Data type of the state vector, np.float32 or np.float64
+
+        Returns:
+            StateSchema: Schema to pass to get_state_vector()
+
+        Raises:
+            RuntimeError: If the simulator is not initialized
+            KeyError: If a prim path is not registered
+        """
+        from physics_simulator.simulator.state_schema import StateSchema
+
+        if self.model is None:
+            raise RuntimeError("Simulator is not initialized, please call initialize() first")
+        return StateSchema.compile(self, prim_paths=prim_paths, dtype=dtype)
+
+    def get_state_vector(self, schema, out: np.ndarray = None) -> np.ndarray:
+        """Gather the current state into a flat vector with one indexed copy per MjData array.
+
+        Without ``out`` the schema's own buffer is filled, so ``schema.views``
+        hold the named state afterwards.
+
+        Args:
+            schema: StateSchema from compile_state_schema()
+            out: Vector of shape (schema.size,) to fill
+
+        Returns:
+            np.ndarray: The filled state vector
+
+        Raises:
+            RuntimeError: If the schema was compiled for another model, e.g.
+                before a runtime scene edit
+        """
+        if schema.model is not self.model._model:
+            raise RuntimeError(
+                "State schema was compiled for another model, call compile_state_schema() again"
+            )
+        with self.lock:
+            return schema.gather(self.data._data, out=out)
+
+    def _sync_viewer(self):
+        """Synchronize the passive viewer with the simulation data, if launched."""
+        if self.viewer is not None:
+            with self._profile_span("viewer_sync"):
+                self.viewer.sync()
+
+    def _profile_span(self, name: str):
+        if self._profiler is None:
+            return _NO_SPAN
+        return self._profiler.span(name)
+
+    def enable_profiling(self, window: int = 1000):
+        """Start collecting a per-step timing breakdown.
+
+        Records the MuJoCo pipeline timers (collision, constraint solver,
+        integration...) of every step along with the time spent in physics
+        callbacks, viewer sync and render(). MuJoCo only measures its timers
+        while a clock callback is installed, which is process-wide, so it is
+        installed here unless one is already set.
+
+        Args:
+            window: Number of most recent samples kept per entry
+        """
+        import mujoco
+        from physics_simulator.simulator.profiler import StepProfiler
+
+        self._profiler = StepProfiler(window=window)
+        if mujoco.get_mjcb_time() is None:
+            mujoco.set_mjcb_time(time.perf_counter)
+            self._profiler_installed_clock = True
+        if self._running:
+            # Per-step deltas start from the values accumulated so far
+            self._profiler.sample_timers(self.data._data)
+            self._profiler.reset(keep_timers=True)
+
+    def disable_profiling(self):
+        """Stop collecting timings and remove the MuJoCo clock installed by enable_profiling()."""
+        import mujoco
+
+        self._profiler = None
+        if self._profiler_installed_clock:
+            mujoco.set_mjcb_time(None)
+            self._profiler_installed_clock = False
+
+    def is_profiling(self) -> bool:
+        """Check whether profiling is enabled.
+
+        Returns:
+            bool: True between enable_profiling() and disable_profiling()
+        """
+        return self._profiler is not None
+
+    def get_profile(self) -> dict:
+        """Get rolling timing statistics of the recent steps.
+
+        Entries are ``mujoco/<stage>`` for the MuJoCo pipeline timers (per
+        step), ``callbacks/pre_step``, ``callbacks/post_step``,
+        ``viewer_sync`` and ``render``.
+
+        Returns:
+            dict: Per entry, count, mean, p50, p90, p99 and max in seconds
+
+        Raises:
+            RuntimeError: If profiling is not enabled
+        """
+        if self._profiler is None:
+            raise RuntimeError("Profiling is disabled, please call enable_profiling() first")
+        return self._profiler.get_profile()
+
+    def format_profile(self) -> str:
+        """Format the rolling timing statistics as a table.
+
+        Returns:
+            str: Human readable report in microseconds
+
+        Raises:
+            RuntimeError: If profiling is not enabled
+        """
+        if self._profiler is None:
+            raise RuntimeError("Profiling is disabled, please call enable_profiling() first")
+        return self._profiler.format_profile()
 
     def close(self):
         """Clean up and close the simulator, releasing all resources."""
         with self.lock:
             # Set flag first to prevent any new operations
             self._running = False
+            self.disable_profiling()
             
             if self._render_context_offscreen is not None:
                 del self._render_context_offscreen
@@ -392,7 +854,10 @@ class MujocoSimulator(BaseSim):
         
         # Create robot with namespace
         robot = MujocoRobot(self, robot_config, namespace=namespace)
-        self.world.merge(robot.robot_model)
+        if self._running:
+            self.world.attach_model(robot.robot_model)
+        else:
+            self.world.merge(robot.robot_model)
 
         # Store both mappings: prim_path -> robot and robot -> robot
         prim_path = robot.prim_path
@@ -402,6 +867,8 @@ class MujocoSimulator(BaseSim):
             "initialized": True,
             "metadata": {},
         }
+        if self._running:
+            self._recompile()
         self.logger.log_debug(f"Added robot with prim_path: {prim_path}")
 
         return robot.prim_path
@@ -420,11 +887,36 @@ class MujocoSimulator(BaseSim):
     def remove_robot(self, prim_path: str):
         """Remove a robot from the simulator.
 
+        All world elements in the robot namespace are removed, and so are the
+        sensors mounted on the robot. After initialize() the model is
+        recompiled in place.
+
         Args:
             prim_path: Path identifier for the robot
+
+        Raises:
+            KeyError: If no robot exists at prim_path
         """
+        robot = self._robots[prim_path]["instance"]
+        mounted = [
+            sensor_path
+            for sensor_path, sensor in self._sensors.items()
+            if (sensor["instance"].sensor_model.parent_entity_name or "").startswith(robot.namespace)
+        ]
+        if self._running:
+            # Mirror the current model before editing the XML
+            self.world.get_spec()
+        # Sensor bodies are removed with the robot bodies they are mounted on
+        self.world.remove_prefixed(robot.namespace)
+        for sensor_path in mounted:
+            sensor = self._sensors.pop(sensor_path)["instance"]
+            self._step_samplers.pop(sensor_path, None)
+            self.world.remove_sensor_elements(getattr(sensor, "sensor_elements", ()))
+            self.logger.log_debug(f"Removed sensor {sensor_path} mounted on robot {prim_path}")
         self._robots.pop(prim_path)
-        # TODO@Chenyu Cao: remove robot from world, and log the removal
+        if self._running:
+            self._recompile()
+        self.logger.log_debug(f"Removed robot with prim_path: {prim_path}")
 
     def add_object(self, object_config: ObjectConfig):
         """Add a physical object to the simulation environment.
@@ -446,7 +938,15 @@ class MujocoSimulator(BaseSim):
             if object_config_copy.rotation is not None:
                 object_config_copy.rotation = xyzw_to_wxyz(object_config_copy.rotation)
             obj = MujocoObjectFactory.create_from_config(object_config_copy)
-            self.world.merge_objects([obj])
+            if self._running:
+                self.world.attach_objects([obj])
+                try:
+                    self._recompile()
+                except Exception:
+                    self.world.remove_body(obj.get_obj().get("name"))
+                    raise
+            else:
+                self.world.merge_objects([obj])
 
             # Store object reference if using prim_path
             if hasattr(object_config, "prim_path") and object_config.prim_path:
@@ -457,6 +957,8 @@ class MujocoSimulator(BaseSim):
                     "initialized": True,
                     "metadata": {},
                 }
+                if self._running:
+                    self._bind_entity(obj)
                 self.logger.log_debug(f"Added object with prim_path: {prim_path}")
 
             return object_config_copy.prim_path
@@ -477,16 +979,31 @@ class MujocoSimulator(BaseSim):
     def remove_object(self, prim_path: str):
         """Remove an object from the simulator.
 
+        After initialize() the model is recompiled in place, keeping the state
+        of every other body.
+
         Args:
             prim_path: Path identifier for the object
+
+        Raises:
+            KeyError: If no object exists at prim_path
         """
         obj = self._objects[prim_path]["instance"]
+        if self._running:
+            # Mirror the current model before editing the XML
+            self.world.get_spec()
+        self.world.remove_body(obj.get_obj().get("name"))
         self._objects.pop(prim_path)
-        self._objects.pop(obj)
+        if self._running:
+            self._recompile()
+        self.logger.log_debug(f"Removed object with prim_path: {prim_path}")
 
     def add_sensor(self, sensor_config: SensorConfig):
         """Add a sensor to the simulation environment.
-        
+
+        After initialize() the sensor is attached to the world spec and the
+        model is recompiled in place, keeping the state of every body.
+
         Args:
             sensor_config: Configuration for the sensor to add
             
@@ -494,10 +1011,17 @@ class MujocoSimulator(BaseSim):
             str: Path to the added sensor
         """
         self.logger.log_debug("Adding sensor...")
+        if self._running:
+            # Mirror the current model before the sensor edits the XML
+            self.world.get_spec()
         if sensor_config.type == "rgb_camera":
             sensor = self._add_rgb_camera(sensor_config)
         elif sensor_config.type == "depth_camera":
             sensor = self._add_depth_camera(sensor_config)
+        elif sensor_config.type == "lidar_3d":
+            sensor = self._add_lidar_3d(sensor_config)
+        elif sensor_config.type == "imu":
+            sensor = self._add_imu(sensor_config)
         else:
             raise ValueError(f"Unsupported sensor type: {sensor_config.type}")
 
@@ -509,6 +1033,22 @@ class MujocoSimulator(BaseSim):
             "initialized": True,
             "metadata": {},
         }
+        if hasattr(sensor, "on_physics_step"):
+            self._step_samplers[prim_path] = sensor.on_physics_step
+        if self._running:
+            sensor_model = sensor.sensor_model
+            sensor_elements = getattr(sensor, "sensor_elements", ())
+            try:
+                self.world.attach_sensor(
+                    sensor_model.get_obj(), sensor_model.parent_entity_name, sensor_elements
+                )
+                # Binds every sensor, the new one included
+                self._recompile()
+            except Exception:
+                self._sensors.pop(prim_path)
+                self._step_samplers.pop(prim_path, None)
+                self.world.detach_sensor(sensor_model.get_obj(), sensor_elements)
+                raise
         return prim_path
 
     def _add_rgb_camera(self, sensor_config: RgbCameraConfig):
@@ -525,6 +1065,18 @@ class MujocoSimulator(BaseSim):
         sensor = MujocoDepthCamera(simulator=self, camera_config=sensor_config)
         return sensor
 
+    def _add_lidar_3d(self, sensor_config: Lidar3DConfig):
+        from physics_simulator.sensor.lidar_3d import MujocoLidar3D
+
+        sensor = MujocoLidar3D(simulator=self, lidar_config=sensor_config)
+        return sensor
+
+    def _add_imu(self, sensor_config: ImuConfig):
+        from physics_simulator.sensor.imu import MujocoImu
+
+        sensor = MujocoImu(simulator=self, imu_config=sensor_config)
+        return sensor
+
     def get_sensor(self, prim_path: str):
         """Retrieve a sensor by its path.
 
@@ -543,6 +1095,7 @@ class MujocoSimulator(BaseSim):
             prim_path: Path identifier for the sensor
         """
         self._sensors.pop(prim_path)
+        self._step_samplers.pop(prim_path, None)
 
     def get_sensor_state(self, prim_path: str):
         """Get the current output/reading from a sensor.
@@ -745,22 +1298,61 @@ class MujocoSimulator(BaseSim):
             KeyError: If robot does not exist
             ValueError: If joint names are invalid
         """
+        if self._state_publisher is not None:
+            indexes = robot.get_joint_index_table(joint_names).qpos
+            return self._state_publisher.read_with(lambda state: state.qpos[indexes])
         return robot.get_joint_positions(joint_names=joint_names)
 
-    def add_physics_callback(self, name: str, callback_fn: callable) -> None:
+    def add_physics_callback(
+        self,
+        name: str,
+        callback_fn: callable,
+        period: int = None,
+        frequency: float = None,
+        priority: int = 0,
+        phase: str = "post_step",
+    ) -> None:
         """Register a callback function to be called during physics simulation.
-        
+
+        Callbacks are dispatched by loop() at their own rate, in priority order
+        within their phase. ``pre_step`` callbacks run between ``mj_step1`` and
+        ``mj_step2``, so controls they write apply to the current step;
+        ``post_step`` callbacks run once the step has completed.
+
         Args:
             name: Unique name for the callback
-            callback_fn: Function to call (will receive simulator instance as argument)
-            
+            callback_fn: Function to call, without arguments
+            period: Run every `period` physics steps, defaults to every step
+            frequency: Run at this rate in Hz instead, rounded to a whole number of steps
+            priority: Callbacks with lower values run first, ties keep registration order
+            phase: "pre_step" or "post_step"
+
         Raises:
-            ValueError: If a callback with the same name already exists
+            ValueError: If both period and frequency are given, or either is not positive
         """
+        from physics_simulator.simulator.callbacks import PhysicsCallback
+
         if name in self._physics_callbacks:
             self.logger.log_warning(f"Callback with name '{name}' already exists")
             return
-        self._physics_callbacks[name] = callback_fn
+        if period is not None and frequency is not None:
+            raise ValueError("Specify either period or frequency, not both")
+        if frequency is not None:
+            if frequency <= 0:
+                raise ValueError(f"Callback frequency must be positive, got {frequency}")
+            timestep = self.config.mujoco_config.timestep
+            period = max(1, int(round(1.0 / (frequency * timestep))))
+
+        self._physics_callback_order += 1
+        self._physics_callbacks[name] = PhysicsCallback(
+            name,
+            callback_fn,
+            period=period or 1,
+            priority=priority,
+            phase=phase,
+            order=self._physics_callback_order,
+        )
+        self._sorted_physics_callbacks = None
 
     def remove_physics_callback(self, name: str) -> None:
         """Remove a physics callback by its name.
@@ -772,6 +1364,68 @@ class MujocoSimulator(BaseSim):
             self.logger.log_warning(f"Callback with name '{name}' does not exist")
             return
         del self._physics_callbacks[name]
+        self._sorted_physics_callbacks = None
+
+    def get_physics_callback_stats(self, name: str = None) -> dict:
+        """Get rate, priority and execution time statistics of physics callbacks.
+
+        Args:
+            name: Name of a single callback, None returns all of them
+
+        Returns:
+            dict: period, priority, phase, calls and total/mean/max time in seconds,
+                keyed by callback name when name is None
+
+        Raises:
+            KeyError: If the callback does not exist
+        """
+        if name is not None:
+            return self._physics_callbacks[name].get_stats()
+        return {
+            callback_name: callback.get_stats()
+            for callback_name, callback in self._physics_callbacks.items()
+        }
+
+    def _physics_step(self):
+        """Advance one physics step and dispatch the callbacks due at this step."""
+        import mujoco
+
+        if self._sorted_physics_callbacks is None:
+            self._sorted_physics_callbacks = sorted(
+                self._physics_callbacks.values(), key=lambda callback: callback.sort_key
+            )
+        step_index = self._physics_callback_step
+        pre_step = []
+        post_step = []
+        for callback in self._sorted_physics_callbacks:
+            if callback.is_due(step_index):
+                (pre_step if callback.phase == "pre_step" else post_step).append(callback)
+
+        with self.lock:
+            if pre_step:
+                mujoco.mj_step1(self.model._model, self.data._data)
+                self._run_physics_callbacks(pre_step, "callbacks/pre_step")
+                mujoco.mj_step2(self.model._model, self.data._data)
+            else:
+                mujoco.mj_step(self.model._model, self.data._data)
+            if self._step_samplers:
+                self._run_step_samplers()
+            self._run_step_hooks()
+        self._physics_callback_step += 1
+        self._run_physics_callbacks(post_step, "callbacks/post_step")
+
+    def _run_physics_callbacks(self, callbacks, span_name):
+        if not callbacks:
+            return
+        with self._profile_span(span_name):
+            self._dispatch_physics_callbacks(callbacks)
+
+    def _dispatch_physics_callbacks(self, callbacks):
+        for callback in callbacks:
+            # Earlier callbacks may remove later ones, or close the simulator
+            if not self._running or self._physics_callbacks.get(callback.name) is not callback:
+                continue
+            callback()
 
     def physics_callback_exists(self, name: str) -> bool:
         """Check if a physics callback with the given name exists.
@@ -796,6 +1450,9 @@ class MujocoSimulator(BaseSim):
         Raises:
             KeyError: If robot does not exist at the specified path
         """
+        if self._state_publisher is not None:
+            return self._get_published_robot_state(prim_path)
+
         robot_state = {}
 
         try:
@@ -834,6 +1491,23 @@ class MujocoSimulator(BaseSim):
                 self.logger.log_error(f"Robot type: {type(robot)}")
             raise
 
+    def _get_published_robot_state(self, prim_path):
+        """Read a robot state from the published snapshot instead of the live data."""
+        robot = self._robots[prim_path]["instance"]
+        table = robot.get_joint_index_table()
+        qpos_indexes, dof_indexes = table.qpos, table.dof
+        root_body_id = robot.root_body_id
+
+        def read(state):
+            return {
+                "position": state.xpos[root_body_id].copy(),
+                "orientation": wxyz_to_xyzw(state.xquat[root_body_id].copy()),
+                "joint_positions": state.qpos[qpos_indexes],
+                "joint_velocities": state.qvel[dof_indexes],
+            }
+
+        return self._state_publisher.read_with(read)
+
     def get_object_state(self, prim_path):
         """Get the current state of an object in the simulation.
         
@@ -884,6 +1558,230 @@ class MujocoSimulator(BaseSim):
                 self.logger.log_error(f"Object type: {type(obj)}")
             raise
 
+    def _get_object_index_table(self, prim_paths) -> dict:
+        """Get the body ids and free-joint addresses of objects, cached per prim path tuple."""
+        import mujoco
+
+        key = prim_paths if isinstance(prim_paths, tuple) else tuple(prim_paths)
+        table = self._object_index_tables.get(key)
+        if table is not None:
+            return table
+
+        model = self.model._model
+        body_ids, has_free_joint, qpos_addresses, dof_addresses = [], [], [], []
+        for prim_path in key:
+            if prim_path not in self._objects:
+                raise KeyError(f"Object with key '{prim_path}' not found")
+            obj = self._objects[prim_path]["instance"]
+            body_id = self.model.body_name2id(f"{obj.naming_prefix}main")
+            # A free joint, when present, is the first joint of the body
+            joint_id = model.body_jntadr[body_id]
+            free = (
+                model.body_jntnum[body_id] > 0
+                and model.jnt_type[joint_id] == mujoco.mjtJoint.mjJNT_FREE
+            )
+            body_ids.append(body_id)
+            has_free_joint.append(free)
+            qpos_addresses.append(model.jnt_qposadr[joint_id] if free else 0)
+            dof_addresses.append(model.jnt_dofadr[joint_id] if free else 0)
+        table = {
+            "body_ids": np.asarray(body_ids, dtype=np.intp),
+            "has_free_joint": np.asarray(has_free_joint, dtype=bool),
+            "qpos": np.asarray(qpos_addresses, dtype=np.intp)[:, None] + np.arange(7),
+            "dof": np.asarray(dof_addresses, dtype=np.intp)[:, None] + np.arange(6),
+        }
+        self._object_index_tables[key] = table
+        return table
+
+    def get_objects_state(self, prim_paths=None) -> dict:
+        """Get the state of many objects with one vectorized gather.
+
+        Index tables are cached per prim path tuple until the model is
+        recompiled, so repeated queries of the same objects do no name lookups.
+
+        Args:
+            prim_paths: Paths of the objects, defaults to all objects
+
+        Returns:
+            dict: Arrays in prim path order:
+                - position: (N, 3) world positions
+                - orientation: (N, 4) world orientations in xyzw format
+                - velocity: (N, 6) linear and angular velocities in world
+                  frame, zero for objects without a free joint
+
+        Raises:
+            KeyError: If an object does not exist
+        """
+        if prim_paths is None:
+            prim_paths = list(self._objects)
+        table = self._get_object_index_table(prim_paths)
+        body_ids = table["body_ids"]
+        free = table["has_free_joint"]
+        with self.lock:
+            data = self.data._data
+            position = data.xpos[body_ids]
+            orientation = data.xquat[body_ids][:, [1, 2, 3, 0]]
+            qvel = data.qvel[table["dof"][free]]
+            rotation = data.xmat[body_ids[free]].reshape(-1, 3, 3)
+
+        velocity = np.zeros((len(body_ids), 6))
+        velocity[free, :3] = qvel[:, :3]
+        # Free joint angular velocities are expressed in the body frame
+        velocity[free, 3:] = np.einsum("nij,nj->ni", rotation, qvel[:, 3:])
+        return {"position": position, "orientation": orientation, "velocity": velocity}
+
+    def set_objects_pose(self, prim_paths, poses, zero_velocity: bool = False):
+        """Teleport many objects by writing their free-joint qpos, followed by one mj_forward.
+
+        Args:
+            prim_paths: Paths of the objects
+            poses: (N, 7) array of [x, y, z, qx, qy, qz, qw] world poses
+            zero_velocity: If True, also zero the velocities of the objects
+
+        Raises:
+            KeyError: If an object does not exist
+            ValueError: If poses does not have shape (N, 7) or an object has no free joint
+        """
+        import mujoco
+
+        poses = np.asarray(poses, dtype=np.float64)
+        if poses.shape != (len(prim_paths), 7):
+            raise ValueError(f"poses must have shape ({len(prim_paths)}, 7), got {poses.shape}")
+        table = self._get_object_index_table(prim_paths)
+        if not table["has_free_joint"].all():
+            fixed = [p for p, free in zip(prim_paths, table["has_free_joint"]) if not free]
+            raise ValueError(f"Objects without a free joint cannot be teleported: {fixed}")
+
+        qpos = poses[:, [0, 1, 2, 6, 3, 4, 5]]
+        qpos[:, 3:] /= np.linalg.norm(qpos[:, 3:], axis=1, keepdims=True)
+        with self.lock:
+            data = self.data._data
+            data.qpos[table["qpos"]] = qpos
+            if zero_velocity:
+                data.qvel[table["dof"]] = 0.0
+            mujoco.mj_forward(self.model._model, data)
+            self._scene_changed()
+            self._publish_state()
+
+    def _get_contact_entities(self):
+        """Get the prim paths of robots and objects, and the entity index of every geom.
+
+        The geom table has one extra trailing -1 so that geom id -1 (flex
+        contacts) maps to no entity.
+        """
+        if self._contact_entities is not None:
+            return self._contact_entities
+
+        model = self.model._model
+        prim_paths, body_entity = [], np.full(model.nbody, -1, dtype=np.int32)
+        for prim_path, robot in self._robots.items():
+            body_entity[robot["instance"].root_body_id] = len(prim_paths)
+            prim_paths.append(prim_path)
+        for prim_path, obj in self._objects.items():
+            body_id = self.model.body_name2id(f"{obj['instance'].naming_prefix}main")
+            body_entity[body_id] = len(prim_paths)
+            prim_paths.append(prim_path)
+        # Parents always have lower ids, so one pass hands entities down the tree
+        parents = model.body_parentid
+        for body_id in range(1, model.nbody):
+            if body_entity[body_id] < 0:
+                body_entity[body_id] = body_entity[parents[body_id]]
+
+        geom_entity = np.append(body_entity[model.geom_bodyid], np.int32(-1))
+        self._contact_entities = (tuple(prim_paths), geom_entity)
+        return self._contact_entities
+
+    def get_contact_entities(self) -> tuple:
+        """Get the prim paths the entity1/entity2 fields of get_contacts() index into.
+
+        Returns:
+            tuple: Robot then object prim paths
+        """
+        return self._get_contact_entities()[0]
+
+    def get_contacts(self, filter_prim_paths=None, copy: bool = False) -> np.ndarray:
+        """Get all active contacts with their contact-frame forces.
+
+        Contacts are gathered from ``data.contact`` with vectorized reads and
+        the forces are computed with ``mj_contactForce`` in a single pass. The
+        records are written into a buffer reused across calls, which only grows
+        when there are more contacts than ever before.
+
+        Args:
+            filter_prim_paths: Robot or object prim paths, keep only contacts
+                involving at least one of them. Defaults to all contacts
+            copy: If True, return an independent array. Otherwise the returned
+                array is a view that the next call overwrites
+
+        Returns:
+            np.ndarray: Structured array of CONTACT_DTYPE records:
+                - geom1, geom2: geom ids, -1 for flex contacts
+                - body1, body2: body ids of the geoms, -1 for flex contacts
+                - entity1, entity2: indices into get_contact_entities(), -1 if
+                  the geom belongs to no robot or object (e.g. the ground)
+                - pos: (3,) contact position in world frame
+                - frame: (9,) contact frame, the normal is the first row
+                - dist: penetration distance, negative when penetrating
+                - force: (6,) normal force, two friction forces and three
+                  torques in the contact frame
+
+        Raises:
+            KeyError: If a filter prim path is not a robot or object
+        """
+        import mujoco
+
+        prim_paths, geom_entity = self._get_contact_entities()
+        if filter_prim_paths is not None:
+            missing = [p for p in filter_prim_paths if p not in prim_paths]
+            if missing:
+                raise KeyError(f"No robot or object registered at {missing}")
+            entity_ids = [prim_paths.index(p) for p in filter_prim_paths]
+
+        with self.lock:
+            model, data = self.model._model, self.data._data
+            contact = data.contact
+            # Contacts without constraint rows (excluded or in the margin) exert no force
+            indexes = np.flatnonzero(contact.efc_address >= 0)
+            geoms = contact.geom[indexes]
+            entities = geom_entity[geoms]
+            if filter_prim_paths is not None:
+                keep = np.isin(entities, entity_ids).any(axis=1)
+                indexes, geoms, entities = indexes[keep], geoms[keep], entities[keep]
+
+            count = len(indexes)
+            if len(self._contact_buffer) < count:
+                self._contact_buffer = np.empty(
+                    max(count, 2 * len(self._contact_buffer)), dtype=CONTACT_DTYPE
+                )
+            contacts = self._contact_buffer[:count]
+            contacts["geom1"] = geoms[:, 0]
+            contacts["geom2"] = geoms[:, 1]
+            bodies = np.where(geoms >= 0, model.geom_bodyid[geoms], -1)
+            contacts["body1"] = bodies[:, 0]
+            contacts["body2"] = bodies[:, 1]
+            contacts["entity1"] = entities[:, 0]
+            contacts["entity2"] = entities[:, 1]
+            contacts["pos"] = contact.pos[indexes]
+            contacts["frame"] = contact.frame[indexes]
+            contacts["dist"] = contact.dist[indexes]
+            forces = contacts["force"]
+            for row, index in enumerate(indexes):
+                mujoco.mj_contactForce(model, data, index, forces[row])
+
+        return contacts.copy() if copy else contacts
+
+    def get_scene_query(self):
+        """Get the ray casting and geom distance query service of the simulator, see SceneQuery.
+
+        Returns:
+            SceneQuery: Instance shared by all callers, its outputs reuse buffers
+        """
+        if self._scene_query is None:
+            from physics_simulator.simulator.scene_query import SceneQuery
+
+            self._scene_query = SceneQuery(self)
+        return self._scene_query
+
     @classmethod
     def get_synthnova_assets_directory(cls) -> str:
         """Retrieves the SynthNova assets directory path.
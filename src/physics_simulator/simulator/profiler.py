@@ -0,0 +1,153 @@
+#####################################################################################
+#
+# Description: Per-step timing breakdown from MuJoCo timers and Python-side spans
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict
+
+import mujoco
+import numpy as np
+
+# MuJoCo pipeline stages reported by the profiler, in pipeline order
+MUJOCO_TIMERS = {
+    "step": mujoco.mjtTimer.mjTIMER_STEP,
+    "forward": mujoco.mjtTimer.mjTIMER_FORWARD,
+    "position": mujoco.mjtTimer.mjTIMER_POSITION,
+    "pos_kinematics": mujoco.mjtTimer.mjTIMER_POS_KINEMATICS,
+    "pos_inertia": mujoco.mjtTimer.mjTIMER_POS_INERTIA,
+    "pos_collision": mujoco.mjtTimer.mjTIMER_POS_COLLISION,
+    "col_broad": mujoco.mjtTimer.mjTIMER_COL_BROAD,
+    "col_narrow": mujoco.mjtTimer.mjTIMER_COL_NARROW,
+    "pos_make": mujoco.mjtTimer.mjTIMER_POS_MAKE,
+    "pos_project": mujoco.mjtTimer.mjTIMER_POS_PROJECT,
+    "velocity": mujoco.mjtTimer.mjTIMER_VELOCITY,
+    "actuation": mujoco.mjtTimer.mjTIMER_ACTUATION,
+    "constraint": mujoco.mjtTimer.mjTIMER_CONSTRAINT,
+    "advance": mujoco.mjtTimer.mjTIMER_ADVANCE,
+}
+
+# Percentiles reported for every entry
+PERCENTILES = (50, 90, 99)
+
+
+class StepProfiler:
+    """Rolling per-step timing statistics of the simulation loop.
+
+    MuJoCo accumulates the duration of each pipeline stage in ``data.timer``
+    once a clock is installed with ``mujoco.set_mjcb_time``. After every step
+    the profiler turns the accumulated values into per-step durations, and
+    Python-side work (callbacks, viewer sync, rendering) is measured with
+    ``span()``. Only the last ``window`` samples of every entry are kept.
+    """
+
+    def __init__(self, window: int = 1000):
+        """Initialize the profiler.
+
+        Args:
+            window: Number of most recent samples kept per entry
+
+        Raises:
+            ValueError: If window is not positive
+        """
+        if window < 1:
+            raise ValueError(f"Profiler window must be positive, got {window}")
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._last_timers = {}
+
+    def record(self, name: str, seconds: float):
+        """Add one duration sample.
+
+        Args:
+            name: Entry name
+            seconds: Duration in seconds
+        """
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    @contextmanager
+    def span(self, name: str):
+        """Time the enclosed block as one sample of an entry.
+
+        Args:
+            name: Entry name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def sample_timers(self, data):
+        """Record the MuJoCo stage durations accumulated since the previous call.
+
+        Durations accumulated over several steps are averaged per step. A
+        counter going backwards (``mj_resetData``, new data) restarts the
+        accumulation.
+
+        Args:
+            data: mujoco.MjData that was stepped
+        """
+        for name, timer_id in MUJOCO_TIMERS.items():
+            timer = data.timer[timer_id]
+            duration, number = timer.duration, timer.number
+            last_duration, last_number = self._last_timers.get(name, (0.0, 0))
+            if number < last_number:
+                last_duration, last_number = 0.0, 0
+            if number > last_number:
+                self.record(
+                    f"mujoco/{name}",
+                    (duration - last_duration) / (number - last_number),
+                )
+            self._last_timers[name] = (duration, number)
+
+    def reset(self, keep_timers: bool = False):
+        """Drop all samples.
+
+        Args:
+            keep_timers: If True, keep the last seen MuJoCo timer values so the
+                next sample_timers() call only reports steps taken from now on
+        """
+        self._samples.clear()
+        if not keep_timers:
+            self._last_timers.clear()
+
+    def get_profile(self) -> dict:
+        """Get rolling statistics of every entry.
+
+        Returns:
+            dict: Per entry name, ``count``, ``mean``, ``max`` and ``p50``/``p90``/``p99``
+                in seconds over the window
+        """
+        profile = {}
+        for name, samples in self._samples.items():
+            values = np.fromiter(samples, dtype=np.float64, count=len(samples))
+            entry = {"count": len(values), "mean": float(values.mean())}
+            for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                entry[f"p{percentile}"] = float(value)
+            entry["max"] = float(values.max())
+            profile[name] = entry
+        return profile
+
+    def format_profile(self) -> str:
+        """Format the rolling statistics as a table.
+
+        Returns:
+            str: Human readable report in microseconds
+        """
+        columns = ["mean"] + [f"p{percentile}" for percentile in PERCENTILES] + ["max"]
+        header = f"{'entry':<28}{'count':>8}" + "".join(f"{column:>11}" for column in columns)
+        lines = ["Step profile (us)", header, "-" * len(header)]
+        for name, entry in sorted(self.get_profile().items()):
+            lines.append(
+                f"{name:<28}{entry['count']:>8}"
+                + "".join(f"{entry[column] * 1e6:>11.1f}" for column in columns)
+            )
+        return "\n".join(lines)
@@ -0,0 +1,351 @@
+#####################################################################################
+#
+# Description: Chunked on-disk trajectory recorder and memory-mapped reader
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import glob
+import json
+import os
+import queue
+import threading
+from typing import Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+# Fields recorded by default, all read from MjData
+TRAJECTORY_FIELDS = ("time", "qpos", "qvel", "ctrl", "act", "sensordata")
+
+_METADATA_FILE = "metadata.json"
+
+
+class TrajectoryRecorder:
+    """Record raw simulation data to chunked files without slowing the simulation.
+
+    Every recorded step copies the selected MjData fields into one row of a
+    preallocated chunk buffer. Full chunks are handed to a background thread
+    that writes them to ``output_dir``, one ``<field>_<chunk>.npy`` file per
+    field, or one ``chunk_<chunk>.npz`` archive per chunk when compressed,
+    while recording continues into the next buffer of the ring. If the writer
+    falls behind by ``num_buffers`` chunks, recording waits for it instead of
+    dropping data, which is counted in ``stalls``.
+
+    By default the recorder registers a physics callback so every step of
+    ``loop()`` is recorded; with ``attach=False`` call ``record()`` after
+    stepping instead. Read the output with ``TrajectoryReader``.
+    """
+
+    def __init__(
+        self,
+        simulator,
+        output_dir: str,
+        fields: Sequence[str] = TRAJECTORY_FIELDS,
+        chunk_size: int = 10000,
+        num_buffers: int = 4,
+        compress: bool = False,
+        period: int = 1,
+        attach: bool = True,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            simulator: Initialized MujocoSimulator to record
+            output_dir: Directory receiving the chunks, created if missing
+            fields: MjData fields to record, among TRAJECTORY_FIELDS
+            chunk_size: Number of steps per chunk file
+            num_buffers: Number of chunk buffers in the ring
+            compress: Whether to write compressed .npz chunks instead of .npy files
+            period: Record every `period` physics steps when attached
+            attach: Whether to record from a physics callback
+
+        Raises:
+            ValueError: If a field is unknown or a size is not positive
+        """
+        unknown = set(fields) - set(TRAJECTORY_FIELDS)
+        if unknown:
+            raise ValueError(
+                f"Unknown trajectory fields {sorted(unknown)}, expected some of {TRAJECTORY_FIELDS}"
+            )
+        if chunk_size < 1 or num_buffers < 1 or period < 1:
+            raise ValueError("chunk_size, num_buffers and period must be positive")
+
+        self.simulator = simulator
+        self.output_dir = output_dir
+        self.fields = tuple(fields)
+        self.chunk_size = chunk_size
+        self.num_buffers = num_buffers
+        self.compress = compress
+        self.period = period
+        self.attach = attach
+        self.callback_name = f"trajectory_recorder_{id(self)}"
+
+        self.num_samples = 0
+        self.num_chunks = 0
+        self.stalls = 0
+        self._buffers = []
+        self._free = None
+        self._pending = None
+        self._writer = None
+        self._writer_error = None
+        self._shapes = {}
+        self._current = None
+        self._row = 0
+        self._recording = False
+
+    def _field_shapes(self) -> Dict[str, tuple]:
+        model = self.simulator.model._model
+        sizes = {
+            "qpos": model.nq,
+            "qvel": model.nv,
+            "ctrl": model.nu,
+            "act": model.na,
+            "sensordata": model.nsensordata,
+        }
+        return {
+            field: () if field == "time" else (sizes[field],) for field in self.fields
+        }
+
+    def start(self):
+        """Allocate the chunk buffers, start the writer thread and attach to the simulator.
+
+        Raises:
+            RuntimeError: If the recorder is already recording
+        """
+        if self._recording:
+            raise RuntimeError("Trajectory recorder is already recording")
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._shapes = self._field_shapes()
+        self._buffers = [
+            {
+                field: np.zeros((self.chunk_size,) + shape)
+                for field, shape in self._shapes.items()
+            }
+            for _ in range(self.num_buffers)
+        ]
+        self._free = queue.Queue()
+        for index in range(1, self.num_buffers):
+            self._free.put(index)
+        self._pending = queue.Queue()
+        self._current = 0
+        self._row = 0
+        self.num_samples = 0
+        self.num_chunks = 0
+        self.stalls = 0
+        self._writer_error = None
+
+        self._write_metadata(complete=False)
+        self._writer = threading.Thread(
+            target=self._write_chunks, name="trajectory_writer", daemon=True
+        )
+        self._writer.start()
+        self._recording = True
+
+        if self.attach:
+            # Run after every other post-step callback so their effects are recorded
+            self.simulator.add_physics_callback(
+                self.callback_name,
+                self.record,
+                period=self.period,
+                priority=float("inf"),
+            )
+
+    def record(self):
+        """Append the current state of the simulator to the trajectory."""
+        data = self.simulator.data._data
+        buffer = self._buffers[self._current]
+        row = self._row
+        for field, array in buffer.items():
+            if field == "time":
+                array[row] = data.time
+            else:
+                np.copyto(array[row], getattr(data, field))
+        self._row += 1
+        self.num_samples += 1
+        if self._row == self.chunk_size:
+            self._hand_over_chunk()
+
+    def _hand_over_chunk(self):
+        self._pending.put((self._current, self._row, self.num_chunks))
+        self.num_chunks += 1
+        self._row = 0
+        try:
+            self._current = self._free.get_nowait()
+        except queue.Empty:
+            # The writer is behind by a full ring, wait rather than drop data
+            self.stalls += 1
+            self._current = self._free.get()
+
+    def _write_chunks(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            index, rows, chunk = item
+            try:
+                if self._writer_error is None:
+                    self._write_chunk(self._buffers[index], rows, chunk)
+            except Exception as e:
+                self._writer_error = e
+            finally:
+                self._free.put(index)
+
+    def _write_chunk(self, buffer: Dict[str, np.ndarray], rows: int, chunk: int):
+        if self.compress:
+            path = os.path.join(self.output_dir, f"chunk_{chunk:06d}.npz")
+            arrays = {field: array[:rows] for field, array in buffer.items()}
+            with open(path + ".tmp", "wb") as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(path + ".tmp", path)
+            return
+        for field, array in buffer.items():
+            path = os.path.join(self.output_dir, f"{field}_{chunk:06d}.npy")
+            with open(path + ".tmp", "wb") as f:
+                np.save(f, array[:rows])
+            os.replace(path + ".tmp", path)
+
+    def _write_metadata(self, complete: bool):
+        metadata = {
+            "fields": {field: list(shape) for field, shape in self._shapes.items()},
+            "timestep": float(self.simulator.model._model.opt.timestep),
+            "period": self.period,
+            "chunk_size": self.chunk_size,
+            "compress": self.compress,
+            "num_samples": self.num_samples,
+            "num_chunks": self.num_chunks,
+            "complete": complete,
+        }
+        with open(os.path.join(self.output_dir, _METADATA_FILE), "w") as f:
+            json.dump(metadata, f, indent=2)
+
+    def stop(self):
+        """Detach from the simulator, flush the partial chunk and wait for the writer.
+
+        Raises:
+            OSError: If writing a chunk failed
+        """
+        if not self._recording:
+            return
+        self._recording = False
+        if self.attach and self.simulator.physics_callback_exists(self.callback_name):
+            self.simulator.remove_physics_callback(self.callback_name)
+        if self._row:
+            self._pending.put((self._current, self._row, self.num_chunks))
+            self.num_chunks += 1
+            self._row = 0
+        self._pending.put(None)
+        self._writer.join()
+        self._buffers = []
+
+        if self._writer_error is not None:
+            raise self._writer_error
+        self._write_metadata(complete=True)
+
+    def is_recording(self) -> bool:
+        """Check whether the recorder is recording.
+
+        Returns:
+            bool: True between start() and stop()
+        """
+        return self._recording
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.stop()
+
+
+class TrajectoryReader:
+    """Read a trajectory written by TrajectoryRecorder.
+
+    Uncompressed chunks are memory-mapped, so only the rows that are accessed
+    are loaded from disk. Compressed chunks are decompressed one at a time.
+    """
+
+    def __init__(self, path: str):
+        """Open a recorded trajectory.
+
+        Args:
+            path: Output directory of the recorder
+
+        Raises:
+            FileNotFoundError: If the directory holds no trajectory metadata
+        """
+        self.path = path
+        with open(os.path.join(path, _METADATA_FILE)) as f:
+            self.metadata = json.load(f)
+        self.fields = tuple(self.metadata["fields"])
+        self.compress = self.metadata["compress"]
+        # Count chunks on disk, a run that was not stopped has no final count
+        pattern = "chunk_*.npz" if self.compress else f"{self.fields[0]}_*.npy"
+        self.num_chunks = len(glob.glob(os.path.join(path, pattern)))
+        # Every chunk but the last one is full
+        lengths = [self.metadata["chunk_size"]] * self.num_chunks
+        if self.num_chunks:
+            lengths[-1] = len(self.chunk(self.fields[0], self.num_chunks - 1))
+        self._offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def chunk(self, field: str, index: int) -> np.ndarray:
+        """Get one chunk of a field.
+
+        Args:
+            field: Recorded field name
+            index: Chunk index
+
+        Returns:
+            np.ndarray: Read-only memory map, or a loaded array for compressed chunks
+        """
+        if field not in self.fields:
+            raise KeyError(f"Field '{field}' was not recorded, available: {self.fields}")
+        if self.compress:
+            with np.load(os.path.join(self.path, f"chunk_{index:06d}.npz")) as archive:
+                return archive[field]
+        return np.load(
+            os.path.join(self.path, f"{field}_{index:06d}.npy"), mmap_mode="r"
+        )
+
+    def chunks(self, field: str) -> Iterator[np.ndarray]:
+        """Iterate over the chunks of a field.
+
+        Args:
+            field: Recorded field name
+
+        Yields:
+            np.ndarray: Successive chunks, see chunk()
+        """
+        for index in range(self.num_chunks):
+            yield self.chunk(field, index)
+
+    def read(self, field: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Read a range of samples of a field, touching only the chunks it spans.
+
+        Args:
+            field: Recorded field name
+            start: First sample index
+            stop: End sample index (exclusive), None reads to the end
+
+        Returns:
+            np.ndarray: Array of shape (stop - start, ...)
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        first = max(int(np.searchsorted(self._offsets, start, side="right")) - 1, 0)
+        parts = []
+        for index in range(first, self.num_chunks):
+            offset = self._offsets[index]
+            if offset >= stop:
+                break
+            chunk = self.chunk(field, index)
+            parts.append(chunk[max(start - offset, 0):stop - offset])
+        if not parts:
+            shape = tuple(self.metadata["fields"][field])
+            return np.empty((0,) + shape)
+        return np.concatenate(parts)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.read(field)
@@ -0,0 +1,205 @@
+#####################################################################################
+#
+# Description: Kinematic replay of recorded trajectories for offline re-rendering
+# Date: 2026-10-18
+#
+#####################################################################################
+
+from typing import Dict, Iterator, Optional, Sequence, Tuple, Union
+
+import mujoco
+import numpy as np
+
+from physics_simulator.simulator.recorder import TrajectoryReader
+
+
+class KinematicReplay:
+    """Replay recorded ``qpos`` through a simulator without running dynamics.
+
+    Every frame only sets ``qpos`` (and ``time``) and runs the position
+    stage needed for rendering: ``mj_kinematics``, ``mj_comPos`` and
+    ``mj_camlight``, or the full ``mj_forward`` when sensors or contacts are
+    needed. This is much faster than stepping physics, so datasets can be
+    re-rendered from new viewpoints or with segmentation when camera configs
+    change.
+
+    The simulator state is saved when the replay is entered and restored when
+    it exits, so a live simulation can be replayed into and resumed.
+    """
+
+    def __init__(
+        self,
+        simulator,
+        trajectory: Union[TrajectoryReader, str, np.ndarray],
+        times: Optional[np.ndarray] = None,
+        forward: bool = False,
+    ):
+        """Initialize the replay.
+
+        Args:
+            simulator: Initialized MujocoSimulator with the recorded scene
+            trajectory: TrajectoryReader, path of a recording, or (T, nq) qpos array
+            times: Simulation time of every frame for qpos arrays, defaults to frame * timestep
+            forward: Whether to run mj_forward instead of the kinematics stages only
+
+        Raises:
+            ValueError: If the recorded qpos does not match the model
+        """
+        if isinstance(trajectory, str):
+            trajectory = TrajectoryReader(trajectory)
+        if isinstance(trajectory, TrajectoryReader):
+            if "qpos" not in trajectory.fields:
+                raise ValueError("The recording has no qpos field to replay")
+            nq = trajectory.metadata["fields"]["qpos"][0]
+        else:
+            trajectory = np.asarray(trajectory, dtype=np.float64)
+            if trajectory.ndim != 2:
+                raise ValueError(f"qpos must have shape (T, nq), got {trajectory.shape}")
+            nq = trajectory.shape[1]
+            if times is not None and len(times) != len(trajectory):
+                raise ValueError("times must have one entry per qpos row")
+        if nq != simulator.model.nq:
+            raise ValueError(
+                f"Recorded qpos has {nq} entries but the model has nq={simulator.model.nq}"
+            )
+
+        self.simulator = simulator
+        self.trajectory = trajectory
+        self.times = times
+        self.forward = forward
+        self.frame = None
+        self._saved_state = None
+
+    def __len__(self) -> int:
+        return len(self.trajectory)
+
+    def __enter__(self):
+        self._saved_state = self.simulator.save_state()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.simulator.restore_state(self._saved_state)
+        self._saved_state = None
+
+    def _read(self, start: int, stop: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Read qpos and time of the frames in [start, stop)."""
+        if isinstance(self.trajectory, TrajectoryReader):
+            qpos = self.trajectory.read("qpos", start, stop)
+            if "time" in self.trajectory.fields:
+                times = self.trajectory.read("time", start, stop)
+            else:
+                metadata = self.trajectory.metadata
+                frame_dt = metadata["timestep"] * metadata["period"]
+                times = frame_dt * np.arange(start + 1, stop + 1, dtype=np.float64)
+            return qpos, times
+        qpos = self.trajectory[start:stop]
+        if self.times is not None:
+            return qpos, np.asarray(self.times[start:stop], dtype=np.float64)
+        timestep = self.simulator.get_physics_dt()
+        return qpos, timestep * np.arange(start, stop, dtype=np.float64)
+
+    def _apply(self, qpos: np.ndarray, time: float):
+        model = self.simulator.model._model
+        data = self.simulator.data._data
+        data.qpos[:] = qpos
+        data.time = time
+        if self.forward:
+            mujoco.mj_forward(model, data)
+        else:
+            mujoco.mj_kinematics(model, data)
+            mujoco.mj_comPos(model, data)
+            mujoco.mj_camlight(model, data)
+        self.simulator._scene_changed()
+
+    def seek(self, frame: int):
+        """Pose the scene at a recorded frame.
+
+        Args:
+            frame: Frame index, negative values count from the end
+
+        Raises:
+            IndexError: If the frame is out of range
+        """
+        if frame < 0:
+            frame += len(self)
+        if not 0 <= frame < len(self):
+            raise IndexError(f"Frame {frame} out of range for {len(self)} frames")
+        qpos, times = self._read(frame, frame + 1)
+        with self.simulator.lock:
+            self._apply(qpos[0], times[0])
+        self.frame = frame
+
+    def iter_frames(
+        self, start: int = 0, stop: Optional[int] = None, stride: int = 1, batch_size: int = 256
+    ) -> Iterator[int]:
+        """Pose the scene at every selected frame in turn.
+
+        Recorded qpos is read ``batch_size`` frames at a time.
+
+        Args:
+            start: First frame index
+            stop: End frame index (exclusive), None replays to the end
+            stride: Step between replayed frames
+            batch_size: Number of frames read from the recording at once
+
+        Yields:
+            int: Index of the frame the scene is posed at
+        """
+        if stride < 1 or batch_size < 1:
+            raise ValueError("stride and batch_size must be positive")
+        start, stop, _ = slice(start, stop).indices(len(self))
+        for batch_start in range(start, stop, stride * batch_size):
+            batch_stop = min(batch_start + stride * batch_size, stop)
+            qpos, times = self._read(batch_start, batch_stop)
+            for offset in range(0, batch_stop - batch_start, stride):
+                with self.simulator.lock:
+                    self._apply(qpos[offset], times[offset])
+                self.frame = batch_start + offset
+                yield self.frame
+
+    def render_batches(
+        self,
+        prim_paths: Sequence[str],
+        start: int = 0,
+        stop: Optional[int] = None,
+        stride: int = 1,
+        batch_size: int = 32,
+        method: str = "get_rgb",
+    ) -> Iterator[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+        """Render cameras over a range of frames, ``batch_size`` frames at a time.
+
+        Every camera writes into a preallocated ``(batch_size, ...)`` array
+        that is reused between batches, copy the arrays to keep them.
+
+        Args:
+            prim_paths: Camera prim paths to render
+            start: First frame index
+            stop: End frame index (exclusive), None replays to the end
+            stride: Step between rendered frames
+            batch_size: Number of frames per yielded batch
+            method: Camera method producing the data, e.g. "get_rgb",
+                "get_segmentation" or "get_depth"
+
+        Yields:
+            tuple: Frame indices of the batch, and per prim path an array of
+                shape (len(frames), ...)
+        """
+        cameras = {prim_path: self.simulator.get_sensor(prim_path) for prim_path in prim_paths}
+        outputs = {}
+        frames = np.empty(batch_size, dtype=np.int64)
+        count = 0
+        for frame in self.iter_frames(start, stop, stride, batch_size=batch_size):
+            for prim_path, camera in cameras.items():
+                image = getattr(camera, method)()
+                if prim_path not in outputs:
+                    outputs[prim_path] = np.empty((batch_size,) + image.shape, dtype=image.dtype)
+                outputs[prim_path][count] = image
+            frames[count] = frame
+            count += 1
+            if count == batch_size:
+                yield frames.copy(), outputs
+                count = 0
+        if count:
+            yield frames[:count].copy(), {
+                prim_path: output[:count] for prim_path, output in outputs.items()
+            }
@@ -0,0 +1,274 @@
+#####################################################################################
+#
+# Description: Batched ray casting and geom distance queries against the scene
+# Date: 2026-10-18
+#
+#####################################################################################
+
+from typing import NamedTuple, Optional, Sequence, Union
+
+import mujoco
+import numpy as np
+
+
+class RayHits(NamedTuple):
+    """Results of a ray batch, one row per ray."""
+
+    distance: np.ndarray  # (N,) metric distance to the hit, -1 on a miss
+    geom_id: np.ndarray  # (N,) hit geom id, -1 on a miss
+    point: np.ndarray  # (N, 3) world hit point, NaN on a miss
+
+
+class GeomDistances(NamedTuple):
+    """Results of a geom pair batch, one row per pair."""
+
+    distance: np.ndarray  # (P,) signed distance, distmax when farther apart
+    fromto: np.ndarray  # (P, 6) closest points on the first and the second geom, if within distmax
+
+
+class SceneQuery:
+    """Ray and distance queries against the current simulation state.
+
+    Rays are cast with ``mj_multiRay``, which intersects many rays from a
+    single origin in one call. Origins of a batch are grouped with
+    ``np.unique`` so a lidar-like batch (one origin, thousands of directions)
+    is a single MuJoCo call. MuJoCo has no multi-origin ray call, so batches
+    with many distinct origins (e.g. one ray per robot) still cost one
+    ``mj_multiRay`` call per origin from a Python loop. Outputs are written into buffers reused across calls, which only
+    grow when a batch is larger than ever before; the returned arrays are views
+    that the next query of the same kind overwrites unless ``copy=True``.
+
+    Queries read ``simulator.model`` and ``simulator.data`` at call time, so
+    the same instance stays valid across runtime scene edits.
+    """
+
+    def __init__(self, simulator):
+        """Initialize the query service.
+
+        Args:
+            simulator: MujocoSimulator to query
+        """
+        self.simulator = simulator
+        self._ray_buffers = self._allocate_ray_buffers(0)
+        self._distance_buffers = GeomDistances(np.empty(0), np.empty((0, 6)))
+
+    @staticmethod
+    def _allocate_ray_buffers(size: int) -> dict:
+        return {
+            "directions": np.empty((size, 3)),
+            "sorted_directions": np.empty((size, 3)),
+            "sorted_distance": np.empty(size),
+            "sorted_geom_id": np.empty(size, dtype=np.int32),
+            "distance": np.empty(size),
+            "geom_id": np.empty(size, dtype=np.int32),
+            "point": np.empty((size, 3)),
+        }
+
+    def _resolve_body(self, exclude_body: Union[int, str, None]) -> int:
+        if exclude_body is None:
+            return -1
+        if isinstance(exclude_body, str):
+            simulator = self.simulator
+            if exclude_body in simulator._robots:
+                return simulator._robots[exclude_body]["instance"].root_body_id
+            if exclude_body in simulator._objects:
+                obj = simulator._objects[exclude_body]["instance"]
+                return simulator.model.body_name2id(f"{obj.naming_prefix}main")
+            raise KeyError(f"No robot or object registered at '{exclude_body}'")
+        return int(exclude_body)
+
+    def cast_rays(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        max_distance: Optional[float] = None,
+        geomgroup: Optional[Sequence[bool]] = None,
+        include_static: bool = True,
+        exclude_body: Union[int, str, None] = None,
+        copy: bool = False,
+    ) -> RayHits:
+        """Cast a batch of rays against the scene.
+
+        Rays sharing an origin are cast together, the cost grows with the
+        number of distinct origins (one MuJoCo call each).
+
+        Args:
+            origins: (N, 3) ray origins, or (3,) shared by all rays
+            directions: (N, 3) ray directions, normalized internally
+            max_distance: Rays hitting nothing closer report a miss, defaults to unlimited
+            geomgroup: 6 flags, only geoms of enabled groups are hit. Defaults to all groups
+            include_static: If False, geoms attached to the world body are ignored
+            exclude_body: Body id, or robot/object prim path whose root body is
+                ignored, e.g. the body the sensor is mounted on
+            copy: If True, return independent arrays
+
+        Returns:
+            RayHits: (distance, geom_id, point) in ray order
+
+        Raises:
+            ValueError: If origins and directions do not have matching shapes
+            KeyError: If exclude_body is an unknown prim path
+        """
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        origins = np.asarray(origins, dtype=np.float64)
+        num_rays = len(directions)
+        if origins.shape == (3,):
+            origins = origins[None]
+        elif origins.shape != (num_rays, 3):
+            raise ValueError(
+                f"origins must have shape (3,) or ({num_rays}, 3), got {origins.shape}"
+            )
+
+        if len(self._ray_buffers["distance"]) < num_rays:
+            self._ray_buffers = self._allocate_ray_buffers(
+                max(num_rays, 2 * len(self._ray_buffers["distance"]))
+            )
+        buffers = {key: array[:num_rays] for key, array in self._ray_buffers.items()}
+        if geomgroup is not None:
+            geomgroup = np.asarray(geomgroup, dtype=np.uint8)
+        body_id = self._resolve_body(exclude_body)
+
+        # Unit directions make mj_multiRay distances metric, zero directions always miss
+        unit_directions = buffers["directions"]
+        norms = np.linalg.norm(directions, axis=1, keepdims=True)
+        unit_directions.fill(0.0)
+        np.divide(directions, norms, out=unit_directions, where=norms > 0)
+
+        # Sort the rays by origin so every origin casts one contiguous block
+        if len(origins) == 1:
+            unique_origins, order = origins, None
+            bounds = (0, num_rays)
+            sorted_directions = unit_directions
+        else:
+            unique_origins, inverse = np.unique(origins, axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            order = np.argsort(inverse, kind="stable")
+            bounds = np.concatenate(([0], np.cumsum(np.bincount(inverse))))
+            sorted_directions = np.take(
+                unit_directions, order, axis=0, out=buffers["sorted_directions"]
+            )
+
+        if order is None:
+            distance, geom_id = buffers["distance"], buffers["geom_id"]
+        else:
+            distance, geom_id = buffers["sorted_distance"], buffers["sorted_geom_id"]
+        with self.simulator.lock:
+            model, data = self.simulator.model._model, self.simulator.data._data
+            for i, origin in enumerate(unique_origins):
+                start, stop = bounds[i], bounds[i + 1]
+                if start == stop:
+                    continue
+                mujoco.mj_multiRay(
+                    model,
+                    data,
+                    origin,
+                    sorted_directions[start:stop].reshape(-1),
+                    geomgroup,
+                    int(include_static),
+                    body_id,
+                    geom_id[start:stop],
+                    distance[start:stop],
+                    stop - start,
+                    mujoco.mjMAXVAL,
+                )
+
+        if order is not None:
+            buffers["distance"][order] = distance
+            buffers["geom_id"][order] = geom_id
+        # mj_multiRay's cutoff culls geoms by bounding sphere and misses planes, filter exactly instead
+        if max_distance is not None:
+            too_far = buffers["distance"] > max_distance
+            buffers["distance"][too_far] = -1.0
+            buffers["geom_id"][too_far] = -1
+        point = buffers["point"]
+        np.multiply(unit_directions, buffers["distance"][:, None], out=point)
+        point += origins
+        point[buffers["geom_id"] < 0] = np.nan
+
+        hits = RayHits(buffers["distance"], buffers["geom_id"], point)
+        if copy:
+            return RayHits(*(array.copy() for array in hits))
+        return hits
+
+    def geom_distances(
+        self, geom_pairs: np.ndarray, distmax: float = 1.0, copy: bool = False
+    ) -> GeomDistances:
+        """Compute signed distances between geom pairs with mj_geomDistance.
+
+        Args:
+            geom_pairs: (P, 2) geom ids
+            distmax: Pairs farther apart report distmax, larger values cost more
+            copy: If True, return independent arrays
+
+        Returns:
+            GeomDistances: (distance, fromto) in pair order, negative distances
+                are penetrations
+
+        Raises:
+            ValueError: If geom_pairs does not have shape (P, 2)
+        """
+        geom_pairs = np.asarray(geom_pairs, dtype=np.intp)
+        if geom_pairs.ndim != 2 or geom_pairs.shape[1] != 2:
+            raise ValueError(f"geom_pairs must have shape (P, 2), got {geom_pairs.shape}")
+        num_pairs = len(geom_pairs)
+        if len(self._distance_buffers.distance) < num_pairs:
+            size = max(num_pairs, 2 * len(self._distance_buffers.distance))
+            self._distance_buffers = GeomDistances(np.empty(size), np.empty((size, 6)))
+        distance = self._distance_buffers.distance[:num_pairs]
+        fromto = self._distance_buffers.fromto[:num_pairs]
+
+        with self.simulator.lock:
+            model, data = self.simulator.model._model, self.simulator.data._data
+            for i, (geom1, geom2) in enumerate(geom_pairs):
+                distance[i] = mujoco.mj_geomDistance(
+                    model, data, geom1, geom2, distmax, fromto[i]
+                )
+        # Pairs whose bounding volumes are farther apart than distmax report mjMAXVAL
+        np.minimum(distance, distmax, out=distance)
+
+        if copy:
+            return GeomDistances(distance.copy(), fromto.copy())
+        return GeomDistances(distance, fromto)
+
+    def get_geom_ids(self, prim_path: str) -> np.ndarray:
+        """Get the ids of all geoms of a robot or object.
+
+        Args:
+            prim_path: Robot or object prim path
+
+        Returns:
+            np.ndarray: Sorted geom ids
+
+        Raises:
+            KeyError: If the prim path is not a robot or object
+        """
+        prim_paths, geom_entity = self.simulator._get_contact_entities()
+        if prim_path not in prim_paths:
+            raise KeyError(f"No robot or object registered at '{prim_path}'")
+        return np.flatnonzero(geom_entity[:-1] == prim_paths.index(prim_path))
+
+    def entity_distance(
+        self, prim_path1: str, prim_path2: str, distmax: float = 1.0
+    ) -> GeomDistances:
+        """Compute the smallest distance between two robots or objects over all their geom pairs.
+
+        Args:
+            prim_path1: First robot or object prim path
+            prim_path2: Second robot or object prim path
+            distmax: Entities farther apart report distmax
+
+        Returns:
+            GeomDistances: Scalar distance and (6,) fromto of the closest pair
+
+        Raises:
+            KeyError: If a prim path is not a robot or object
+            ValueError: If an entity has no geoms
+        """
+        geoms1, geoms2 = self.get_geom_ids(prim_path1), self.get_geom_ids(prim_path2)
+        for prim_path, geoms in ((prim_path1, geoms1), (prim_path2, geoms2)):
+            if len(geoms) == 0:
+                raise ValueError(f"Entity '{prim_path}' has no geoms to measure distances from")
+        pairs = np.stack(np.meshgrid(geoms1, geoms2, indexing="ij"), axis=-1).reshape(-1, 2)
+        distances = self.geom_distances(pairs, distmax)
+        closest = np.argmin(distances.distance)
+        return GeomDistances(distances.distance[closest].copy(), distances.fromto[closest].copy())
@@ -0,0 +1,191 @@
+#####################################################################################
+#
+# Description: Fixed-rate real-time scheduler driving the MuJoCo simulation loop
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import math
+import time
+from typing import Callable, Optional
+
+
+class RealTimeScheduler:
+    """Fixed-rate scheduler stepping a simulator against the wall clock.
+
+    Physics steps are laid on an absolute wall-clock schedule derived from the
+    physics timestep and the real-time factor, so sleep jitter does not
+    accumulate as drift. When the loop falls behind, up to
+    ``max_catch_up_steps`` steps are run back to back per tick; anything beyond
+    that is dropped by shifting the schedule instead of trying to recover it.
+    Physics callbacks are dispatched per physics step at their own period, so
+    their rate only depends on simulation time and not on machine load.
+
+    A real-time factor of ``None`` (or ``math.inf``) steps as fast as possible.
+    """
+
+    def __init__(
+        self,
+        simulator,
+        real_time_factor: Optional[float] = 1.0,
+        max_catch_up_steps: int = 10,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            simulator: Initialized MujocoSimulator to drive
+            real_time_factor: Simulated seconds per wall-clock second, None runs as fast as possible
+            max_catch_up_steps: Maximum number of steps run in one tick when behind schedule,
+                also the batch size between viewer syncs when running as fast as possible
+            clock: Monotonic wall clock in seconds
+            sleep: Function used to wait for the next deadline
+
+        Raises:
+            ValueError: If real_time_factor or max_catch_up_steps is not positive
+        """
+        if real_time_factor is not None and real_time_factor <= 0:
+            raise ValueError(
+                f"real_time_factor must be positive or None, got {real_time_factor}"
+            )
+        if max_catch_up_steps < 1:
+            raise ValueError(
+                f"max_catch_up_steps must be positive, got {max_catch_up_steps}"
+            )
+
+        self.simulator = simulator
+        self.real_time_factor = real_time_factor
+        self.max_catch_up_steps = max_catch_up_steps
+        self._clock = clock
+        self._sleep = sleep
+        self._stop_requested = False
+        self._reset_stats()
+
+    @property
+    def as_fast_as_possible(self) -> bool:
+        """Whether the scheduler ignores the wall clock."""
+        return self.real_time_factor is None or math.isinf(self.real_time_factor)
+
+    def _reset_stats(self):
+        self._steps = 0
+        self._ticks = 0
+        self._overruns = 0
+        self._dropped_steps = 0
+        self._lag_sum = 0.0
+        self._max_lag = 0.0
+        self._wall_time = 0.0
+        self._sim_time = 0.0
+
+    def stop(self):
+        """Request the running loop to return after the current tick."""
+        self._stop_requested = True
+
+    def _run_steps(self, num_steps: int) -> int:
+        """Run physics steps one at a time, dispatching due callbacks at each."""
+        simulator = self.simulator
+        done = 0
+        for _ in range(num_steps):
+            # Callbacks or a signal handler may close the simulator mid-tick
+            if not simulator.is_running() or self._stop_requested:
+                break
+            simulator._physics_step()
+            done += 1
+
+        if done and simulator.is_running():
+            simulator._sync_viewer()
+        return done
+
+    def run(self, duration: Optional[float] = None, max_steps: Optional[int] = None) -> dict:
+        """Step the simulator until it is closed, stopped or a limit is reached.
+
+        Args:
+            duration: Simulated seconds to run, None runs without limit
+            max_steps: Maximum number of physics steps, None runs without limit
+
+        Returns:
+            dict: Run statistics, see ``get_stats()``
+
+        Raises:
+            RuntimeError: If the simulator is not running
+        """
+        if not self.simulator.is_running():
+            raise RuntimeError(
+                "Simulator is not running, please call initialize() first"
+            )
+
+        timestep = self.simulator.get_physics_dt()
+        step_limit = math.inf
+        if duration is not None:
+            step_limit = int(round(duration / timestep))
+        if max_steps is not None:
+            step_limit = min(step_limit, max_steps)
+
+        self._reset_stats()
+        self._stop_requested = False
+        wall_period = 0.0 if self.as_fast_as_possible else timestep / self.real_time_factor
+        start = self._clock()
+        # Wall time at which the step counter was zero, shifted when steps are dropped
+        origin = start
+
+        while (
+            self.simulator.is_running()
+            and not self._stop_requested
+            and self._steps < step_limit
+        ):
+            if self.as_fast_as_possible:
+                due = self.max_catch_up_steps
+            else:
+                now = self._clock()
+                due = int((now - origin) / wall_period) - self._steps
+                if due <= 0:
+                    self._sleep(origin + (self._steps + 1) * wall_period - now)
+                    continue
+
+                lag = now - (origin + (self._steps + 1) * wall_period)
+                self._lag_sum += lag
+                self._max_lag = max(self._max_lag, lag)
+                if due > 1:
+                    self._overruns += 1
+                if due > self.max_catch_up_steps:
+                    dropped = due - self.max_catch_up_steps
+                    self._dropped_steps += dropped
+                    origin += dropped * wall_period
+                    due = self.max_catch_up_steps
+
+            due = int(min(due, step_limit - self._steps))
+            self._steps += self._run_steps(due)
+            self._ticks += 1
+
+        self._wall_time = self._clock() - start
+        self._sim_time = self._steps * timestep
+        return self.get_stats()
+
+    def get_stats(self) -> dict:
+        """Get statistics of the last run.
+
+        Returns:
+            dict: Statistics containing:
+                - steps: Physics steps executed
+                - ticks: Scheduler ticks, each running one or more steps
+                - overruns: Ticks that started more than one step period late
+                - dropped_steps: Steps skipped because the catch-up limit was hit
+                - mean_lag: Mean delay of ticks behind their deadline in seconds
+                - max_lag: Largest delay behind a deadline in seconds
+                - sim_time: Simulated seconds advanced
+                - wall_time: Wall-clock seconds elapsed
+                - real_time_factor: Achieved simulated seconds per wall-clock second
+        """
+        return {
+            "steps": self._steps,
+            "ticks": self._ticks,
+            "overruns": self._overruns,
+            "dropped_steps": self._dropped_steps,
+            "mean_lag": self._lag_sum / self._ticks if self._ticks else 0.0,
+            "max_lag": self._max_lag,
+            "sim_time": self._sim_time,
+            "wall_time": self._wall_time,
+            "real_time_factor": (
+                self._sim_time / self._wall_time if self._wall_time > 0 else math.inf
+            ),
+        }
@@ -0,0 +1,204 @@
+#####################################################################################
+#
+# Description: Compiled flat state vector layout with zero-copy named views
+# Date: 2026-10-18
+#
+#####################################################################################
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import mujoco
+import numpy as np
+
+# MjData arrays the state vector is gathered from
+_SOURCES = ("qpos", "qvel", "xpos", "xquat", "cam_xpos", "cam_xmat")
+
+# Reorders a wxyz quaternion to xyzw
+_WXYZ_TO_XYZW = np.array([1, 2, 3, 0])
+
+
+class StateSchema:
+    """Layout of robot, object and sensor states in one flat vector.
+
+    The schema is compiled once from the scene: every prim path gets a
+    contiguous range of the vector per field, and for every MjData source
+    array the flat source indices and vector positions are precomputed, with
+    quaternions reordered to xyzw by the indices themselves. ``gather()`` then
+    fills the vector with one fancy-indexed copy per source array, so the
+    Python work per step does not depend on the size of the scene, and
+    ``views`` exposes every field as a zero-copy view of the vector.
+
+    Fields per entity:
+        robots: position (3), orientation (4, xyzw), joint_positions (J), joint_velocities (J)
+        objects: position (3), orientation (4, xyzw)
+        cameras: position (3), rotation_matrix (9, row-major)
+
+    The schema must be recompiled after the scene is edited at runtime.
+    """
+
+    def __init__(self, model: mujoco.MjModel, dtype=np.float64):
+        """Initialize an empty schema, use compile() to build one from a simulator.
+
+        Args:
+            model: Compiled model the indices refer to
+            dtype: Data type of the state vector, float32 or float64
+        """
+        self.model = model
+        self.dtype = np.dtype(dtype)
+        self.layout: "OrderedDict[str, Dict[str, slice]]" = OrderedDict()
+        self.size = 0
+        self._indices: Dict[str, Tuple[List[int], List[int]]] = {
+            source: ([], []) for source in _SOURCES
+        }
+        self._gather_plan = []
+        self.buffer = None
+        self.views = {}
+
+    @classmethod
+    def compile(
+        cls, simulator, prim_paths: Optional[Sequence[str]] = None, dtype=np.float64
+    ) -> "StateSchema":
+        """Compile the schema of registered robots, objects and sensors.
+
+        Args:
+            simulator: Initialized MujocoSimulator
+            prim_paths: Entities to include in this order, defaults to all
+                robots, then objects, then cameras
+            dtype: Data type of the state vector, float32 or float64
+
+        Returns:
+            StateSchema: The compiled schema
+
+        Raises:
+            KeyError: If a prim path is not registered
+            ValueError: If a robot joint is not in the model, or a sensor has no MuJoCo camera
+        """
+        model = simulator.model._model
+        schema = cls(model, dtype=dtype)
+        if prim_paths is None:
+            # Sensors without a MuJoCo camera have no pose to describe
+            cameras = [
+                prim_path
+                for prim_path, sensor in simulator._sensors.items()
+                if schema._camera_id(sensor["instance"]) >= 0
+            ]
+            prim_paths = list(simulator._robots) + list(simulator._objects) + cameras
+
+        for prim_path in prim_paths:
+            if prim_path in simulator._robots:
+                schema._add_robot(prim_path, simulator._robots[prim_path]["instance"])
+            elif prim_path in simulator._objects:
+                obj = simulator._objects[prim_path]["instance"]
+                body_id = simulator.model.body_name2id(f"{obj.naming_prefix}main")
+                schema._add_body_pose(prim_path, body_id)
+            elif prim_path in simulator._sensors:
+                schema._add_camera(prim_path, simulator._sensors[prim_path]["instance"])
+            else:
+                raise KeyError(f"No robot, object or sensor registered at '{prim_path}'")
+
+        schema._finalize()
+        return schema
+
+    def _add_field(self, prim_path: str, field: str, source: str, source_indices) -> None:
+        source_indices = list(source_indices)
+        start = self.size
+        self.size += len(source_indices)
+        self.layout.setdefault(prim_path, OrderedDict())[field] = slice(start, self.size)
+        src, dst = self._indices[source]
+        src.extend(int(index) for index in source_indices)
+        dst.extend(range(start, self.size))
+
+    def _add_body_pose(self, prim_path: str, body_id: int):
+        self._add_field(prim_path, "position", "xpos", 3 * body_id + np.arange(3))
+        self._add_field(prim_path, "orientation", "xquat", 4 * body_id + _WXYZ_TO_XYZW)
+
+    def _add_robot(self, prim_path: str, robot):
+        self._add_body_pose(prim_path, robot.root_body_id)
+        # Raises ValueError for joints missing from the model
+        table = robot.get_joint_index_table()
+        self._add_field(prim_path, "joint_positions", "qpos", table.qpos)
+        self._add_field(prim_path, "joint_velocities", "qvel", table.dof)
+
+    def _camera_id(self, sensor) -> int:
+        """Id of the compiled camera of a sensor, -1 for sensors without a camera."""
+        camera_name = getattr(getattr(sensor, "sensor_model", None), "camera_name", None)
+        if camera_name is None:
+            return -1
+        return mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_CAMERA, camera_name)
+
+    def _add_camera(self, prim_path: str, sensor):
+        camera_id = self._camera_id(sensor)
+        if camera_id < 0:
+            raise ValueError(f"Sensor '{prim_path}' has no MuJoCo camera to describe")
+        self._add_field(prim_path, "position", "cam_xpos", 3 * camera_id + np.arange(3))
+        self._add_field(prim_path, "rotation_matrix", "cam_xmat", 9 * camera_id + np.arange(9))
+
+    def _finalize(self):
+        self._gather_plan = [
+            (source, np.asarray(src, dtype=np.intp), np.asarray(dst, dtype=np.intp))
+            for source, (src, dst) in self._indices.items()
+            if src
+        ]
+        self.buffer = np.zeros(self.size, dtype=self.dtype)
+        self.views = self.make_views(self.buffer)
+
+    def make_views(self, vector: np.ndarray) -> Dict[str, Dict[str, np.ndarray]]:
+        """Split a state vector, or a batch of them, into named views.
+
+        Args:
+            vector: Array whose last dimension is the schema size
+
+        Returns:
+            dict: prim path -> field -> zero-copy view of the vector
+        """
+        return {
+            prim_path: {field: vector[..., span] for field, span in fields.items()}
+            for prim_path, fields in self.layout.items()
+        }
+
+    def gather(self, data: mujoco.MjData, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Gather the state of a data instance into a flat vector.
+
+        Args:
+            data: mujoco.MjData of the compiled model
+            out: Vector to fill, defaults to ``buffer`` whose ``views`` stay valid
+
+        Returns:
+            np.ndarray: The filled vector of shape (size,)
+        """
+        if out is None:
+            out = self.buffer
+        for source, src, dst in self._gather_plan:
+            out[dst] = getattr(data, source).reshape(-1)[src]
+        return out
+
+    def gather_batch(
+        self, datas: Sequence[mujoco.MjData], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Gather the states of several data instances, e.g. vectorized environments.
+
+        Args:
+            datas: mujoco.MjData instances of the compiled model
+            out: Array of shape (len(datas), size) to fill
+
+        Returns:
+            np.ndarray: The filled array of shape (len(datas), size)
+        """
+        if out is None:
+            out = np.empty((len(datas), self.size), dtype=self.dtype)
+        for row, data in zip(out, datas):
+            self.gather(data, out=row)
+        return out
+
+    def describe(self) -> List[Tuple[str, str, int, int]]:
+        """List the layout of the vector.
+
+        Returns:
+            list: (prim_path, field, start, stop) for every field, in vector order
+        """
+        return [
+            (prim_path, field, span.start, span.stop)
+            for prim_path, fields in self.layout.items()
+            for field, span in fields.items()
+        ]
@@ -0,0 +1,337 @@
+#####################################################################################
+#
+# Description: Vectorized multi-environment MuJoCo simulator sharing one compiled model
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from physics_simulator.simulator.mujoco import MujocoSimulator
+from synthnova_config import PhysicsSimulatorConfig
+
+
+class VectorizedMujocoSimulator(MujocoSimulator):
+    """MuJoCo simulator that steps N environments on one compiled MjModel.
+
+    The scene is built exactly like for ``MujocoSimulator`` (``add_robot``,
+    ``add_object``, ``import_scenario``...). ``initialize()`` compiles the model
+    once and allocates ``num_envs`` MjData instances. Environment 0 is the
+    regular ``self.data`` so robots, sensors, the viewer and the offscreen
+    renderer keep working on it, while all environments are stepped in
+    parallel from a thread pool (``mj_step`` releases the GIL).
+
+    Batched state is exposed as ``(num_envs, ...)`` NumPy arrays through the
+    ``qpos``, ``qvel``, ``ctrl`` and ``time`` properties.
+
+    Runtime scene edits (``add_object``, ``remove_robot``...) recompile the
+    model: environment 0 keeps its state, environments 1..N-1 restart from a
+    copy of it and per-environment models from ``use_env_models()`` are
+    dropped.
+    """
+
+    def __init__(
+        self,
+        physics_simulator_config: PhysicsSimulatorConfig,
+        num_envs: int = 1,
+        num_threads: Optional[int] = None,
+    ):
+        """Initialize the vectorized simulator.
+
+        Args:
+            physics_simulator_config: Configuration object containing all simulator settings
+            num_envs: Number of environments (MjData instances) to simulate
+            num_threads: Number of worker threads, defaults to min(num_envs, cpu count)
+
+        Raises:
+            ValueError: If num_envs or num_threads is not positive
+        """
+        if num_envs < 1:
+            raise ValueError(f"num_envs must be positive, got {num_envs}")
+        if num_threads is not None and num_threads < 1:
+            raise ValueError(f"num_threads must be positive, got {num_threads}")
+
+        self.num_envs = num_envs
+        self.num_threads = num_threads or min(num_envs, os.cpu_count() or 1)
+        self._env_datas = []
+        self._env_models = []
+        self._env_chunks = []
+        self._executor = None
+        self._qpos_buffer = None
+        self._qvel_buffer = None
+        self._ctrl_buffer = None
+        self._time_buffer = None
+
+        super().__init__(physics_simulator_config)
+
+    def initialize(self):
+        """Initialize the shared model and allocate one MjData per environment.
+        Must be called before stepping the simulation."""
+        super().initialize()
+
+        with self.lock:
+            self._allocate_envs()
+
+            # Contiguous env slices, one per worker
+            self._env_chunks = [
+                chunk.tolist()
+                for chunk in np.array_split(np.arange(self.num_envs), self.num_threads)
+                if len(chunk) > 0
+            ]
+            if self._executor is None and len(self._env_chunks) > 1:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self._env_chunks),
+                    thread_name_prefix="mujoco_env",
+                )
+
+        self.logger.log_info(
+            f"Vectorized simulator initialized with {self.num_envs} environments "
+            f"on {len(self._env_chunks)} threads"
+        )
+
+    def _allocate_envs(self):
+        """Allocate environments 1..N-1 as copies of environment 0, and the batch buffers, for the current model."""
+        import copy
+        import mujoco
+
+        mujoco_model = self.model._model
+        # Environment 0 aliases the simulator's own data
+        self._env_datas = [self.data._data]
+        for _ in range(self.num_envs - 1):
+            env_data = copy.copy(self.data._data)
+            mujoco.mj_forward(mujoco_model, env_data)
+            self._env_datas.append(env_data)
+        self._env_models = [mujoco_model] * self.num_envs
+
+        self._qpos_buffer = np.zeros((self.num_envs, mujoco_model.nq))
+        self._qvel_buffer = np.zeros((self.num_envs, mujoco_model.nv))
+        self._ctrl_buffer = np.zeros((self.num_envs, mujoco_model.nu))
+        self._time_buffer = np.zeros(self.num_envs)
+
+    def _recompile(self):
+        """Recompile the world spec after a runtime scene edit and reallocate the environments.
+
+        Environment 0 keeps its state, environments 1..N-1 restart from a copy of
+        it and every environment steps the new shared model.
+        """
+        with self.lock:
+            super()._recompile()
+            self._allocate_envs()
+
+    def _step_chunk(self, env_ids: List[int], num_steps: int):
+        """Step a slice of environments, executed on a worker thread."""
+        import mujoco
+
+        for env_id in env_ids:
+            if env_id == 0:
+                # Sensors sample environment 0, the simulator's own data
+                self._step_data(num_steps)
+            else:
+                mujoco.mj_step(self._env_models[env_id], self._env_datas[env_id], num_steps)
+
+    def step(self, num_steps: int = 1, render: bool = True):
+        """Step all environments and sync the viewer with environment 0.
+
+        Step samplers (e.g. IMUs), the profiler and the published state
+        follow environment 0, like for MujocoSimulator.step().
+
+        Args:
+            num_steps: Number of physics steps to advance every environment
+            render: Ignored, kept for API compatibility
+        """
+        self._check_running()
+        if not render:
+            self.logger.log_warning("Render parameter is ignored in Mujoco")
+
+        with self.lock:
+            if self._executor is None:
+                self._step_chunk(self._env_chunks[0], num_steps)
+            else:
+                futures = [
+                    self._executor.submit(self._step_chunk, env_ids, num_steps)
+                    for env_ids in self._env_chunks
+                ]
+                for future in futures:
+                    future.result()
+            self._run_step_hooks()
+
+        self._sync_viewer()
+
+    def _check_running(self):
+        if not self._running:
+            raise RuntimeError(
+                "Simulator is not running, please call initialize() first"
+            )
+
+    def get_env_data(self, env_id: int):
+        """Get the raw mujoco.MjData of one environment.
+
+        Args:
+            env_id: Index of the environment
+
+        Returns:
+            mujoco.MjData: The data of the requested environment
+
+        Raises:
+            RuntimeError: If the simulator is not initialized
+        """
+        self._check_running()
+        return self._env_datas[env_id]
+
+    def get_env_model(self, env_id: int):
+        """Get the raw mujoco.MjModel stepping one environment.
+
+        Args:
+            env_id: Index of the environment
+
+        Returns:
+            mujoco.MjModel: The shared model, or the environment's own copy
+                after use_env_models()
+
+        Raises:
+            RuntimeError: If the simulator is not initialized
+        """
+        self._check_running()
+        return self._env_models[env_id]
+
+    def use_env_models(self):
+        """Give every environment but environment 0 its own copy of the model.
+
+        Model parameters (friction, masses, colors...) can then differ between
+        environments, e.g. for per-environment domain randomization. Environment
+        0 keeps ``self.model``, used by robots, sensors and the renderer.
+
+        Raises:
+            RuntimeError: If the simulator is not initialized
+        """
+        import copy
+
+        self._check_running()
+        with self.lock:
+            shared = self.model._model
+            self._env_models = [shared] + [
+                copy.copy(shared) if model is shared else model
+                for model in self._env_models[1:]
+            ]
+
+    def _resolve_env_ids(self, env_ids: Optional[Sequence[int]]) -> List[int]:
+        if env_ids is None:
+            return list(range(self.num_envs))
+        env_ids = [int(env_id) for env_id in np.atleast_1d(env_ids)]
+        for env_id in env_ids:
+            if not 0 <= env_id < self.num_envs:
+                raise IndexError(
+                    f"Environment index {env_id} out of range [0, {self.num_envs})"
+                )
+        return env_ids
+
+    def _gather(self, field: str, buffer: np.ndarray) -> np.ndarray:
+        with self.lock:
+            for env_id, env_data in enumerate(self._env_datas):
+                buffer[env_id] = getattr(env_data, field)
+        return buffer
+
+    def _scatter(self, field: str, values, env_ids: Optional[Sequence[int]]):
+        env_ids = self._resolve_env_ids(env_ids)
+        values = np.asarray(values, dtype=np.float64)
+        width = getattr(self._env_datas[0], field).shape[0]
+        # Broadcast a single row to every selected environment
+        values = np.broadcast_to(values, (len(env_ids), width))
+        with self.lock:
+            for row, env_id in enumerate(env_ids):
+                getattr(self._env_datas[env_id], field)[:] = values[row]
+
+    @property
+    def qpos(self) -> np.ndarray:
+        """Joint positions of all environments, shape (num_envs, nq).
+
+        The returned array is a preallocated buffer refreshed on every access,
+        copy it if it has to outlive the next call.
+        """
+        return self._gather("qpos", self._qpos_buffer)
+
+    @property
+    def qvel(self) -> np.ndarray:
+        """Joint velocities of all environments, shape (num_envs, nv)."""
+        return self._gather("qvel", self._qvel_buffer)
+
+    @property
+    def ctrl(self) -> np.ndarray:
+        """Actuator controls of all environments, shape (num_envs, nu)."""
+        return self._gather("ctrl", self._ctrl_buffer)
+
+    @property
+    def time(self) -> np.ndarray:
+        """Simulation time of all environments, shape (num_envs,)."""
+        return self._gather("time", self._time_buffer)
+
+    def set_qpos(self, qpos, env_ids: Optional[Sequence[int]] = None, forward: bool = True):
+        """Set joint positions for the selected environments.
+
+        Args:
+            qpos: Array of shape (len(env_ids), nq) or (nq,) broadcast to every env
+            env_ids: Environments to update, defaults to all
+            forward: If True, run mj_forward to refresh derived quantities
+        """
+        self._scatter("qpos", qpos, env_ids)
+        if forward:
+            self._forward_envs(env_ids)
+
+    def set_qvel(self, qvel, env_ids: Optional[Sequence[int]] = None):
+        """Set joint velocities for the selected environments.
+
+        Args:
+            qvel: Array of shape (len(env_ids), nv) or (nv,) broadcast to every env
+            env_ids: Environments to update, defaults to all
+        """
+        self._scatter("qvel", qvel, env_ids)
+
+    def set_ctrl(self, ctrl, env_ids: Optional[Sequence[int]] = None):
+        """Set actuator controls for the selected environments.
+
+        Args:
+            ctrl: Array of shape (len(env_ids), nu) or (nu,) broadcast to every env
+            env_ids: Environments to update, defaults to all
+        """
+        self._scatter("ctrl", ctrl, env_ids)
+
+    def _forward_envs(self, env_ids: Optional[Sequence[int]] = None):
+        import mujoco
+
+        with self.lock:
+            for env_id in self._resolve_env_ids(env_ids):
+                mujoco.mj_forward(self._env_models[env_id], self._env_datas[env_id])
+            self._scene_changed()
+
+    def reset(self, env_ids: Optional[Sequence[int]] = None):
+        """Reset the selected environments to the model's initial state.
+
+        Args:
+            env_ids: Environments to reset, defaults to all
+        """
+        import mujoco
+
+        env_ids = self._resolve_env_ids(env_ids)
+        with self.lock:
+            for env_id in env_ids:
+                env_data = self._env_datas[env_id]
+                mujoco.mj_resetData(self._env_models[env_id], env_data)
+                mujoco.mj_forward(self._env_models[env_id], env_data)
+            self._scene_changed()
+            if 0 in env_ids:
+                # The published state follows environment 0
+                self._publish_state()
+
+    def close(self):
+        """Shut down the worker threads and release all resources."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self.lock:
+            self._env_datas = []
+            self._env_models = []
+        super().close()
@@ -0,0 +1,160 @@
+#####################################################################################
+#
+# Description: Cold-start profiler, run with `python -m physics_simulator.startup_profile`
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+
+# Phases reported, in execution order
+PHASES = ("import", "world_build", "compile", "robots", "viewer", "render_context", "first_step")
+
+
+def _timed_import(module_name: str) -> float:
+    start = time.perf_counter()
+    __import__(module_name)
+    return time.perf_counter() - start
+
+
+def profile_startup(
+    robot_mjcf_paths: Optional[List[str]] = None,
+    num_cuboids: int = 0,
+    use_model_cache: bool = True,
+    headless: bool = True,
+) -> dict:
+    """Build, initialize and step a simulator once, timing every startup phase.
+
+    Should run in a fresh interpreter, modules imported earlier are not timed.
+
+    Args:
+        robot_mjcf_paths: MJCF files of robots to add to the scene
+        num_cuboids: Number of cuboids to add to the scene
+        use_model_cache: Whether to compile through the on-disk model cache
+        headless: Whether to run without the passive viewer
+
+    Returns:
+        dict: ``phases`` mapping each phase to seconds, ``imports`` mapping
+            the heavy modules to their own import time, and ``total``
+    """
+    imports = {}
+    start = time.perf_counter()
+    for module_name in ("numpy", "mujoco", "synthnova_config", "auro_utils"):
+        imports[module_name] = _timed_import(module_name)
+    imports["physics_simulator.simulator.mujoco"] = _timed_import(
+        "physics_simulator.simulator.mujoco"
+    )
+    phases = {"import": time.perf_counter() - start}
+
+    from synthnova_config import (
+        PhysicsSimulatorConfig,
+        MujocoConfig,
+        LoggerConfig,
+        RobotConfig,
+        CuboidConfig,
+    )
+    from physics_simulator.simulator.mujoco import MujocoSimulator
+
+    start = time.perf_counter()
+    config = PhysicsSimulatorConfig(
+        mujoco_config=MujocoConfig(headless=headless, use_model_cache=use_model_cache),
+        logger_config=LoggerConfig(use_file_log=False, log_level="error"),
+    )
+    simulator = MujocoSimulator(config)
+    simulator.add_default_scene()
+    for index, mjcf_path in enumerate(robot_mjcf_paths or []):
+        simulator.add_robot(
+            RobotConfig(
+                prim_path=f"/World/Robot{index}",
+                name=f"robot{index}",
+                mjcf_path=mjcf_path,
+                position=[2.0 * index, 0, 0],
+                orientation=[0, 0, 0, 1],
+            )
+        )
+    for index in range(num_cuboids):
+        simulator.add_object(
+            CuboidConfig(
+                prim_path=f"/World/Cuboid{index}",
+                position=[0.5 * index, 1.0, 0.5],
+                orientation=[0, 0, 0, 1],
+                scale=[0.1, 0.1, 0.1],
+                color=[1, 0, 0],
+            )
+        )
+    phases["world_build"] = time.perf_counter() - start
+
+    try:
+        simulator.initialize()
+        for phase in ("compile", "robots", "viewer", "render_context"):
+            phases[phase] = simulator.init_timings.get(phase, 0.0)
+
+        start = time.perf_counter()
+        simulator.step(1)
+        phases["first_step"] = time.perf_counter() - start
+    finally:
+        if simulator.is_running():
+            simulator.close()
+
+    return {"phases": phases, "imports": imports, "total": sum(phases.values())}
+
+
+def format_profile(profile: dict) -> str:
+    """Format a profile returned by profile_startup() as a table.
+
+    Args:
+        profile: Result of profile_startup()
+
+    Returns:
+        str: Human readable report in milliseconds
+    """
+    lines = ["Startup profile", "-" * 40]
+    for phase in PHASES:
+        lines.append(f"{phase:<24}{profile['phases'][phase] * 1e3:>12.1f} ms")
+        if phase == "import":
+            for module_name, seconds in profile["imports"].items():
+                lines.append(f"  {module_name:<34}{seconds * 1e3:>10.1f} ms")
+    lines.append("-" * 40)
+    lines.append(f"{'total':<24}{profile['total'] * 1e3:>12.1f} ms")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m physics_simulator.startup_profile",
+        description="Report cold-start latency of the physics simulator by phase.",
+    )
+    parser.add_argument(
+        "--robot", action="append", default=[], metavar="MJCF",
+        help="MJCF file of a robot to add, may be repeated",
+    )
+    parser.add_argument(
+        "--num-cuboids", type=int, default=0, help="Number of cuboids to add"
+    )
+    parser.add_argument(
+        "--no-model-cache", action="store_true", help="Compile the XML even if a cached model exists"
+    )
+    parser.add_argument(
+        "--viewer", action="store_true", help="Launch the passive viewer"
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the profile as JSON"
+    )
+    args = parser.parse_args(argv)
+
+    profile = profile_startup(
+        robot_mjcf_paths=args.robot,
+        num_cuboids=args.num_cuboids,
+        use_model_cache=not args.no_model_cache,
+        headless=not args.viewer,
+    )
+    print(json.dumps(profile, indent=2) if args.json else format_profile(profile))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
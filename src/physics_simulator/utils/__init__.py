@@ -1,3 +1,20 @@
 from .errors import *
 
-from .file_process import *
\ No newline at end of file
+# Image I/O helpers pull in OpenCV and tifffile, load them on first access (PEP 562)
+_FILE_PROCESS_ATTRIBUTES = (
+    "write_jpg",
+    "read_jpg",
+    "write_tiff",
+    "preprocess_depth",
+    "colorize_depth",
+)
+
+
+def __getattr__(name):
+    if name in _FILE_PROCESS_ATTRIBUTES:
+        from . import file_process
+
+        value = getattr(file_process, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
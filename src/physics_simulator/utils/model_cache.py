@@ -0,0 +1,163 @@
+#####################################################################################
+#
+# Description: On-disk cache of compiled MuJoCo models keyed by scene XML and assets
+# Date: 2026-10-18
+#
+#####################################################################################
+
+import hashlib
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+import mujoco
+
+DEFAULT_MODEL_CACHE_DIR = os.path.join("~", ".cache", "physics_simulator", "models")
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+# Attributes referencing files, cube and skybox textures use one file per face
+_FILE_ATTRIBUTES = ("file", "fileright", "fileleft", "fileup", "filedown", "filefront", "fileback")
+# Asset tags whose relative paths are resolved against the compiler meshdir, others use texturedir
+_MESHDIR_TAGS = ("mesh", "hfield", "skin")
+
+
+def _referenced_files(root: ET.Element, model_dir: str) -> set:
+    """Absolute paths of every file referenced by a model, as the MuJoCo compiler resolves them."""
+    compiler = root.find("compiler")
+    asset_dir = compiler.get("assetdir") if compiler is not None else None
+    meshdir = compiler.get("meshdir", asset_dir) if compiler is not None else None
+    texturedir = compiler.get("texturedir", asset_dir) if compiler is not None else None
+
+    files = set()
+    for element in root.iter():
+        for attribute in _FILE_ATTRIBUTES:
+            file = element.get(attribute)
+            if not file:
+                continue
+            if not os.path.isabs(file):
+                if element.tag in _MESHDIR_TAGS:
+                    file = os.path.join(meshdir or "", file)
+                elif element.tag == "texture":
+                    file = os.path.join(texturedir or "", file)
+                file = os.path.join(model_dir, file)
+            files.add(os.path.normpath(file))
+    return files
+
+
+class ModelCache:
+    """Least-recently-used cache of compiled MuJoCo models on disk.
+
+    Models are stored as MJB binaries (``mj_saveModel``) under a key hashing the
+    merged scene XML, the contents of every file it references (meshes,
+    textures, height fields...) and the MuJoCo version. Loading an MJB skips
+    XML parsing and mesh processing entirely. The cache is trimmed to
+    ``max_size_bytes`` after every store, evicting the least recently used
+    models first.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size_bytes: int = 2 << 30):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the binaries, defaults to ~/.cache/physics_simulator/models
+            max_size_bytes: Maximum total size of cached binaries
+        """
+        self.cache_dir = os.path.expanduser(cache_dir or DEFAULT_MODEL_CACHE_DIR)
+        self.max_size_bytes = int(max_size_bytes)
+
+    @staticmethod
+    def compute_key(xml: str, model_dir: Optional[str] = None) -> Optional[str]:
+        """Hash a scene XML string together with the files it references.
+
+        Relative asset paths are resolved like the MuJoCo compiler does, against
+        the compiler ``meshdir``/``texturedir`` and the model directory.
+
+        Args:
+            xml: Merged scene XML
+            model_dir: Directory relative paths are resolved against, defaults
+                to the working directory like ``MjModel.from_xml_string``
+
+        Returns:
+            str: Hex digest identifying the compiled model, None if a referenced
+                file cannot be read and the model must not be cached
+        """
+        digest = hashlib.sha256()
+        digest.update(mujoco.__version__.encode())
+        digest.update(xml.encode())
+
+        files = sorted(_referenced_files(ET.fromstring(xml), model_dir or os.getcwd()))
+        for file in files:
+            digest.update(file.encode())
+            try:
+                with open(file, "rb") as f:
+                    for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+            except OSError:
+                return None
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.mjb")
+
+    def load(self, key: str) -> Optional[mujoco.MjModel]:
+        """Load a cached model.
+
+        Args:
+            key: Key returned by compute_key()
+
+        Returns:
+            mujoco.MjModel or None: The cached model, None on a miss or unreadable entry
+        """
+        path = self._path(key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            model = mujoco.MjModel.from_binary_path(path)
+        except Exception:
+            # Truncated or incompatible entry, drop it and recompile
+            os.remove(path)
+            return None
+        # Record the access for LRU eviction
+        os.utime(path)
+        return model
+
+    def store(self, key: str, model: mujoco.MjModel):
+        """Save a compiled model and evict old entries beyond the size limit.
+
+        Args:
+            key: Key returned by compute_key()
+            model: Compiled model to store
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a temporary file first so concurrent readers never see a partial binary
+        fd, tmp_path = tempfile.mkstemp(suffix=".mjb.tmp", dir=self.cache_dir)
+        os.close(fd)
+        try:
+            mujoco.mj_saveModel(model, tmp_path, None)
+            os.replace(tmp_path, self._path(key))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits its size limit."""
+        if not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".mjb"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size_bytes:
+                break
+            os.remove(path)
+            total_size -= size
@@ -1,7 +1,19 @@
 from physics_simulator.object import MujocoXML
-from physics_simulator.utils.mjcf_utils import convert_to_string, find_elements
+from physics_simulator.utils.mjcf_utils import convert_to_string, find_elements, find_parent
 from physics_simulator.object import MujocoObject
 import os
+import xml.etree.ElementTree as ET
+from copy import deepcopy
+
+import mujoco
+
+# Sections merged from robots and objects into the world
+_MERGED_SECTIONS = ("asset", "worldbody", "actuator", "sensor", "tendon", "equality", "contact")
+# Attributes of spec elements that may reference a named entity
+_SPEC_REFERENCE_ATTRIBUTES = (
+    "name", "target", "objname", "refname", "name1", "name2",
+    "bodyname1", "bodyname2", "geomname1", "geomname2",
+)
 
 class MujocoWorld(MujocoXML):
     """A MuJoCo world representation as an XML model.
@@ -24,6 +36,8 @@ class MujocoWorld(MujocoXML):
         self.size = find_elements(
             root=self.root, tags="size", attribs=None, return_first=True
         )
+        # Editable MjSpec mirror of the XML, built on the first runtime edit
+        self.spec = None
 
     def update_attribute(self, key, value, tag="option"):
         """Update a specific attribute in the world configuration.
@@ -66,3 +80,181 @@ class MujocoWorld(MujocoXML):
             # Merge this object
             self.merge_assets(mujoco_obj)
             self.worldbody.append(mujoco_obj.get_obj())
+
+    def get_spec(self):
+        """Get the MjSpec mirroring this world, building it from the XML on first use.
+
+        The spec is compiled once so that ``spec.recompile(model, data)`` can map
+        the state of a model compiled from the same XML.
+
+        Returns:
+            mujoco.MjSpec: The world spec
+        """
+        if self.spec is None:
+            self.spec = mujoco.MjSpec.from_string(self.get_xml())
+            self.spec.compile()
+        return self.spec
+
+    def _new_assets(self, asset):
+        """Return assets not yet defined in the world, duplicates are shared."""
+        return [
+            element
+            for element in asset
+            if find_elements(
+                root=self.asset,
+                tags=element.tag,
+                attribs={"name": element.get("name")},
+                return_first=True,
+            )
+            is None
+        ]
+
+    def _child_spec(self, sections):
+        """Build an MjSpec from XML sections using the world compiler settings."""
+        root = ET.Element("mujoco")
+        root.append(deepcopy(self.compiler))
+        for tag, elements in sections.items():
+            section = ET.SubElement(root, tag)
+            for element in elements:
+                section.append(deepcopy(element))
+        return mujoco.MjSpec.from_string(ET.tostring(root, encoding="unicode"))
+
+    def attach_objects(self, mujoco_objects):
+        """Add object models to the world XML and to the spec.
+
+        Args:
+            mujoco_objects: List of MujocoObject instances to add to the world
+        """
+        spec = self.get_spec()
+        for mujoco_obj in mujoco_objects:
+            body = mujoco_obj.get_obj()
+            child = self._child_spec(
+                {"asset": self._new_assets(mujoco_obj.asset), "worldbody": [body]}
+            )
+            spec.worldbody.add_frame().attach_body(child.body(body.get("name")), "", "")
+        self.merge_objects(mujoco_objects)
+
+    def attach_model(self, mujoco_xml):
+        """Add a MujocoXML model (e.g. a robot) to the world XML and to the spec.
+
+        Args:
+            mujoco_xml: MujocoXML instance whose sections are merged into the world
+        """
+        spec = self.get_spec()
+        sections = {
+            tag: list(getattr(mujoco_xml, tag)) for tag in _MERGED_SECTIONS
+        }
+        sections["asset"] = self._new_assets(mujoco_xml.asset)
+        spec.attach(self._child_spec(sections), prefix="", frame=spec.worldbody.add_frame())
+        self.merge(mujoco_xml)
+
+    def attach_sensor(self, body, parent_name=None, sensors=()):
+        """Mirror a sensor body and its sensor elements into the spec.
+
+        The sensor has already been mounted in the world XML, only the spec is
+        edited. Call get_spec() before mounting the sensor so the spec mirrors
+        the model without it.
+
+        Args:
+            body: Sensor body element, mounted under parent_name in the world XML
+            parent_name: Name of the parent body, the world body if None
+            sensors: Elements of the ``<sensor>`` section referencing the body
+        """
+        spec = self.get_spec()
+        parent = spec.worldbody if parent_name is None else spec.body(parent_name)
+        if parent is None:
+            raise ValueError(f"Parent body (link) {parent_name} not found in the spec")
+        child = self._child_spec({"worldbody": [body], "sensor": list(sensors)})
+        spec.attach(child, prefix="", frame=parent.add_frame())
+
+    def detach_sensor(self, body, sensors=()):
+        """Remove a sensor body and its sensor elements from the world XML.
+
+        The spec is dropped and rebuilt from the XML on the next runtime edit,
+        so a partially attached sensor does not leak into later models.
+
+        Args:
+            body: Sensor body element mounted in the world XML
+            sensors: Elements of the ``<sensor>`` section referencing the body
+        """
+        parent = find_parent(self.worldbody, body)
+        if parent is not None:
+            parent.remove(body)
+        for element in sensors:
+            if element in list(self.sensor):
+                self.sensor.remove(element)
+        self.spec = None
+
+    def remove_sensor_elements(self, sensors):
+        """Remove elements of the ``<sensor>`` section from the world XML and, if built, the spec.
+
+        Args:
+            sensors: Elements of the ``<sensor>`` section, e.g. the readings of an IMU
+        """
+        names = set()
+        for element in sensors:
+            if element in list(self.sensor):
+                self.sensor.remove(element)
+            names.add(element.get("name"))
+        if self.spec is None:
+            return
+        for element in list(self.spec.sensors):
+            if element.name in names:
+                element.delete()
+
+    def remove_body(self, body_name):
+        """Remove a body and its subtree from the world XML and, if built, the spec.
+
+        Args:
+            body_name: Name of the body to remove
+
+        Raises:
+            ValueError: If no body with this name exists
+        """
+        body = find_elements(
+            root=self.worldbody, tags="body", attribs={"name": body_name}, return_first=True
+        )
+        if body is None:
+            raise ValueError(f"Body '{body_name}' not found in world")
+        find_parent(self.worldbody, body).remove(body)
+
+        if self.spec is not None:
+            self.spec.detach_body(self.spec.body(body_name))
+
+    def remove_prefixed(self, prefix):
+        """Remove every top-level body and every actuator, sensor, tendon,
+        equality and contact element whose name or references start with a prefix.
+
+        Used to remove namespaced robots.
+
+        Args:
+            prefix: Name prefix (e.g. a robot namespace "robot/")
+        """
+        def matches(element):
+            return any(value.startswith(prefix) for value in element.attrib.values())
+
+        for element in list(self.worldbody):
+            if element.get("name", "").startswith(prefix):
+                self.worldbody.remove(element)
+        for tag in _MERGED_SECTIONS[2:]:
+            section = getattr(self, tag)
+            for element in list(section):
+                if matches(element):
+                    section.remove(element)
+
+        if self.spec is None:
+            return
+        spec = self.spec
+        for body in list(spec.worldbody.bodies):
+            if body.name.startswith(prefix):
+                spec.detach_body(body)
+        for elements in (
+            spec.actuators, spec.sensors, spec.tendons,
+            spec.equalities, spec.excludes, spec.pairs,
+        ):
+            for element in list(elements):
+                if any(
+                    str(getattr(element, attribute, "")).startswith(prefix)
+                    for attribute in _SPEC_REFERENCE_ATTRIBUTES
+                ):
+                    element.delete()
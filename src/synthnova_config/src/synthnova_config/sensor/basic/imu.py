@@ -51,6 +51,10 @@ class ImuSensorConfig(BaseModel):
     Attributes:
         frequency (float | None): Sampling frequency of the sensor in Hz. If None, the default frequency
             from the simulation environment will be used.
+        accelerometer_noise_std (float | None): Standard deviation of the white noise on every accelerometer axis in m/s^2
+        accelerometer_bias (NDArray[Shape["3"], np.float64] | None): Constant accelerometer bias [x, y, z] in m/s^2
+        gyroscope_noise_std (float | None): Standard deviation of the white noise on every gyroscope axis in rad/s
+        gyroscope_bias (NDArray[Shape["3"], np.float64] | None): Constant gyroscope bias [x, y, z] in rad/s
 
     Methods:
         load_from_file: Load configuration from a JSON file
@@ -68,9 +72,33 @@ class ImuSensorConfig(BaseModel):
     frequency: float | None = Field(
         default=None, description="Frequency of the sensor in Hz"
     )
+    accelerometer_noise_std: float | None = Field(
+        default=None,
+        description="Standard deviation of the white noise on every accelerometer axis in m/s^2",
+    )
+    accelerometer_bias: NDArray[Shape["3"], np.float64] | None = Field(
+        default=None,
+        min_length=3,
+        max_length=3,
+        description="Constant accelerometer bias [x, y, z] in m/s^2",
+    )
+    gyroscope_noise_std: float | None = Field(
+        default=None,
+        description="Standard deviation of the white noise on every gyroscope axis in rad/s",
+    )
+    gyroscope_bias: NDArray[Shape["3"], np.float64] | None = Field(
+        default=None,
+        min_length=3,
+        max_length=3,
+        description="Constant gyroscope bias [x, y, z] in rad/s",
+    )
 
     @field_validator(
         "frequency",
+        "accelerometer_noise_std",
+        "accelerometer_bias",
+        "gyroscope_noise_std",
+        "gyroscope_bias",
         mode="before",
     )
     @classmethod
@@ -126,6 +154,7 @@ class ImuConfig(SensorConfig):
         prim_path (str | PosixPath | None): USD primitive path that specifies the location of the IMU sensor
             in the USD scene graph. This path is used to identify and locate the sensor in the simulation
             environment.
+        parent_entity_name (str | None): Name of the parent entity of the IMU in mujoco, the world if None
         position (NDArray[Shape["3"], np.float64] | None): Global position [x, y, z] in world frame
         orientation (NDArray[Shape["4"], np.float64] | None): Global orientation quaternion [qx, qy, qz, qw] in world frame
         translation (NDArray[Shape["3"], np.float64] | None): Local position [x, y, z] relative to parent frame
@@ -162,6 +191,10 @@ class ImuConfig(SensorConfig):
         default=None,
         description="USD primitive path that specifies the location of the IMU sensor",
     )
+    parent_entity_name: str | None = Field(
+        default=None,
+        description="Name of the parent entity of the IMU in mujoco, the world if None",
+    )
     position: NDArray[Shape["3"], np.float64] | None = Field(
         default=None,
         min_length=3,
@@ -382,6 +382,7 @@ class Lidar3DConfig(SensorConfig):
         name (str | None): A human-readable identifier for the entity instance
         uuid (str | None): A unique identifier for the entity instance
         prim_path (str | PosixPath | None): USD primitive path for the lidar in the simulation
+        parent_entity_name (str | None): Name of the parent entity of the lidar in mujoco, the world if None
         position (NDArray[Shape["3"], np.float64] | None): Global position [x, y, z] relative to world frame (right-hand coordinate system)
         orientation (NDArray[Shape["4"], np.float64] | None): Global orientation quaternion [qx, qy, qz, qw] relative to world frame
         translation (NDArray[Shape["3"], np.float64] | None): Local position [x, y, z] relative to parent frame (right-hand coordinate system)
@@ -414,6 +415,10 @@ class Lidar3DConfig(SensorConfig):
     prim_path: str | PosixPath | None = Field(
         None, description="USD primitive path for the lidar in the simulation"
     )
+    parent_entity_name: str | None = Field(
+        default=None,
+        description="Name of the parent entity of the lidar in mujoco, the world if None",
+    )
     position: NDArray[Shape["3"], np.float64] | None = Field(
         default=None,
         min_length=3,
@@ -181,6 +181,16 @@ class MujocoConfig(BaseModel):
             Defaults to CompilerConfig().
         size_config (SizeConfig): Size settings.
             Defaults to SizeConfig().
+        headless (bool): Run without a viewer.
+            Defaults to False.
+        use_model_cache (bool): Cache compiled models on disk.
+            Defaults to True.
+        model_cache_dir (Optional[str]): Directory of the model cache.
+            Defaults to None (~/.cache/physics_simulator/models).
+        model_cache_size_mb (float): Maximum model cache size in megabytes.
+            Must be positive. Defaults to 2048.
+        publish_state (bool): Publish a double-buffered state snapshot after
+            every step for lock-free readers. Defaults to False.
 
     """
 
@@ -275,3 +285,28 @@ class MujocoConfig(BaseModel):
         description="Run the simulator in headless mode (no graphical output)",
         json_schema_extra={"examples": [True, False]},
     )
+
+    use_model_cache: bool = Field(
+        default=True,
+        description="Cache compiled models on disk, keyed by the scene XML and asset contents",
+        json_schema_extra={"examples": [True, False]},
+    )
+
+    model_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory of the compiled model cache, None uses ~/.cache/physics_simulator/models",
+        json_schema_extra={"examples": [None, "/tmp/physics_simulator_models"]},
+    )
+
+    model_cache_size_mb: float = Field(
+        default=2048,
+        gt=0,
+        description="Maximum size of the compiled model cache in megabytes, least recently used models are evicted first",
+        json_schema_extra={"examples": [2048, 512]},
+    )
+
+    publish_state: bool = Field(
+        default=False,
+        description="Publish a double-buffered state snapshot after every step so readers do not take the simulator lock",
+        json_schema_extra={"examples": [False, True]},
+    )
@@ -4,21 +4,27 @@ Pytest configuration and fixtures for physics simulator tests.
 import pytest
 import numpy as np
 from pathlib import Path
+from unittest.mock import Mock, patch
 from synthnova_config import (
     PhysicsSimulatorConfig,
     MujocoConfig,
     LoggerConfig,
     RobotConfig,
     ObjectConfig,
-    GroundPlaneConfig
+    GroundPlaneConfig,
+    CuboidConfig,
+    RgbCameraConfig,
+    RealsenseD415RgbSensorConfig,
 )
 
 
 @pytest.fixture
-def basic_config():
+def basic_config(tmp_path):
     """Create basic physics simulator configuration for testing."""
     config = PhysicsSimulatorConfig()
-    config.mujoco_config = MujocoConfig(headless=True)
+    config.mujoco_config = MujocoConfig(
+        headless=True, model_cache_dir=str(tmp_path / "model_cache")
+    )
     config.logger_config = LoggerConfig()  # Use default logger config
     return config
 
@@ -35,6 +41,57 @@ def robot_config():
     )
 
 
+_ARM_MJCF = """
+<mujoco model="arm">
+  <worldbody>
+    <body name="base" pos="0 0 0.1">
+      <geom type="box" size="0.1 0.1 0.05"/>
+      <body name="link1" pos="0 0 0.1">
+        <joint name="joint1" type="hinge" axis="0 0 1" range="-3 3"/>
+        <geom type="capsule" fromto="0 0 0 0.3 0 0" size="0.03"/>
+        <body name="link2" pos="0.3 0 0">
+          <joint name="joint2" type="hinge" axis="0 1 0" range="-2 2"/>
+          <geom type="capsule" fromto="0 0 0 0.3 0 0" size="0.03"/>
+          <site name="ee" pos="0.3 0 0"/>
+        </body>
+      </body>
+    </body>
+  </worldbody>
+  <actuator>
+    <position name="joint1" joint="joint1" kp="50"/>
+    <position name="joint2" joint="joint2" kp="50"/>
+  </actuator>
+</mujoco>
+"""
+
+
+@pytest.fixture
+def arm_robot_config(tmp_path):
+    """Create a two-joint position-controlled arm backed by a real MJCF file."""
+    mjcf_path = tmp_path / "arm.xml"
+    mjcf_path.write_text(_ARM_MJCF)
+    return RobotConfig(
+        prim_path="/World/Arm",
+        name="arm",
+        mjcf_path=str(mjcf_path),
+        position=[0, 0, 0],
+        orientation=[0, 0, 0, 1],
+    )
+
+
+@pytest.fixture
+def arm_camera_config():
+    """Create an RGB camera mounted on the base of the test arm."""
+    return RgbCameraConfig(
+        name="arm_camera",
+        prim_path="/World/Arm/base/arm_camera",
+        translation=[0.5, 0, 0.5],
+        rotation=[0, 0, 0, 1],
+        parent_entity_name="arm/base",
+        sensor_config=RealsenseD415RgbSensorConfig(),
+    )
+
+
 @pytest.fixture
 def object_config():
     """Create basic object configuration for testing."""
@@ -66,4 +123,105 @@ def sample_joint_positions():
 @pytest.fixture
 def sample_joint_names():
     """Sample joint names for robot testing."""
-    return ["joint1", "joint2", "joint3", "joint4", "joint5", "joint6"] 
\ No newline at end of file
+    return ["joint1", "joint2", "joint3", "joint4", "joint5", "joint6"] 
+
+class _NullRenderContext:
+    """Stand-in for the offscreen render context on machines without OpenGL."""
+
+    offscreen = True
+
+    def __init__(self, sim, device_id=-1):
+        sim.forward()
+
+    def render(self, width, height, camera_id=None, segmentation=False):
+        pass
+
+    def read_pixels(self, width, height, depth=False, segmentation=False):
+        rgb = np.zeros((height, width, 3), dtype=np.uint8)
+        if depth:
+            return rgb, np.zeros((height, width), dtype=np.float32)
+        return rgb
+
+
+def _build_simulator(
+    config,
+    simulator_cls=None,
+    num_cuboids=2,
+    robot_configs=(),
+    sensor_configs=(),
+    **kwargs,
+):
+    """Build and initialize a simulator with a mocked logger and falling cuboids."""
+    from physics_simulator.simulator import MujocoSimulator
+
+    simulator_cls = simulator_cls or MujocoSimulator
+    with patch.object(simulator_cls, "_load_logger", return_value=Mock()):
+        simulator = simulator_cls(config, **kwargs)
+    simulator.add_default_scene()
+    for robot_config in robot_configs:
+        simulator.add_robot(robot_config)
+    for sensor_config in sensor_configs:
+        simulator.add_sensor(sensor_config)
+    for i in range(num_cuboids):
+        simulator.add_object(
+            CuboidConfig(
+                prim_path=f"/World/Cuboid{i}",
+                position=[0.5 * i, 0, 0.5],
+                orientation=[0, 0, 0, 1],
+                scale=[0.1, 0.1, 0.1],
+                color=[1, 0, 0],
+            )
+        )
+    simulator.initialize()
+    return simulator
+
+
+@pytest.fixture
+def make_headless_simulator(basic_config):
+    """Factory building an initialized headless simulator with falling cuboids.
+
+    The logger is mocked and the offscreen render context is replaced so the
+    simulator can be initialized without a display or GPU.
+    """
+    simulators = []
+    # Kept active for the whole test, runtime scene edits recreate the context
+    render_context_patch = patch(
+        "physics_simulator.simulator.mj_wrapper.MjRenderContextOffscreen",
+        _NullRenderContext,
+    )
+    render_context_patch.start()
+
+    def _make(simulator_cls=None, **kwargs):
+        simulator = _build_simulator(basic_config, simulator_cls, **kwargs)
+        simulators.append(simulator)
+        return simulator
+
+    yield _make
+
+    for simulator in simulators:
+        if simulator.is_running():
+            simulator.close()
+    render_context_patch.stop()
+
+
+@pytest.fixture
+def make_rendering_simulator(basic_config):
+    """Factory like make_headless_simulator keeping the real offscreen render context.
+
+    The test is skipped when no OpenGL context can be created.
+    """
+    simulators = []
+
+    def _make(simulator_cls=None, **kwargs):
+        try:
+            simulator = _build_simulator(basic_config, simulator_cls, **kwargs)
+        except Exception as e:
+            pytest.skip(f"Offscreen rendering is not available: {e}")
+        simulators.append(simulator)
+        return simulator
+
+    yield _make
+
+    for simulator in simulators:
+        if simulator.is_running():
+            simulator.close()
@@ -0,0 +1,104 @@
+"""
+Tests for the asyncio front-end AsyncMujocoSimulator.
+"""
+import asyncio
+import threading
+import pytest
+from physics_simulator.simulator.async_simulator import AsyncMujocoSimulator
+
+_CAMERA = "/World/Arm/base/arm_camera"
+
+
+@pytest.mark.mujoco
+class TestAsyncMujocoSimulator:
+    """Test suite for awaitable stepping, sensors and frame streaming."""
+
+    def test_step_runs_on_physics_thread(self, make_headless_simulator):
+        """Test that stepping happens off the event loop thread."""
+        simulator = make_headless_simulator()
+        threads = []
+        simulator.add_physics_callback(
+            "thread", lambda: threads.append(threading.current_thread().name)
+        )
+
+        timestep = simulator.get_physics_dt()
+
+        async def main():
+            async with AsyncMujocoSimulator(simulator) as sim:
+                steps = await sim.step(10)
+                assert simulator.get_simulation_time() == pytest.approx(10 * timestep)
+                return steps
+
+        assert asyncio.run(main()) == 10
+        assert len(threads) == 10
+        assert all(name.startswith("physics") for name in threads)
+        assert not simulator.is_running()
+
+    def test_cancel_stops_after_current_step(self, make_headless_simulator):
+        """Test that cancelling step() stops the physics thread early."""
+        simulator = make_headless_simulator()
+        started = threading.Event()
+        simulator.add_physics_callback("started", started.set)
+
+        async def main():
+            sim = AsyncMujocoSimulator(simulator)
+            task = asyncio.ensure_future(sim.step(10**7))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            steps = simulator.get_step_count()
+            # The physics thread is idle once cancellation returns
+            await asyncio.sleep(0.01)
+            assert simulator.get_step_count() == steps
+            await sim.close()
+            return steps
+
+        assert 0 < asyncio.run(main()) < 10**7
+
+    def test_camera_getter_and_stream(
+        self, make_headless_simulator, arm_robot_config, arm_camera_config
+    ):
+        """Test awaiting a camera getter and streaming frames with backpressure."""
+        simulator = make_headless_simulator(
+            robot_configs=[arm_robot_config], sensor_configs=[arm_camera_config]
+        )
+        timestep = simulator.get_physics_dt()
+
+        async def main():
+            async with AsyncMujocoSimulator(simulator) as sim:
+                rgb = await sim.get_sensor(_CAMERA).get_rgb()
+                frames = []
+                async for frame in sim.stream(
+                    [_CAMERA], steps_per_frame=5, num_frames=3, method="get_rgb"
+                ):
+                    frames.append(frame)
+                    # Slow consumer, the producer must not run ahead
+                    await asyncio.sleep(0.01)
+                    assert simulator.get_step_count() <= 5 * (len(frames) + 3)
+                return rgb, frames
+
+        rgb, frames = asyncio.run(main())
+        assert rgb.shape[-1] == 3
+        assert len(frames) == 3
+        assert [frame["time"] for frame in frames] == pytest.approx(
+            [5 * (i + 1) * timestep for i in range(3)]
+        )
+        assert frames[0][_CAMERA].shape == rgb.shape
+
+    def test_breaking_out_of_stream_cancels_producer(self, make_headless_simulator):
+        """Test that leaving the async for loop stops stepping."""
+        simulator = make_headless_simulator()
+
+        async def main():
+            sim = AsyncMujocoSimulator(simulator)
+            async for _ in sim.stream([], steps_per_frame=1):
+                break
+            steps = simulator.get_step_count()
+            await asyncio.sleep(0.01)
+            assert simulator.get_step_count() == steps
+            await sim.close()
+
+        asyncio.run(main())
+        assert not simulator.is_running()
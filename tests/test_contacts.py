@@ -0,0 +1,77 @@
+"""
+Tests for the vectorized contact query.
+"""
+import mujoco
+import numpy as np
+import pytest
+from physics_simulator.simulator.mujoco import CONTACT_DTYPE
+
+
+@pytest.mark.mujoco
+class TestContacts:
+    """Test suite for get_contacts() records, entity mapping and filtering."""
+
+    def test_resting_contacts_carry_the_weight(self, make_headless_simulator):
+        """Test that the normal forces of resting cuboids balance their weight."""
+        simulator = make_headless_simulator()
+        simulator.step(500)
+        model = simulator.model._model
+
+        contacts = simulator.get_contacts()
+        assert contacts.dtype == CONTACT_DTYPE
+        entities = simulator.get_contact_entities()
+        assert entities == ("/World/Cuboid0", "/World/Cuboid1")
+        for entity, prim_path in enumerate(entities):
+            obj = simulator.get_object(prim_path)
+            body_id = simulator.model.body_name2id(f"{obj.naming_prefix}main")
+            touching = contacts[contacts["entity2"] == entity]
+            assert len(touching) > 0
+            np.testing.assert_array_equal(touching["body2"], body_id)
+            # The ground belongs to no entity
+            np.testing.assert_array_equal(touching["entity1"], -1)
+            assert touching["force"][:, 0].sum() == pytest.approx(
+                model.body_mass[body_id] * 9.81, rel=1e-3
+            )
+
+        data = simulator.data._data
+        force = np.zeros(6)
+        mujoco.mj_contactForce(model, data, 0, force)
+        np.testing.assert_array_equal(contacts["force"][0], force)
+        np.testing.assert_array_equal(contacts["pos"][0], data.contact.pos[0])
+        np.testing.assert_array_equal(contacts["body1"], model.geom_bodyid[contacts["geom1"]])
+
+    def test_filter_maps_robot_links_to_the_robot(
+        self, make_headless_simulator, arm_robot_config
+    ):
+        """Test that contacts on any link of a robot match its prim path."""
+        simulator = make_headless_simulator(robot_configs=[arm_robot_config])
+        simulator.step(300)
+        arm = simulator.get_contact_entities().index("/World/Arm")
+
+        contacts = simulator.get_contacts(["/World/Arm"])
+        assert len(contacts) > 0
+        assert np.all((contacts["entity1"] == arm) | (contacts["entity2"] == arm))
+        links = {simulator.model.body_name2id(name) for name in ("arm/link1", "arm/link2")}
+        assert links & set(contacts["body1"]).union(contacts["body2"])
+
+        cuboid = simulator.get_contact_entities().index("/World/Cuboid0")
+        on_cuboid = simulator.get_contacts(["/World/Cuboid0"], copy=True)
+        assert 0 < len(on_cuboid) < len(contacts)
+        assert np.all((on_cuboid["entity1"] == cuboid) | (on_cuboid["entity2"] == cuboid))
+        with pytest.raises(KeyError):
+            simulator.get_contacts(["/World/Missing"])
+
+    def test_buffer_is_reused_between_calls(self, make_headless_simulator):
+        """Test that views share the reused buffer and copies do not."""
+        simulator = make_headless_simulator()
+        simulator.step(500)
+        first = simulator.get_contacts()
+        kept = simulator.get_contacts(copy=True)
+        second = simulator.get_contacts()
+        assert np.shares_memory(first, second)
+        assert not np.shares_memory(kept, second)
+
+        # Contacts disappear once the cuboids are lifted
+        simulator.data.qpos[2::7] += 1.0
+        simulator.forward()
+        assert len(simulator.get_contacts()) == 0
@@ -0,0 +1,113 @@
+"""
+Tests for in-place domain randomization of compiled model arrays.
+"""
+import numpy as np
+import pytest
+from physics_simulator.simulator import DomainRandomizer, VectorizedMujocoSimulator
+from physics_simulator.utils.errors import RandomizationError
+
+
+@pytest.mark.mujoco
+class TestDomainRandomizer:
+    """Test suite for DomainRandomizer terms, restoring and per-env variation."""
+
+    def test_terms_write_only_selected_ids(self, make_headless_simulator, arm_robot_config):
+        """Test that samples land in the resolved slices and stay in range."""
+        simulator = make_headless_simulator(robot_configs=[arm_robot_config])
+        model = simulator.model._model
+        nominal_friction = model.geom_friction.copy()
+        nominal_mass = model.body_mass.copy()
+        nominal_inertia = model.body_inertia.copy()
+
+        randomizer = DomainRandomizer(simulator, seed=0)
+        geom_ids = randomizer.geom_ids(["/World/Cuboid1"])
+        body_ids = randomizer.body_ids(["/World/Arm"])
+        dof_ids = randomizer.dof_ids(["/World/Arm"])
+        assert len(dof_ids) == 2
+        randomizer.add_friction(["/World/Cuboid1"], 0.5, 1.5)
+        randomizer.add_mass(["/World/Arm"], 0.8, 1.2)
+        randomizer.add_damping(["/World/Arm"], 0.1, 0.2, operation="set")
+        randomizer.add_gravity([-0.5, -0.5, 0.0], [0.5, 0.5, 0.0])
+        randomizer.add_color(["/World/Cuboid0"])
+        samples = randomizer.randomize()
+
+        factors = model.geom_friction[geom_ids] / nominal_friction[geom_ids]
+        assert np.all((factors >= 0.5) & (factors <= 1.5))
+        # One factor per geom scales all of its coefficients
+        np.testing.assert_allclose(factors, factors[:, :1].repeat(3, axis=1))
+        others = np.setdiff1d(np.arange(model.ngeom), geom_ids)
+        np.testing.assert_array_equal(model.geom_friction[others], nominal_friction[others])
+
+        mass_factors = model.body_mass[body_ids] / nominal_mass[body_ids]
+        np.testing.assert_allclose(
+            model.body_inertia[body_ids], nominal_inertia[body_ids] * mass_factors[:, None]
+        )
+        assert np.all((model.dof_damping[dof_ids] >= 0.1) & (model.dof_damping[dof_ids] <= 0.2))
+        assert model.opt.gravity[2] == pytest.approx(-9.81)
+        assert abs(model.opt.gravity[0]) <= 0.5
+        np.testing.assert_array_equal(samples["gravity"][0], model.opt.gravity)
+
+        randomizer.restore()
+        np.testing.assert_array_equal(model.geom_friction, nominal_friction)
+        np.testing.assert_array_equal(model.body_mass, nominal_mass)
+        np.testing.assert_array_equal(model.body_inertia, nominal_inertia)
+
+    def test_seeded_draws_are_reproducible(self, make_headless_simulator):
+        """Test that equal seeds give equal samples."""
+        simulator = make_headless_simulator()
+        draws = []
+        for _ in range(2):
+            randomizer = DomainRandomizer(simulator, seed=42)
+            randomizer.add_friction(["/World/Cuboid0"], 0.5, 1.5)
+            draws.append(randomizer.randomize()["geom_friction"])
+            randomizer.restore()
+        np.testing.assert_array_equal(draws[0], draws[1])
+
+    def test_invalid_terms_raise_error(self, make_headless_simulator):
+        """Test that unknown prim paths, ranges and operations are rejected."""
+        simulator = make_headless_simulator()
+        randomizer = DomainRandomizer(simulator)
+        with pytest.raises(RandomizationError):
+            randomizer.add_mass(["/World/Missing"], 0.5, 1.5)
+        with pytest.raises(RandomizationError):
+            randomizer.add_friction(["/World/Cuboid0"], 2.0, 1.0)
+        with pytest.raises(RandomizationError):
+            randomizer.add_damping(["/World/Cuboid0"], 0.0, 1.0, operation="multiply")
+
+    def test_recompiled_model_raises_error(self, make_headless_simulator):
+        """Test that a runtime scene edit makes the randomizer refuse to write stale models."""
+        simulator = make_headless_simulator(num_cuboids=2)
+        randomizer = DomainRandomizer(simulator, seed=0)
+        randomizer.add_friction(["/World/Cuboid0"], 0.5, 1.5)
+        randomizer.randomize()
+
+        simulator.remove_object("/World/Cuboid1")
+        with pytest.raises(RandomizationError, match="recompiled"):
+            randomizer.randomize()
+        with pytest.raises(RandomizationError, match="recompiled"):
+            randomizer.restore()
+
+    def test_per_env_variation(self, make_headless_simulator):
+        """Test that every environment steps with its own randomized model."""
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=3)
+        randomizer = DomainRandomizer(simulator, seed=1)
+        models = [simulator.get_env_model(i) for i in range(3)]
+        assert models[0] is simulator.model._model
+        assert models[1] is not models[0] and models[2] is not models[1]
+
+        randomizer.add_gravity([0, 0, 0], [0, 0, 9.81])
+        samples = randomizer.randomize()
+        gravity = np.array([model.opt.gravity[2] for model in models])
+        np.testing.assert_array_equal(gravity, samples["gravity"][:, 2])
+        assert np.all((gravity >= -9.81) & (gravity <= 0.0))
+        assert len(np.unique(gravity)) == 3
+
+        # Only the first environment falls at full gravity
+        randomizer.restore(env_ids=[1, 2])
+        randomizer.add_gravity(0.0, 0.0, operation="set")
+        randomizer.randomize(env_ids=[1])
+        assert simulator.get_env_model(1).opt.gravity[2] == 0.0
+        start = simulator.qpos.copy()
+        simulator.step(50)
+        assert simulator.qpos[1, 2] == pytest.approx(start[1, 2])
+        assert simulator.qpos[2, 2] < start[2, 2]
@@ -0,0 +1,148 @@
+"""
+Tests for object and sensor model pose getters and bulk object state access.
+"""
+from unittest.mock import patch
+
+import mujoco
+import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
+from synthnova_config import CuboidConfig
+
+_CAMERA = "/World/Arm/base/arm_camera"
+
+
+@pytest.mark.mujoco
+class TestEntityPoses:
+    """Test suite for pose reads through the registered simulator handle."""
+
+    def test_object_pose_reads_bound_body(self, make_headless_simulator):
+        """Test that object poses index the simulation data without heap scans."""
+        simulator = make_headless_simulator()
+        simulator.step(30)
+        simulator.forward()
+        obj = simulator.get_object("/World/Cuboid1")
+        body_id = simulator.model.body_name2id(f"{obj.naming_prefix}main")
+
+        with patch("gc.get_objects", side_effect=AssertionError("heap scan")):
+            position = obj.get_position()
+            orientation = obj.get_orientation()
+        np.testing.assert_array_equal(position, simulator.data.xpos[body_id])
+        np.testing.assert_allclose(
+            orientation, simulator.get_object_state("/World/Cuboid1")["orientation"]
+        )
+
+        # Returned arrays are copies
+        position[:] = 0
+        assert obj.get_position()[2] == simulator.data.xpos[body_id][2]
+
+    def test_objects_follow_their_own_simulator(self, make_headless_simulator):
+        """Test that every object reads the simulator it was added to."""
+        first = make_headless_simulator()
+        second = make_headless_simulator()
+        second.step(50)
+        second.forward()
+        assert first.get_object("/World/Cuboid0").get_position()[2] == pytest.approx(0.5)
+        assert second.get_object("/World/Cuboid0").get_position()[2] < 0.5
+
+    def test_runtime_added_object_is_bound(self, make_headless_simulator):
+        """Test that objects added after initialize() read their new body."""
+        simulator = make_headless_simulator()
+        simulator.add_object(
+            CuboidConfig(
+                prim_path="/World/Extra",
+                position=[0, 1, 0.5],
+                orientation=[0, 0, 0, 1],
+                scale=[0.1, 0.1, 0.1],
+                color=[0, 1, 0],
+            )
+        )
+        np.testing.assert_allclose(simulator.get_object("/World/Extra").get_position(), [0, 1, 0.5])
+        # Existing objects are re-bound to the recompiled model
+        np.testing.assert_allclose(simulator.get_object("/World/Cuboid1").get_position(), [0.5, 0, 0.5])
+
+    def test_camera_pose_reads_bound_camera(
+        self, make_headless_simulator, arm_robot_config, arm_camera_config
+    ):
+        """Test that camera poses and parameters come from the cached camera id."""
+        simulator = make_headless_simulator(
+            robot_configs=[arm_robot_config], sensor_configs=[arm_camera_config]
+        )
+        camera = simulator.get_sensor(_CAMERA)
+        camera_id = simulator.model.camera_name2id(camera.sensor_model.camera_name)
+
+        with patch("gc.get_objects", side_effect=AssertionError("heap scan")):
+            parameters = camera.get_parameters()
+        np.testing.assert_array_equal(parameters["position"], simulator.data.cam_xpos[camera_id])
+        expected = Rotation.from_matrix(simulator.data.cam_xmat[camera_id].reshape(3, 3))
+        assert (Rotation.from_quat(parameters["orientation"]) * expected.inv()).magnitude() < 1e-9
+
+    def test_unbound_camera_raises_error(self, make_headless_simulator):
+        """Test that a camera missing from the compiled model is rejected."""
+        from physics_simulator.sensor.sensor_model import MujocoSensorModel
+
+        simulator = make_headless_simulator()
+        with pytest.raises(ValueError, match="not in the compiled model"):
+            MujocoSensorModel("missing", parent_entity_name=None).initialize(simulator)
+
+
+@pytest.mark.mujoco
+class TestBulkObjectState:
+    """Test suite for vectorized object state queries and teleports."""
+
+    def test_bulk_state_matches_single_queries(self, make_headless_simulator):
+        """Test that the gathered arrays match get_object_state() per object."""
+        simulator = make_headless_simulator(num_cuboids=4)
+        simulator.step(40)
+        simulator.forward()
+        prim_paths = [f"/World/Cuboid{i}" for i in (3, 0, 2)]
+
+        state = simulator.get_objects_state(prim_paths)
+        assert state["position"].shape == (3, 3)
+        assert state["orientation"].shape == (3, 4)
+        assert state["velocity"].shape == (3, 6)
+        for i, prim_path in enumerate(prim_paths):
+            single = simulator.get_object_state(prim_path)
+            np.testing.assert_array_equal(state["position"][i], single["position"])
+            np.testing.assert_array_equal(state["orientation"][i], single["orientation"])
+
+            # Velocities match MuJoCo's world-frame body velocity
+            body_id = simulator.model.body_name2id(
+                f"{simulator.get_object(prim_path).naming_prefix}main"
+            )
+            expected = np.zeros(6)
+            mujoco.mj_objectVelocity(
+                simulator.model._model, simulator.data._data,
+                mujoco.mjtObj.mjOBJ_BODY, body_id, expected, 0,
+            )
+            np.testing.assert_allclose(state["velocity"][i, :3], expected[3:], atol=1e-9)
+            np.testing.assert_allclose(state["velocity"][i, 3:], expected[:3], atol=1e-9)
+
+        assert len(simulator.get_objects_state()["position"]) == 4
+        with pytest.raises(KeyError):
+            simulator.get_objects_state(["/World/Missing"])
+
+    def test_set_objects_pose_teleports_with_one_forward(self, make_headless_simulator):
+        """Test that teleported objects report the written poses."""
+        simulator = make_headless_simulator(num_cuboids=3)
+        simulator.step(10)
+        prim_paths = ["/World/Cuboid2", "/World/Cuboid0"]
+        half_turn = np.sin(np.pi / 4)
+        poses = np.array([
+            [1.0, 2.0, 0.3, 0.0, 0.0, half_turn, half_turn],
+            [-1.0, 0.5, 0.8, 0.0, 0.0, 0.0, 1.0],
+        ])
+
+        with patch("mujoco.mj_forward", wraps=mujoco.mj_forward) as forward:
+            simulator.set_objects_pose(prim_paths, poses, zero_velocity=True)
+        assert forward.call_count == 1
+
+        state = simulator.get_objects_state(prim_paths)
+        np.testing.assert_allclose(state["position"], poses[:, :3])
+        np.testing.assert_allclose(state["orientation"], poses[:, 3:], atol=1e-12)
+        np.testing.assert_array_equal(state["velocity"], 0.0)
+        # Objects that were not teleported keep their pose
+        assert simulator.get_objects_state(["/World/Cuboid1"])["position"][0, 0] == pytest.approx(0.5)
+
+        with pytest.raises(ValueError):
+            simulator.set_objects_pose(prim_paths, poses[:1])
@@ -0,0 +1,118 @@
+"""
+Tests for the process-based MujocoEnvFarm.
+"""
+import os
+import pytest
+import numpy as np
+from unittest.mock import patch
+from synthnova_config import (
+    PhysicsSimulatorConfig,
+    MujocoConfig,
+    LoggerConfig,
+    ScenarioConfig,
+    GroundPlaneConfig,
+    CuboidConfig
+)
+from physics_simulator.simulator.env_farm import MujocoEnvFarm, _SharedArray
+from tests.conftest import _NullRenderContext
+
+
+@pytest.fixture
+def farm_config():
+    """Headless config with a single falling cuboid and no file logging."""
+    config = PhysicsSimulatorConfig()
+    config.mujoco_config = MujocoConfig(headless=True, use_model_cache=False)
+    config.logger_config = LoggerConfig(use_file_log=False, log_level="error")
+    config.scenario_config = ScenarioConfig(
+        name="farm_test",
+        ground_planes=[GroundPlaneConfig()],
+        objects=[
+            CuboidConfig(
+                prim_path="/World/Cuboid",
+                position=[0, 0, 0.5],
+                orientation=[0, 0, 0, 1],
+                scale=[0.1, 0.1, 0.1],
+                color=[1, 0, 0],
+            )
+        ],
+    )
+    return config
+
+
+@pytest.mark.unit
+class TestSharedArray:
+    """Test suite for the shared-memory arrays exchanged with workers."""
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX shared memory naming")
+    def test_attach_unregisters_slash_prefixed_name(self):
+        """Test that attached blocks share data and leave the block to its owner."""
+        owner = _SharedArray((4,), np.float64)
+        try:
+            with patch(
+                "physics_simulator.simulator.env_farm.resource_tracker.unregister"
+            ) as unregister:
+                name, shape, dtype = owner.spec
+                attached = _SharedArray(shape, dtype, name=name)
+            assert not owner.shm.name.startswith("/")
+            unregister.assert_called_once_with("/" + owner.shm.name, "shared_memory")
+
+            attached.array[:] = [1.0, 2.0, 3.0, 4.0]
+            np.testing.assert_array_equal(owner.array, [1.0, 2.0, 3.0, 4.0])
+            attached.close()
+        finally:
+            owner.close()
+
+
+@pytest.mark.slow
+@pytest.mark.mujoco
+class TestMujocoEnvFarm:
+    """Test suite for lockstep stepping of worker processes."""
+
+    def test_invalid_num_workers_raises_error(self, farm_config):
+        """Test that a non-positive number of workers is rejected."""
+        with pytest.raises(ValueError, match="num_workers"):
+            MujocoEnvFarm(farm_config, num_workers=0)
+
+    def test_lockstep_step_and_reset(self, farm_config):
+        """Test stepping all workers, resetting one and collecting latency."""
+        # Workers are forked so they inherit the patched render context
+        with patch(
+            "physics_simulator.simulator.mj_wrapper.MjRenderContextOffscreen",
+            _NullRenderContext,
+        ):
+            farm = MujocoEnvFarm(
+                farm_config, num_workers=2, start_method="fork", timeout=60
+            )
+
+        with farm:
+            assert farm.qpos.shape == (2, farm.dims["nq"])
+
+            farm.step(num_steps=10)
+            timestep = farm_config.mujoco_config.timestep
+            np.testing.assert_allclose(farm.time, 10 * timestep)
+            assert np.all(farm.qpos[:, 2] < 0.5)
+
+            farm.reset(worker_ids=[1])
+            assert farm.time[0] > 0
+            assert farm.time[1] == 0
+
+            latency = farm.get_step_latency()
+            np.testing.assert_array_equal(latency["count"], [1, 2])
+            assert np.all(latency["max"] > 0)
+
+    def test_worker_failure_reports_traceback(self, farm_config):
+        """Test that a worker failing mid-loop surfaces its error on the master."""
+        from physics_simulator.simulator import MujocoSimulator
+
+        with patch(
+            "physics_simulator.simulator.mj_wrapper.MjRenderContextOffscreen",
+            _NullRenderContext,
+        ), patch.object(MujocoSimulator, "step", side_effect=RuntimeError("step exploded")):
+            farm = MujocoEnvFarm(
+                farm_config, num_workers=2, start_method="fork", timeout=60
+            )
+
+        with farm:
+            with pytest.raises(RuntimeError, match="step exploded") as info:
+                farm.step()
+            assert "Environment worker" in str(info.value)
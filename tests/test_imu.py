@@ -0,0 +1,116 @@
+"""
+Tests for the buffered IMU.
+"""
+import numpy as np
+import pytest
+from synthnova_config import ImuConfig, ImuSensorConfig, LivoxMid360ImuSensorConfig
+
+
+def _imu_config(**kwargs):
+    """IMU resting in the world at one meter height."""
+    sensor_config = kwargs.pop("sensor_config", None) or ImuSensorConfig(frequency=kwargs.pop("frequency", None))
+    return ImuConfig(
+        name="imu",
+        prim_path="/World/Imu",
+        position=[3.0, 3.0, 1.0],
+        orientation=[0, 0, 0, 1],
+        sensor_config=sensor_config,
+        **kwargs,
+    )
+
+
+@pytest.mark.mujoco
+class TestImu:
+    """Test suite for MujocoImu sampling, batching and noise."""
+
+    def test_resting_imu_measures_gravity(self, make_headless_simulator):
+        """Test that a static IMU reads the gravity reaction and no rotation."""
+        simulator = make_headless_simulator(sensor_configs=[_imu_config()])
+        imu = simulator.get_sensor("/World/Imu")
+        assert imu.get_data() is None
+
+        simulator.step(10)
+        samples = imu.get_samples()
+        assert len(samples.time) == 10
+        dt = simulator.get_physics_dt()
+        np.testing.assert_allclose(samples.time, np.arange(10) * dt)
+        np.testing.assert_allclose(samples.linear_acceleration, [[0.0, 0.0, 9.81]] * 10, atol=1e-6)
+        np.testing.assert_allclose(samples.angular_velocity, 0.0, atol=1e-9)
+        latest = imu.get_data()
+        assert latest["time"] == pytest.approx(9 * dt)
+        np.testing.assert_allclose(imu.get_position(), [3.0, 3.0, 1.0])
+
+    def test_frequency_and_batched_reads(self, make_headless_simulator):
+        """Test the sampling rate of the Livox Mid-360 preset and draining with since_time."""
+        config = _imu_config(sensor_config=LivoxMid360ImuSensorConfig())
+        simulator = make_headless_simulator(sensor_configs=[config])
+        imu = simulator.get_sensor("/World/Imu")
+        assert imu.period == int(round(1.0 / (200 * simulator.get_physics_dt())))
+        assert imu.buffer_size == 200
+
+        simulator.step(10 * imu.period)
+        first = imu.get_samples()
+        assert len(first.time) == 10
+        np.testing.assert_allclose(np.diff(first.time), 1.0 / 200)
+
+        simulator.step(5 * imu.period)
+        second = imu.get_samples(since_time=first.time[-1])
+        assert len(second.time) == 5
+        assert second.time[0] > first.time[-1]
+
+    def test_ring_buffer_keeps_latest_samples(self, make_headless_simulator):
+        """Test that overflowing samples overwrite the oldest ones."""
+        simulator = make_headless_simulator(sensor_configs=[_imu_config()])
+        imu = simulator.get_sensor("/World/Imu")
+        dt = simulator.get_physics_dt()
+        # One second of samples by default
+        assert imu.buffer_size == int(round(1.0 / dt))
+
+        simulator.step(imu.buffer_size + 20)
+        samples = imu.get_samples()
+        assert len(samples.time) == imu.buffer_size
+        np.testing.assert_allclose(samples.time[[0, -1]], [20 * dt, (imu.buffer_size + 19) * dt])
+        assert np.all(np.diff(samples.time) > 0)
+
+    def test_bias_and_noise(self, make_headless_simulator):
+        """Test that the configured bias and noise are applied once per sample."""
+        sensor_config = ImuSensorConfig(
+            accelerometer_bias=[0.1, 0.0, 0.0],
+            gyroscope_bias=[0.0, 0.0, -0.2],
+            accelerometer_noise_std=0.05,
+        )
+        simulator = make_headless_simulator(sensor_configs=[_imu_config(sensor_config=sensor_config)])
+        imu = simulator.get_sensor("/World/Imu")
+        simulator.step(500)
+        samples = imu.get_samples()
+        # Reading again must not add noise twice
+        np.testing.assert_array_equal(imu.get_samples().linear_acceleration, samples.linear_acceleration)
+        np.testing.assert_allclose(samples.linear_acceleration.mean(axis=0), [0.1, 0.0, 9.81], atol=0.02)
+        assert samples.linear_acceleration.std(axis=0) == pytest.approx([0.05] * 3, rel=0.2)
+        np.testing.assert_allclose(samples.angular_velocity, [[0.0, 0.0, -0.2]] * 500, atol=1e-9)
+
+    def test_reset_and_physics_loop(self, make_headless_simulator):
+        """Test that the physics loop step samples and a time reset clears the buffer."""
+        simulator = make_headless_simulator(sensor_configs=[_imu_config()])
+        imu = simulator.get_sensor("/World/Imu")
+        simulator.step(5)
+        simulator._physics_step()
+        assert len(imu.get_samples().time) == 6
+
+        simulator.data._data.time = 0.0
+        simulator.step(2)
+        samples = imu.get_samples()
+        np.testing.assert_allclose(samples.time, [0.0, simulator.get_physics_dt()])
+
+    def test_add_imu_after_initialize(self, make_headless_simulator):
+        """Test that a runtime add recompiles the model and samples from the next step."""
+        simulator = make_headless_simulator()
+        simulator.step(5)
+        simulator.add_sensor(_imu_config())
+        imu = simulator.get_sensor("/World/Imu")
+
+        simulator.step(3)
+        samples = imu.get_samples()
+        dt = simulator.get_physics_dt()
+        np.testing.assert_allclose(samples.time, np.arange(5, 8) * dt)
+        np.testing.assert_allclose(samples.linear_acceleration, [[0.0, 0.0, 9.81]] * 3, atol=1e-6)
@@ -0,0 +1,65 @@
+"""
+Tests for kinematic replay of recorded trajectories.
+"""
+import numpy as np
+import pytest
+from physics_simulator.simulator.recorder import TrajectoryRecorder
+from physics_simulator.simulator.replay import KinematicReplay
+
+_CAMERA = "/World/Arm/base/arm_camera"
+
+
+@pytest.mark.mujoco
+class TestKinematicReplay:
+    """Test suite for seeking, striding and batched rendering of recordings."""
+
+    def test_seek_reproduces_recorded_poses(self, make_headless_simulator, tmp_path):
+        """Test that replayed body poses match the ones simulated."""
+        simulator = make_headless_simulator()
+        recorder = TrajectoryRecorder(simulator, str(tmp_path), chunk_size=8, attach=False)
+        recorder.start()
+        xpos = []
+        for _ in range(20):
+            simulator.step(5)
+            simulator.forward()
+            recorder.record()
+            xpos.append(simulator.data.xpos.copy())
+        recorder.stop()
+        live_qpos = simulator.data.qpos.copy()
+
+        with KinematicReplay(simulator, str(tmp_path)) as replay:
+            assert len(replay) == 20
+            replay.seek(7)
+            np.testing.assert_allclose(simulator.data.xpos, xpos[7])
+            replay.seek(-1)
+            np.testing.assert_allclose(simulator.data.xpos, xpos[-1])
+            with pytest.raises(IndexError):
+                replay.seek(20)
+
+        # The live state is restored when the replay exits
+        np.testing.assert_array_equal(simulator.data.qpos, live_qpos)
+
+    def test_stride_and_batched_rendering(
+        self, make_headless_simulator, arm_robot_config, arm_camera_config
+    ):
+        """Test that strided frames are rendered into fixed-size batches."""
+        simulator = make_headless_simulator(
+            robot_configs=[arm_robot_config], sensor_configs=[arm_camera_config]
+        )
+        qpos = np.repeat(simulator.data.qpos[None], 10, axis=0)
+
+        replay = KinematicReplay(simulator, qpos)
+        assert list(replay.iter_frames(start=1, stride=3, batch_size=2)) == [1, 4, 7]
+
+        batches = list(replay.render_batches([_CAMERA], stride=2, batch_size=2))
+        assert [frames.tolist() for frames, _ in batches] == [[0, 2], [4, 6], [8]]
+        frames, images = batches[-1]
+        height, width = arm_camera_config.sensor_config.height, arm_camera_config.sensor_config.width
+        assert images[_CAMERA].shape == (1, height, width, 3)
+
+    def test_mismatched_model_raises_error(self, make_headless_simulator):
+        """Test that a recording of another model is rejected."""
+        simulator = make_headless_simulator()
+
+        with pytest.raises(ValueError, match="nq"):
+            KinematicReplay(simulator, np.zeros((5, simulator.model.nq + 1)))
@@ -0,0 +1,137 @@
+"""
+Tests for the ray-cast 3D lidar.
+"""
+import numpy as np
+import pytest
+from synthnova_config import Lidar3DConfig, Lidar3DSensorConfig, LivoxMid360LidarSensorConfig
+
+
+def _lidar_config(**kwargs):
+    """Eight emitters looking 10 to 45 degrees down, over a quarter turn away from the cuboids."""
+    pose = kwargs.pop("pose", {"position": [3.0, 3.0, 1.0], "orientation": [0, 0, 0, 1]})
+    sensor_config = Lidar3DSensorConfig(
+        rotation_frequency=10,
+        valid_range=kwargs.pop("valid_range", [0.1, 40.0]),
+        num_of_point_cloud_per_data_frame=8 * 10,
+        num_of_emitters=8,
+        start_azimuth_deg=0,
+        end_azimuth_deg=90,
+        up_elevation_deg=-10,
+        down_elevation_deg=-45,
+    )
+    return Lidar3DConfig(
+        name="lidar", prim_path="/World/Lidar", sensor_config=sensor_config, **pose, **kwargs
+    )
+
+
+@pytest.mark.mujoco
+class TestLidar3D:
+    """Test suite for MujocoLidar3D scan patterns, ranges and scan rate."""
+
+    def test_scan_hits_the_ground(self, make_headless_simulator):
+        """Test that every ray of a downward pattern returns a ground point."""
+        simulator = make_headless_simulator(sensor_configs=[_lidar_config()])
+        lidar = simulator.get_sensor("/World/Lidar")
+        assert lidar.num_rays == 80
+        np.testing.assert_allclose(np.rad2deg(lidar.elevations[[0, -1]]), [-45, -10])
+        np.testing.assert_allclose(np.rad2deg(lidar.azimuths[[0, -1]]), [0, 90])
+
+        cloud = lidar.get_data()
+        assert cloud.shape == (80, 4)
+        np.testing.assert_allclose(np.linalg.norm(cloud[:, :3], axis=1), cloud[:, 3])
+        # Identity mounting: sensor frame points sit one meter below the lidar
+        np.testing.assert_allclose(cloud[:, 2], -1.0, atol=0.01)
+        world = lidar.get_data(world_frame=True)
+        np.testing.assert_allclose(world[:, :2], cloud[:, :2] + 3.0)
+        np.testing.assert_allclose(world[:, 2], 0.0, atol=0.01)
+
+    def test_valid_range_drops_far_returns(self, make_headless_simulator):
+        """Test that returns beyond the maximum range are removed."""
+        simulator = make_headless_simulator(sensor_configs=[_lidar_config(valid_range=[0.1, 2.0])])
+        lidar = simulator.get_sensor("/World/Lidar")
+        cloud = lidar.scan()
+        expected = 10 * np.count_nonzero(1.0 / np.sin(-lidar.elevations) <= 2.0)
+        assert len(cloud) == expected
+        assert cloud[:, 3].max() <= 2.0
+
+    def test_scans_follow_the_rotation_frequency(self, make_headless_simulator):
+        """Test that frames are reused within a rotation period."""
+        simulator = make_headless_simulator(sensor_configs=[_lidar_config()])
+        lidar = simulator.get_sensor("/World/Lidar")
+        first = lidar.get_data()
+        assert lidar.get_data() is first
+
+        steps = int(round(lidar.scan_period / simulator.get_physics_dt()))
+        simulator.step(steps - 1)
+        assert lidar.get_data() is first
+        simulator.step(1)
+        assert lidar.get_data() is not first
+        assert lidar.get_scan_time() == pytest.approx(lidar.scan_period)
+
+    def test_mounted_lidar_skips_its_parent_body(self, make_headless_simulator, arm_robot_config):
+        """Test that a lidar inside its parent link sees through it."""
+        config = _lidar_config(
+            pose={"translation": [0.0, 0.0, 0.0], "rotation": [0, 0, 0, 1]},
+            parent_entity_name="arm/base",
+        )
+        # Lift the arm so its base floats above the ground
+        arm_robot_config.position = [0.0, 0.0, 0.5]
+        simulator = make_headless_simulator(robot_configs=[arm_robot_config], sensor_configs=[config])
+        simulator.forward()
+        lidar = simulator.get_sensor("/World/Lidar")
+        base_id = simulator.model.body_name2id("arm/base")
+        np.testing.assert_allclose(lidar.get_position(), simulator.data.xpos[base_id])
+        cloud = lidar.get_data(world_frame=True)
+        assert len(cloud) > 0
+        np.testing.assert_allclose(cloud[:, 2], 0.0, atol=0.01)
+
+    def test_livox_mid360_preset(self, make_headless_simulator):
+        """Test the pattern and error model built from the Livox Mid-360 preset."""
+        config = Lidar3DConfig(
+            name="mid360",
+            prim_path="/World/Mid360",
+            position=[3.0, 3.0, 1.0],
+            orientation=[0, 0, 0, 1],
+            sensor_config=LivoxMid360LidarSensorConfig(),
+        )
+        simulator = make_headless_simulator(sensor_configs=[config])
+        lidar = simulator.get_sensor("/World/Mid360")
+        assert lidar.num_rays == 19968
+        assert lidar.azimuth_error[1] > 0
+
+        cloud = lidar.get_data()
+        assert 0 < len(cloud) < lidar.num_rays
+        assert cloud[:, 3].min() >= 0.1 and cloud[:, 3].max() <= 40.0
+        # Angular errors perturb the elevations around the nominal pattern
+        elevation = np.arcsin(cloud[:, 2] / cloud[:, 3])
+        offsets = np.abs(elevation[:, None] - lidar.elevations).min(axis=1)
+        assert 0 < offsets.max() < np.deg2rad(0.2)
+
+    def test_add_lidar_after_initialize(self, make_headless_simulator, arm_robot_config):
+        """Test that a runtime add recompiles the model and keeps the state."""
+        simulator = make_headless_simulator(robot_configs=[arm_robot_config])
+        simulator.step(5)
+        qpos = simulator.data.qpos.copy()
+
+        simulator.add_sensor(_lidar_config())
+        np.testing.assert_allclose(simulator.data.qpos, qpos)
+        lidar = simulator.get_sensor("/World/Lidar")
+        assert lidar.sensor_model.site_id >= 0
+        np.testing.assert_allclose(lidar.get_position(), [3.0, 3.0, 1.0])
+        assert len(lidar.get_data()) == lidar.num_rays
+
+    def test_unbound_site_raises_error(self, make_headless_simulator):
+        """Test that a site missing from the compiled model is rejected."""
+        from physics_simulator.sensor.sensor_model import MujocoSiteSensorModel
+
+        simulator = make_headless_simulator()
+        with pytest.raises(ValueError, match="not in the compiled model"):
+            MujocoSiteSensorModel("missing").initialize(simulator)
+
+    def test_invalid_pattern_raises_error(self, make_headless_simulator):
+        """Test that incomplete scan patterns are rejected."""
+        simulator = make_headless_simulator()
+        config = _lidar_config()
+        config.sensor_config.num_of_emitters = None
+        with pytest.raises(ValueError):
+            simulator.add_sensor(config)
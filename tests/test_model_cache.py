@@ -0,0 +1,129 @@
+"""
+Tests for the on-disk compiled model cache.
+"""
+import os
+import pytest
+import mujoco
+from physics_simulator.utils.model_cache import ModelCache
+
+
+_XML = """
+<mujoco>
+  <asset>
+    <hfield name="terrain" file="{file}"/>
+  </asset>
+  <worldbody>
+    <body name="box"><freejoint/><geom type="box" size="0.1 0.1 0.1"/></body>
+  </worldbody>
+</mujoco>
+"""
+
+
+@pytest.mark.unit
+class TestModelCache:
+    """Test suite for model cache keys, storage and eviction."""
+
+    def test_key_depends_on_asset_contents(self, tmp_path):
+        """Test that editing a referenced file changes the cache key."""
+        asset = tmp_path / "terrain.png"
+        asset.write_bytes(b"first")
+        xml = _XML.format(file=asset)
+
+        key = ModelCache.compute_key(xml)
+        assert key == ModelCache.compute_key(xml)
+
+        asset.write_bytes(b"second")
+        assert key != ModelCache.compute_key(xml)
+
+    def test_key_resolves_relative_asset_paths(self, tmp_path):
+        """Test that files found through meshdir/texturedir and the model directory are hashed."""
+        (tmp_path / "meshes").mkdir()
+        (tmp_path / "textures").mkdir()
+        mesh = tmp_path / "meshes" / "part.stl"
+        texture = tmp_path / "textures" / "wood.png"
+        mesh.write_bytes(b"mesh")
+        texture.write_bytes(b"texture")
+        xml = """
+        <mujoco>
+          <compiler meshdir="meshes/" texturedir="textures/"/>
+          <asset>
+            <mesh name="part" file="part.stl"/>
+            <texture name="wood" type="2d" file="wood.png"/>
+          </asset>
+        </mujoco>
+        """
+
+        key = ModelCache.compute_key(xml, model_dir=str(tmp_path))
+        mesh.write_bytes(b"edited mesh")
+        edited = ModelCache.compute_key(xml, model_dir=str(tmp_path))
+        assert edited != key
+        texture.write_bytes(b"edited texture")
+        assert ModelCache.compute_key(xml, model_dir=str(tmp_path)) != edited
+
+    def test_unreadable_asset_gives_no_key(self, tmp_path):
+        """Test that a model referencing a missing file is not cached under a partial key."""
+        assert ModelCache.compute_key(_XML.format(file=tmp_path / "missing.png")) is None
+
+    def test_store_and_load_roundtrip(self, tmp_path):
+        """Test that a stored model is loaded back from its binary."""
+        cache = ModelCache(cache_dir=str(tmp_path))
+        model = mujoco.MjModel.from_xml_string(
+            "<mujoco><worldbody><geom name='floor' type='plane' size='1 1 1'/></worldbody></mujoco>"
+        )
+
+        assert cache.load("missing") is None
+        cache.store("scene", model)
+        loaded = cache.load("scene")
+
+        assert loaded is not None
+        assert loaded.ngeom == model.ngeom
+        assert mujoco.mj_id2name(loaded, mujoco.mjtObj.mjOBJ_GEOM, 0) == "floor"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the oldest entries are removed beyond the size limit."""
+        model = mujoco.MjModel.from_xml_string("<mujoco/>")
+        cache = ModelCache(cache_dir=str(tmp_path), max_size_bytes=10**9)
+        cache.store("old", model)
+        cache.store("new", model)
+        os.utime(tmp_path / "old.mjb", (0, 0))
+
+        cache.max_size_bytes = os.path.getsize(tmp_path / "new.mjb")
+        cache.evict()
+
+        assert not (tmp_path / "old.mjb").exists()
+        assert (tmp_path / "new.mjb").exists()
+
+
+@pytest.mark.mujoco
+class TestSimulatorModelCache:
+    """Test suite for the model cache used by MujocoSimulator.initialize."""
+
+    def test_second_initialize_hits_cache(self, make_headless_simulator, basic_config):
+        """Test that an identical scene is loaded from the cache."""
+        cache_dir = basic_config.mujoco_config.model_cache_dir
+
+        # Primitive objects get unique default names, keep the scene identical
+        make_headless_simulator(num_cuboids=0)
+        assert len(os.listdir(cache_dir)) == 1
+
+        simulator = make_headless_simulator(num_cuboids=0)
+        messages = [call.args[0] for call in simulator.logger.log_info.call_args_list]
+        assert any("Model cache hit" in message for message in messages)
+        assert len(os.listdir(cache_dir)) == 1
+
+    def test_cache_can_be_disabled(self, make_headless_simulator, basic_config):
+        """Test that no binary is written when the cache is disabled."""
+        basic_config.mujoco_config.use_model_cache = False
+
+        make_headless_simulator()
+
+        assert not os.path.exists(basic_config.mujoco_config.model_cache_dir)
+
+    def test_unreadable_asset_bypasses_cache(self, make_headless_simulator, basic_config, monkeypatch):
+        """Test that the world is compiled without caching when its key cannot be computed."""
+        monkeypatch.setattr(ModelCache, "compute_key", staticmethod(lambda xml, model_dir=None: None))
+
+        simulator = make_headless_simulator()
+
+        assert simulator.model is not None
+        assert not os.path.exists(basic_config.mujoco_config.model_cache_dir)
@@ -0,0 +1,184 @@
+"""
+Tests for MujocoRobot joint state access.
+"""
+import threading
+
+import mujoco
+import numpy as np
+import pytest
+from synthnova_config import CuboidConfig
+
+
+@pytest.fixture
+def arm(make_headless_simulator, arm_robot_config):
+    """Headless simulator holding the two-joint arm, and the arm itself."""
+    simulator = make_headless_simulator(robot_configs=[arm_robot_config])
+    return simulator, simulator.get_robot("/World/Arm")
+
+
+@pytest.mark.mujoco
+class TestJointIndexTables:
+    """Test suite for cached joint index tables and vectorized joint access."""
+
+    def test_tables_are_cached_per_joint_order(self, arm):
+        """Test that tables follow the requested order and are reused."""
+        simulator, robot = arm
+        joint_names = robot.get_joint_names()
+        model = simulator.model._model
+
+        table = robot.get_joint_index_table()
+        assert table is robot.get_joint_index_table(tuple(joint_names))
+        reversed_table = robot.get_joint_index_table(joint_names[::-1])
+        assert reversed_table is robot.get_joint_index_table(list(joint_names[::-1]))
+        np.testing.assert_array_equal(reversed_table.qpos, table.qpos[::-1])
+
+        joint_ids = [simulator.model.joint_name2id(name) for name in joint_names]
+        np.testing.assert_array_equal(table.qpos, model.jnt_qposadr[joint_ids])
+        np.testing.assert_array_equal(table.dof, model.jnt_dofadr[joint_ids])
+        assert robot.get_joint_indexes(joint_names) == robot.joint_indexes
+
+    def test_reads_and_writes_use_the_given_order(self, arm):
+        """Test that gathers and control scatters match per-joint lookups."""
+        simulator, robot = arm
+        joint_names = robot.get_joint_names()
+        simulator.data.qpos[robot.joint_indexes] = [0.25, -0.5]
+        simulator.data.qvel[robot.get_joint_index_table().dof] = [1.0, 2.0]
+
+        np.testing.assert_array_equal(robot.get_joint_positions(), [0.25, -0.5])
+        np.testing.assert_array_equal(robot.get_joint_positions(joint_names[::-1]), [-0.5, 0.25])
+        np.testing.assert_array_equal(robot.get_joint_velocities(joint_names[::-1]), [2.0, 1.0])
+        # Joints missing from the model read as 0
+        np.testing.assert_array_equal(
+            robot.get_joint_velocities([joint_names[0], "missing"]), [1.0, 0.0]
+        )
+
+        robot.set_joint_positions([0.3, -0.1], joint_names[::-1])
+        actuator_ids = [simulator.model.actuator_name2id(name) for name in joint_names]
+        np.testing.assert_array_equal(simulator.data.ctrl[actuator_ids], [-0.1, 0.3])
+
+    def test_unknown_joints_raise_error(self, arm):
+        """Test that reading or commanding joints outside the robot fails."""
+        _, robot = arm
+        with pytest.raises(ValueError):
+            robot.get_joint_positions(["missing"])
+        with pytest.raises(ValueError):
+            robot.set_joint_positions([0.0], ["missing"])
+
+    def test_tables_are_rebuilt_after_recompile(self, arm):
+        """Test that runtime scene edits invalidate the cached tables."""
+        simulator, robot = arm
+        stale = robot.get_joint_index_table()
+        simulator.add_object(
+            CuboidConfig(
+                prim_path="/World/Extra",
+                position=[0, 1, 0.5],
+                orientation=[0, 0, 0, 1],
+                scale=[0.1, 0.1, 0.1],
+                color=[0, 1, 0],
+            )
+        )
+        assert robot.get_joint_index_table() is not stale
+        simulator.data.qpos[robot.joint_indexes] = [0.1, 0.2]
+        np.testing.assert_array_equal(robot.get_joint_positions(), [0.1, 0.2])
+
+
+@pytest.mark.mujoco
+class TestKinematicsEngine:
+    """Test suite for scratch-data batched forward kinematics."""
+
+    def test_batch_matches_live_forward_kinematics(self, arm):
+        """Test that batched poses match the live data posed with mj_forward."""
+        simulator, robot = arm
+        links = ["arm/link1", "arm/link2"]
+        q = np.random.default_rng(0).uniform(-1.0, 1.0, size=(5, 2))
+
+        live_qpos = simulator.data.qpos.copy()
+        positions, rotations = robot.fk_batch(q, links)
+        assert positions.shape == (5, 2, 3)
+        assert rotations.shape == (5, 2, 3, 3)
+        # The simulation is left untouched
+        np.testing.assert_array_equal(simulator.data.qpos, live_qpos)
+
+        body_ids = [simulator.model.body_name2id(link) for link in links]
+        for b in range(len(q)):
+            simulator.data.qpos[robot.joint_indexes] = q[b]
+            simulator.forward()
+            np.testing.assert_allclose(positions[b], simulator.data.xpos[body_ids])
+            np.testing.assert_allclose(
+                rotations[b], simulator.data.xmat[body_ids].reshape(-1, 3, 3)
+            )
+
+    def test_threaded_batches_match_single_thread(self, arm):
+        """Test that splitting a batch across threads gives the same poses."""
+        from physics_simulator.robot import KinematicsEngine
+
+        simulator, robot = arm
+        model = simulator.model._model
+        q = np.random.default_rng(1).uniform(-1.0, 1.0, size=(100, 2))
+        links = robot.robot_model.links_name
+
+        with KinematicsEngine(model, robot.get_joint_names(), links, num_threads=1) as single:
+            expected = single.forward(q)
+        with KinematicsEngine(model, robot.get_joint_names(), links, num_threads=4) as pooled:
+            positions, rotations = pooled.forward(q)
+        np.testing.assert_array_equal(positions, expected[0])
+        np.testing.assert_array_equal(rotations, expected[1])
+
+        with pytest.raises(ValueError):
+            pooled.forward(np.zeros((3, 5)))
+
+    def test_fk_link_leaves_simulation_untouched(self, arm):
+        """Test that single-configuration FK no longer writes the live qpos."""
+        simulator, robot = arm
+        live_qpos = simulator.data.qpos.copy()
+        position, rotation = robot.fk_link(np.array([0.4, -0.2]), "arm/link2")
+        assert position.shape == (3,) and rotation.shape == (3, 3)
+        np.testing.assert_array_equal(simulator.data.qpos, live_qpos)
+        with pytest.raises(ValueError):
+            robot.fk_link(np.zeros(2), "arm/missing")
+
+    def test_fk_link_waits_for_the_simulator_lock(self, arm):
+        """Test that single-configuration FK reads the live data under the simulator lock."""
+        simulator, robot = arm
+        results = []
+        worker = threading.Thread(target=lambda: results.append(robot.fk_link(np.zeros(1), "arm/link2")))
+        with simulator.lock:
+            worker.start()
+            worker.join(timeout=0.2)
+            # A stepping thread holds the lock, the live joint values must not be read
+            assert worker.is_alive()
+        worker.join(timeout=5.0)
+        assert len(results) == 1
+
+    def test_batched_jacobians_and_manipulability(self, arm):
+        """Test Jacobians against mj_jacBody on the live data, and the manipulability index."""
+        simulator, robot = arm
+        model, data = simulator.model._model, simulator.data._data
+        q = np.random.default_rng(2).uniform(-1.0, 1.0, size=(4, 2))
+        live_qpos = data.qpos.copy()
+
+        jacobians = robot.compute_jacobians(q, "arm/link2")
+        assert jacobians.shape == (4, 6, model.nv)
+        both = robot.compute_jacobians(q, ["arm/link1", "arm/link2"])
+        assert both.shape == (4, 2, 6, model.nv)
+        np.testing.assert_array_equal(both[:, 1], jacobians)
+        np.testing.assert_array_equal(data.qpos, live_qpos)
+
+        body_id = simulator.model.body_name2id("arm/link2")
+        for b in range(len(q)):
+            data.qpos[robot.joint_indexes] = q[b]
+            mujoco.mj_forward(model, data)
+            jacp, jacr = np.zeros((3, model.nv)), np.zeros((3, model.nv))
+            mujoco.mj_jacBody(model, data, jacp, jacr, body_id)
+            np.testing.assert_allclose(jacobians[b], np.vstack([jacp, jacr]), atol=1e-12)
+        np.testing.assert_allclose(robot.fk_jacobian(q[-1], "arm/link2"), jacobians[-1])
+
+        _, index, singular_values = robot.compute_jacobians(
+            q, "arm/link2", return_manipulability=True
+        )
+        arm_jacobians = jacobians[..., robot.get_joint_index_table().dof]
+        assert singular_values.shape == (4, 2)
+        np.testing.assert_allclose(
+            index,
+            np.sqrt(np.linalg.det(np.swapaxes(arm_jacobians, 1, 2) @ arm_jacobians)),
+        )
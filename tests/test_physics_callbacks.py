@@ -0,0 +1,106 @@
+"""
+Tests for rate-divided, prioritized physics callbacks.
+"""
+import pytest
+from physics_simulator.simulator.callbacks import PhysicsCallback
+
+
+@pytest.mark.unit
+class TestPhysicsCallback:
+    """Test suite for the PhysicsCallback wrapper."""
+
+    def test_invalid_arguments_raise_error(self):
+        """Test that non-positive periods and unknown phases are rejected."""
+        with pytest.raises(ValueError, match="period"):
+            PhysicsCallback("cb", lambda: None, period=0)
+        with pytest.raises(ValueError, match="phase"):
+            PhysicsCallback("cb", lambda: None, phase="mid_step")
+
+    def test_records_execution_time(self):
+        """Test that calls and timing statistics are accumulated."""
+        callback = PhysicsCallback("cb", lambda: None, period=3)
+        for _ in range(4):
+            callback()
+
+        stats = callback.get_stats()
+        assert stats["calls"] == 4
+        assert stats["period"] == 3
+        assert stats["max_time"] >= stats["mean_time"] >= 0.0
+        assert stats["total_time"] == pytest.approx(4 * stats["mean_time"])
+
+
+@pytest.mark.mujoco
+class TestSimulatorPhysicsCallbacks:
+    """Test suite for callback rates, priorities and phases in MujocoSimulator.loop."""
+
+    def test_period_and_frequency_divide_rate(self, make_headless_simulator):
+        """Test that callbacks run every N steps or at the requested rate."""
+        simulator = make_headless_simulator()
+        timestep = simulator.get_physics_dt()
+        calls = {"every": 0, "fifth": 0, "hz": 0}
+        simulator.add_physics_callback(
+            "every", lambda: calls.__setitem__("every", calls["every"] + 1)
+        )
+        simulator.add_physics_callback(
+            "fifth", lambda: calls.__setitem__("fifth", calls["fifth"] + 1), period=5
+        )
+        simulator.add_physics_callback(
+            "hz",
+            lambda: calls.__setitem__("hz", calls["hz"] + 1),
+            frequency=1.0 / (10 * timestep),
+        )
+
+        simulator.loop(real_time_factor=None, duration=100 * timestep)
+
+        assert calls == {"every": 100, "fifth": 20, "hz": 10}
+        assert simulator.get_physics_callback_stats("hz")["period"] == 10
+
+    def test_priority_orders_callbacks(self, make_headless_simulator):
+        """Test that lower priorities run first and ties keep registration order."""
+        simulator = make_headless_simulator()
+        order = []
+        simulator.add_physics_callback("late", lambda: order.append("late"), priority=10)
+        simulator.add_physics_callback("first", lambda: order.append("first"), priority=-1)
+        simulator.add_physics_callback("second", lambda: order.append("second"))
+        simulator.add_physics_callback("third", lambda: order.append("third"))
+
+        simulator.loop(real_time_factor=None, duration=simulator.get_physics_dt())
+
+        assert order == ["first", "second", "third", "late"]
+
+    def test_pre_step_runs_before_integration(self, make_headless_simulator):
+        """Test that pre_step callbacks run between mj_step1 and mj_step2."""
+        simulator = make_headless_simulator()
+        timestep = simulator.get_physics_dt()
+        times = []
+        simulator.add_physics_callback(
+            "post", lambda: times.append(("post", simulator.get_simulation_time()))
+        )
+        simulator.add_physics_callback(
+            "pre",
+            lambda: times.append(("pre", simulator.get_simulation_time())),
+            phase="pre_step",
+        )
+
+        simulator.loop(real_time_factor=None, duration=2 * timestep)
+
+        assert [phase for phase, _ in times] == ["pre", "post", "pre", "post"]
+        assert times[0][1] == pytest.approx(0.0)
+        assert times[1][1] == pytest.approx(timestep)
+
+    def test_stats_and_invalid_rates(self, make_headless_simulator):
+        """Test statistics of all callbacks and rejection of conflicting rates."""
+        simulator = make_headless_simulator()
+        simulator.add_physics_callback("noop", lambda: None, period=2)
+
+        with pytest.raises(ValueError, match="either period or frequency"):
+            simulator.add_physics_callback("both", lambda: None, period=2, frequency=10.0)
+        with pytest.raises(ValueError, match="frequency"):
+            simulator.add_physics_callback("negative", lambda: None, frequency=-1.0)
+
+        simulator.loop(real_time_factor=None, duration=10 * simulator.get_physics_dt())
+
+        stats = simulator.get_physics_callback_stats()
+        assert list(stats) == ["noop"]
+        assert stats["noop"]["calls"] == 5
+        assert stats["noop"]["phase"] == "post_step"
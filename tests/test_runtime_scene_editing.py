@@ -0,0 +1,133 @@
+"""
+Tests for adding and removing entities after MujocoSimulator.initialize.
+"""
+import pytest
+import numpy as np
+from synthnova_config import CuboidConfig
+
+
+def _cuboid(prim_path, position):
+    return CuboidConfig(
+        prim_path=prim_path,
+        position=position,
+        orientation=[0, 0, 0, 1],
+        scale=[0.1, 0.1, 0.1],
+        color=[0, 1, 0],
+    )
+
+
+@pytest.mark.mujoco
+class TestRuntimeSceneEditing:
+    """Test suite for MjSpec-based attach/detach with state preservation."""
+
+    def test_add_object_after_initialize_keeps_state(self, make_headless_simulator):
+        """Test attaching an object keeps the time and pose of existing bodies."""
+        simulator = make_headless_simulator(num_cuboids=1)
+        simulator.step(100)
+        # Body poses lag qpos by one step after mj_step
+        simulator.forward()
+        time_before = simulator.get_simulation_time()
+        position_before = simulator.get_object_state("/World/Cuboid0")["position"]
+
+        simulator.add_object(_cuboid("/World/Obstacle", [2.0, 0.0, 0.5]))
+
+        assert simulator.get_simulation_time() == pytest.approx(time_before)
+        np.testing.assert_allclose(
+            simulator.get_object_state("/World/Cuboid0")["position"], position_before
+        )
+        np.testing.assert_allclose(
+            simulator.get_object_state("/World/Obstacle")["position"], [2.0, 0.0, 0.5]
+        )
+
+        # The new object is simulated
+        simulator.step(100)
+        assert simulator.get_object_state("/World/Obstacle")["position"][2] < 0.5
+
+    def test_remove_object_after_initialize(self, make_headless_simulator):
+        """Test detaching an object shrinks the model and keeps the others."""
+        simulator = make_headless_simulator(num_cuboids=2)
+        simulator.step(50)
+        simulator.forward()
+        nbody = simulator.model.nbody
+        position_before = simulator.get_object_state("/World/Cuboid0")["position"]
+
+        simulator.remove_object("/World/Cuboid1")
+
+        assert simulator.model.nbody == nbody - 1
+        with pytest.raises(KeyError):
+            simulator.get_object("/World/Cuboid1")
+        np.testing.assert_allclose(
+            simulator.get_object_state("/World/Cuboid0")["position"], position_before
+        )
+
+    def test_remove_object_before_initialize(self, basic_config):
+        """Test removing an object before initialize drops it from the world XML."""
+        from unittest.mock import Mock, patch
+        from physics_simulator import PhysicsSimulator
+
+        with patch.object(PhysicsSimulator, "_load_logger", return_value=Mock()):
+            simulator = PhysicsSimulator(basic_config)
+        simulator.add_object(_cuboid("/World/Cuboid", [0, 0, 0.5]))
+        name = simulator.get_object("/World/Cuboid").get_obj().get("name")
+
+        simulator.remove_object("/World/Cuboid")
+
+        assert name not in simulator.world.get_xml()
+
+    def test_add_robot_after_initialize(self, make_headless_simulator, arm_robot_config):
+        """Test attaching a robot keeps the state of existing bodies and binds the robot."""
+        simulator = make_headless_simulator(num_cuboids=1)
+        simulator.step(50)
+        simulator.forward()
+        position_before = simulator.get_object_state("/World/Cuboid0")["position"]
+
+        simulator.add_robot(arm_robot_config)
+
+        np.testing.assert_allclose(
+            simulator.get_object_state("/World/Cuboid0")["position"], position_before
+        )
+        robot = simulator.get_robot("/World/Arm")
+        joint_names = robot.get_joint_names()
+        assert joint_names == ["arm/joint1", "arm/joint2"]
+        simulator.data.qpos[robot.joint_indexes] = [0.25, -0.5]
+        np.testing.assert_array_equal(robot.get_joint_positions(), [0.25, -0.5])
+        robot.set_joint_positions([0.5, -0.5], joint_names)
+        actuator_ids = [simulator.model.actuator_name2id(name) for name in joint_names]
+        np.testing.assert_array_equal(simulator.data.ctrl[actuator_ids], [0.5, -0.5])
+        simulator.step(10)
+
+    def test_remove_robot_removes_mounted_sensors(
+        self, make_headless_simulator, arm_robot_config, arm_camera_config
+    ):
+        """Test that removing a robot after initialize also removes the sensors mounted on it."""
+        from synthnova_config import ImuConfig, ImuSensorConfig
+
+        imu_config = ImuConfig(
+            name="arm_imu",
+            prim_path="/World/Arm/link2/arm_imu",
+            translation=[0.3, 0, 0],
+            rotation=[0, 0, 0, 1],
+            parent_entity_name="arm/link2",
+            sensor_config=ImuSensorConfig(),
+        )
+        simulator = make_headless_simulator(
+            num_cuboids=1,
+            robot_configs=[arm_robot_config],
+            sensor_configs=[arm_camera_config, imu_config],
+        )
+        simulator.step(10)
+        nbody = simulator.model.nbody
+
+        simulator.remove_robot("/World/Arm")
+
+        # Base, two links and the two sensor bodies
+        assert simulator.model.nbody == nbody - 5
+        assert simulator.model.ncam == 0
+        assert simulator.model.nsensor == 0
+        with pytest.raises(KeyError):
+            simulator.get_robot("/World/Arm")
+        for prim_path in ("/World/Arm/base/arm_camera", "/World/Arm/link2/arm_imu"):
+            with pytest.raises(KeyError):
+                simulator.get_sensor(prim_path)
+        assert not simulator._step_samplers
+        simulator.step(10)
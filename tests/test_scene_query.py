@@ -0,0 +1,111 @@
+"""
+Tests for batched ray casting and geom distance queries.
+"""
+import mujoco
+import numpy as np
+import pytest
+from physics_simulator.simulator import SceneQuery
+
+
+@pytest.fixture
+def scene(make_headless_simulator):
+    """Headless simulator with two cuboids hovering at z=0.5, and its query service."""
+    simulator = make_headless_simulator()
+    simulator.forward()
+    return simulator, simulator.get_scene_query()
+
+
+def _half_height(simulator, query, prim_path):
+    return simulator.model._model.geom_size[query.get_geom_ids(prim_path)[0], 2]
+
+
+@pytest.mark.mujoco
+class TestSceneQuery:
+    """Test suite for SceneQuery rays, filters and distances."""
+
+    def test_single_origin_batch(self, scene):
+        """Test hits, misses and metric distances for rays sharing an origin."""
+        simulator, query = scene
+        assert isinstance(query, SceneQuery)
+        assert simulator.get_scene_query() is query
+        half = _half_height(simulator, query, "/World/Cuboid0")
+
+        directions = np.array([[0.0, 0.0, -3.0], [1.0, 0.0, 0.0]])
+        hits = query.cast_rays([0.0, 0.0, 2.0], directions)
+        assert hits.distance[0] == pytest.approx(1.5 - half)
+        assert hits.geom_id[0] in query.get_geom_ids("/World/Cuboid0")
+        np.testing.assert_allclose(hits.point[0], [0.0, 0.0, 0.5 + half])
+        assert hits.distance[1] == -1 and hits.geom_id[1] == -1
+        assert np.isnan(hits.point[1]).all()
+
+        # Cutoff and group filters turn the hit into a miss
+        assert query.cast_rays([0.0, 0.0, 2.0], directions[:1], max_distance=1.0).geom_id[0] == -1
+        assert query.cast_rays([0.0, 0.0, 2.0], directions[:1], geomgroup=[0] * 6).geom_id[0] == -1
+
+    def test_grouped_origins_match_single_rays(self, scene):
+        """Test that a batch with repeated origins matches mj_ray ray by ray."""
+        simulator, query = scene
+        model, data = simulator.model._model, simulator.data._data
+        rng = np.random.default_rng(0)
+        origins = rng.uniform([-0.5, -0.5, 1.0], [1.0, 0.5, 2.0], size=(4, 3))
+        origins = origins[rng.integers(0, 4, size=200)]
+        directions = rng.normal(size=(200, 3))
+        directions[:, 2] = -np.abs(directions[:, 2]) - 1.0
+
+        hits = query.cast_rays(origins, directions, copy=True)
+        geom_id = np.zeros(1, dtype=np.int32)
+        for i in range(len(origins)):
+            unit = directions[i] / np.linalg.norm(directions[i])
+            expected = mujoco.mj_ray(model, data, origins[i], unit, None, 1, -1, geom_id)
+            assert hits.distance[i] == pytest.approx(expected)
+            assert hits.geom_id[i] == geom_id[0]
+        hit = hits.geom_id >= 0
+        np.testing.assert_allclose(
+            hits.point[hit], origins[hit] + hits.distance[hit, None] * directions[hit]
+            / np.linalg.norm(directions[hit], axis=1, keepdims=True)
+        )
+
+        with pytest.raises(ValueError):
+            query.cast_rays(origins[:3], directions)
+
+    def test_excluded_body_and_buffer_reuse(self, scene):
+        """Test that excluded bodies are passed through and outputs reuse buffers."""
+        simulator, query = scene
+        first = query.cast_rays([0.0, 0.0, 2.0], [[0.0, 0.0, -1.0]])
+        through = query.cast_rays([0.0, 0.0, 2.0], [[0.0, 0.0, -1.0]], exclude_body="/World/Cuboid0")
+        assert np.shares_memory(first.distance, through.distance)
+        assert through.distance[0] == pytest.approx(2.0, abs=0.01)
+        assert through.geom_id[0] not in query.get_geom_ids("/World/Cuboid0")
+        with pytest.raises(KeyError):
+            query.cast_rays([0.0, 0.0, 2.0], [[0.0, 0.0, -1.0]], exclude_body="/World/Missing")
+
+    def test_geom_and_entity_distances(self, scene):
+        """Test pairwise geom distances and the closest distance between entities."""
+        simulator, query = scene
+        half = _half_height(simulator, query, "/World/Cuboid0")
+        geom0 = query.get_geom_ids("/World/Cuboid0")[0]
+        geom1 = query.get_geom_ids("/World/Cuboid1")[0]
+
+        distances = query.geom_distances([[geom0, geom1], [geom1, geom0]], distmax=2.0)
+        np.testing.assert_allclose(distances.distance, 0.5 - 2 * half)
+        np.testing.assert_allclose(distances.fromto[0, [0, 3]], [half, 0.5 - half])
+        # Pairs beyond distmax report distmax
+        assert query.geom_distances([[geom0, geom1]], distmax=0.1).distance[0] == pytest.approx(0.1)
+
+        closest = query.entity_distance("/World/Cuboid0", "/World/Cuboid1", distmax=2.0)
+        assert closest.distance == pytest.approx(0.5 - 2 * half)
+        assert closest.fromto.shape == (6,)
+        with pytest.raises(ValueError):
+            query.geom_distances([geom0, geom1])
+
+    def test_entity_without_geoms_raises_error(self, scene, monkeypatch):
+        """Test that distances from an entity without geoms are rejected."""
+        simulator, query = scene
+        get_geom_ids = query.get_geom_ids
+        monkeypatch.setattr(
+            query,
+            "get_geom_ids",
+            lambda prim_path: get_geom_ids(prim_path)[:0] if prim_path == "/World/Cuboid1" else get_geom_ids(prim_path),
+        )
+        with pytest.raises(ValueError, match="no geoms"):
+            query.entity_distance("/World/Cuboid0", "/World/Cuboid1")
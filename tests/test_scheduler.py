@@ -0,0 +1,90 @@
+"""
+Tests for the fixed-rate RealTimeScheduler driving MujocoSimulator.loop.
+"""
+import pytest
+from physics_simulator.simulator.scheduler import RealTimeScheduler
+
+
+class _FakeClock:
+    """Wall clock advancing by a fixed amount on every read."""
+
+    def __init__(self, increment):
+        self.now = 0.0
+        self.increment = increment
+        self.sleeps = []
+
+    def __call__(self):
+        self.now += self.increment
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.mujoco
+class TestRealTimeScheduler:
+    """Test suite for real-time factor, catch-up limits and callback dispatch."""
+
+    def test_invalid_arguments_raise_error(self, make_headless_simulator):
+        """Test that non-positive rates and catch-up limits are rejected."""
+        simulator = make_headless_simulator()
+
+        with pytest.raises(ValueError, match="real_time_factor"):
+            RealTimeScheduler(simulator, real_time_factor=0)
+        with pytest.raises(ValueError, match="max_catch_up_steps"):
+            RealTimeScheduler(simulator, max_catch_up_steps=0)
+
+    def test_callbacks_run_once_per_physics_step(self, make_headless_simulator):
+        """Test deterministic callback dispatch when running as fast as possible."""
+        simulator = make_headless_simulator()
+        calls = []
+        simulator.add_physics_callback(
+            "record_time", lambda: calls.append(simulator.get_simulation_time())
+        )
+
+        duration = 50 * simulator.get_physics_dt()
+        stats = simulator.loop(real_time_factor=None, duration=duration)
+
+        assert stats["steps"] == 50
+        assert len(calls) == 50
+        assert calls[-1] == pytest.approx(duration)
+        assert simulator.is_running()
+
+    def test_sleeps_until_deadline_when_ahead(self, make_headless_simulator):
+        """Test the scheduler waits for the next deadline instead of stepping early."""
+        simulator = make_headless_simulator()
+        timestep = simulator.get_physics_dt()
+        clock = _FakeClock(increment=0.0)
+
+        scheduler = RealTimeScheduler(
+            simulator, real_time_factor=20.0, clock=clock, sleep=clock.sleep
+        )
+        stats = scheduler.run(max_steps=10)
+
+        assert stats["steps"] == 10
+        assert stats["overruns"] == 0
+        assert clock.sleeps[0] == pytest.approx(timestep / 20.0)
+        assert stats["real_time_factor"] == pytest.approx(20.0)
+
+    def test_catch_up_limit_drops_steps(self, make_headless_simulator):
+        """Test that falling far behind drops steps instead of bursting."""
+        simulator = make_headless_simulator()
+        timestep = simulator.get_physics_dt()
+        # Every clock read is 100 step periods late
+        clock = _FakeClock(increment=100 * timestep)
+
+        scheduler = RealTimeScheduler(
+            simulator,
+            real_time_factor=1.0,
+            max_catch_up_steps=5,
+            clock=clock,
+            sleep=clock.sleep,
+        )
+        stats = scheduler.run(max_steps=20)
+
+        assert stats["steps"] == 20
+        assert stats["ticks"] == 4
+        assert stats["overruns"] == 4
+        assert stats["dropped_steps"] > 0
+        assert stats["max_lag"] > 0
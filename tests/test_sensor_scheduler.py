@@ -0,0 +1,169 @@
+"""
+Tests for frequency-aware camera rendering and frame caching.
+"""
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from synthnova_config import DepthCameraConfig, RealsenseD415DepthSensorConfig
+
+from physics_simulator.simulator.replay import KinematicReplay
+
+_CAMERA = "/World/Arm/base/arm_camera"
+
+
+@pytest.fixture
+def camera_scene(make_headless_simulator, arm_robot_config, arm_camera_config):
+    """Headless simulator with the 60 Hz arm camera, counting the renders."""
+    simulator = make_headless_simulator(
+        robot_configs=[arm_robot_config], sensor_configs=[arm_camera_config]
+    )
+    simulator.render = Mock(wraps=simulator.render)
+    return simulator, simulator.get_sensor(_CAMERA)
+
+
+@pytest.mark.mujoco
+class TestSensorScheduler:
+    """Test suite for SensorScheduler with RGB and depth cameras."""
+
+    def test_repeated_reads_share_a_frame(self, camera_scene):
+        """Test that reads within a step are served from the cache."""
+        simulator, camera = camera_scene
+        rgb = camera.get_rgb()
+        assert camera.get_rgb() is rgb
+        assert camera.get_data() is rgb
+        assert simulator.render.call_count == 1
+        assert camera.get_frame_time("rgb") == simulator.data._data.time
+
+        # Frame kinds are cached separately
+        camera.get_segmentation()
+        camera.get_segmentation()
+        assert simulator.render.call_count == 2
+        assert camera.get_frame_time("depth") is None
+
+    def test_renders_follow_the_camera_frequency(self, camera_scene):
+        """Test that a new frame is rendered once per camera period."""
+        simulator, camera = camera_scene
+        assert camera.scheduler.period == pytest.approx(1.0 / 60)
+        steps = int(round(camera.scheduler.period / simulator.get_physics_dt()))
+
+        camera.get_rgb()
+        for _ in range(3 * steps):
+            simulator.step(1)
+            camera.get_rgb()
+        assert simulator.render.call_count == 4
+        assert camera.get_frame_time() == pytest.approx(3 * steps * simulator.get_physics_dt())
+
+        # Going back in time renders again
+        simulator.data._data.time = 0.0
+        camera.get_rgb()
+        assert simulator.render.call_count == 5
+
+    def test_without_frequency_renders_once_per_step(self, camera_scene):
+        """Test that cameras without a frequency render at most once per step."""
+        simulator, camera = camera_scene
+        camera.scheduler.frequency = None
+        for _ in range(3):
+            camera.get_rgb()
+            camera.get_rgb()
+            simulator.step(1)
+        assert simulator.render.call_count == 3
+
+        camera.scheduler.invalidate()
+        camera.get_rgb()
+        assert simulator.render.call_count == 4
+
+    def test_scene_changes_render_again(self, camera_scene):
+        """Test that writers changing the scene without stepping drop the cached frames."""
+        from physics_simulator.simulator import DomainRandomizer
+
+        simulator, camera = camera_scene
+        robot = simulator.get_robot("/World/Arm")
+        state = simulator.save_state()
+        randomizer = DomainRandomizer(simulator, seed=0)
+        randomizer.add_color(["/World/Cuboid0"])
+
+        def write_qpos():
+            simulator.data.qpos[robot.joint_indexes] = [0.5, -0.5]
+            simulator.forward()
+
+        writers = [
+            write_qpos,
+            lambda: simulator.set_objects_pose(["/World/Cuboid0"], [[0, 1, 0.5, 0, 0, 0, 1]]),
+            lambda: robot.set_joint_positions([0.1, 0.2], robot.get_joint_names(), immediate=True),
+            lambda: simulator.restore_state(state),
+            simulator.reset,
+            randomizer.randomize,
+        ]
+        rgb = camera.get_rgb()
+        for count, writer in enumerate(writers, start=2):
+            writer()
+            new_rgb = camera.get_rgb()
+            assert new_rgb is not rgb
+            assert simulator.render.call_count == count
+            rgb = new_rgb
+
+    def test_cached_frames_are_read_only(self, camera_scene):
+        """Test that readers sharing a cached frame cannot modify it."""
+        _, camera = camera_scene
+        rgb = camera.get_rgb()
+        with pytest.raises(ValueError):
+            rgb[0, 0] = 255
+        drawn = rgb.copy()
+        drawn[0, 0] = 255
+        assert camera.get_rgb() is rgb
+
+    def test_depth_render_caches_rgb(self, make_headless_simulator):
+        """Test that the depth camera reuses one render for depth and RGB."""
+        config = DepthCameraConfig(
+            name="depth_camera",
+            prim_path="/World/DepthCamera",
+            position=[1.0, 0.0, 1.0],
+            orientation=[0, 0, 0, 1],
+            sensor_config=RealsenseD415DepthSensorConfig(),
+        )
+        simulator = make_headless_simulator(sensor_configs=[config])
+        simulator.render = Mock(wraps=simulator.render)
+        camera = simulator.get_sensor("/World/DepthCamera")
+
+        depth = camera.get_data()
+        assert camera.get_depth() is depth
+        assert camera.get_rgb().shape == (camera.height, camera.width, 3)
+        assert simulator.render.call_count == 1
+        assert simulator.render.call_args.kwargs["depth"] is True
+
+    def test_replay_renders_every_frame(self, camera_scene):
+        """Test that replayed frames are not served from the cache."""
+        simulator, camera = camera_scene
+        qpos = np.repeat(simulator.data.qpos[None], 4, axis=0)
+        replay = KinematicReplay(simulator, qpos, times=np.zeros(4))
+        list(replay.render_batches([_CAMERA], batch_size=4))
+        assert simulator.render.call_count == 4
+
+
+@pytest.mark.mujoco
+class TestOffscreenRendering:
+    """Test suite rendering real pixels, skipped without OpenGL."""
+
+    def test_rendered_content_follows_the_scene(
+        self, make_rendering_simulator, arm_robot_config, arm_camera_config
+    ):
+        """Test that moving an object in view changes the image, and moving it back restores it."""
+        simulator = make_rendering_simulator(
+            robot_configs=[arm_robot_config], sensor_configs=[arm_camera_config]
+        )
+        camera = simulator.get_sensor(_CAMERA)
+        # One meter in front of the camera, which looks along +x from the arm base
+        in_view = [[1.5, 0, 0.4, 0, 0, 0, 1]]
+
+        simulator.set_objects_pose(["/World/Cuboid1"], in_view)
+        with_cuboid = camera.get_rgb()
+        assert with_cuboid.shape == (camera.height, camera.width, 3)
+        assert with_cuboid.any()
+
+        simulator.set_objects_pose(["/World/Cuboid1"], [[-5.0, 5.0, 0.05, 0, 0, 0, 1]])
+        without_cuboid = camera.get_rgb()
+        assert not np.array_equal(without_cuboid, with_cuboid)
+
+        simulator.set_objects_pose(["/World/Cuboid1"], in_view)
+        np.testing.assert_array_equal(camera.get_rgb(), with_cuboid)
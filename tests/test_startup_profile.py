@@ -0,0 +1,54 @@
+"""
+Tests for lazy package imports and the startup profiler.
+"""
+import subprocess
+import sys
+import pytest
+from unittest.mock import patch
+from tests.conftest import _NullRenderContext
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Test suite for PEP 562 lazy package attributes."""
+
+    def test_import_does_not_load_heavy_modules(self):
+        """Test that importing the package defers mujoco and the config models."""
+        code = (
+            "import sys, physics_simulator, physics_simulator.simulator, physics_simulator.utils; "
+            "print(any(m in sys.modules for m in ('mujoco', 'synthnova_config', 'tifffile')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_lazy_attributes_resolve(self):
+        """Test that public names still resolve on first access."""
+        import physics_simulator
+        from physics_simulator.simulator import MujocoSimulator
+
+        assert physics_simulator.PhysicsSimulator is MujocoSimulator
+        with pytest.raises(AttributeError):
+            physics_simulator.Missing
+
+
+@pytest.mark.mujoco
+class TestStartupProfile:
+    """Test suite for the startup profiler entry point."""
+
+    def test_reports_every_phase(self, capsys):
+        """Test that the profiler times every phase and prints a report."""
+        from physics_simulator.startup_profile import PHASES, main, profile_startup
+
+        with patch(
+            "physics_simulator.simulator.mj_wrapper.MjRenderContextOffscreen",
+            _NullRenderContext,
+        ):
+            profile = profile_startup(num_cuboids=2, use_model_cache=False)
+            assert main(["--num-cuboids", "1", "--no-model-cache"]) == 0
+
+        assert set(PHASES) <= set(profile["phases"])
+        assert profile["phases"]["compile"] > 0
+        assert profile["total"] == pytest.approx(sum(profile["phases"].values()))
+        assert "render_context" in capsys.readouterr().out
@@ -0,0 +1,89 @@
+"""
+Tests for lock-free double-buffered state publication.
+"""
+import threading
+import pytest
+import numpy as np
+
+
+@pytest.mark.mujoco
+class TestStatePublisher:
+    """Test suite for snapshots published after every step."""
+
+    def test_disabled_by_default(self, make_headless_simulator):
+        """Test that reading a snapshot requires the opt-in config flag."""
+        simulator = make_headless_simulator()
+
+        assert not simulator.is_publishing_state()
+        with pytest.raises(RuntimeError, match="publish_state"):
+            simulator.get_published_state()
+
+    def test_snapshot_matches_data_after_step(self, make_headless_simulator, basic_config):
+        """Test that the latest snapshot holds the state of the last step."""
+        basic_config.mujoco_config.publish_state = True
+        simulator = make_headless_simulator()
+        simulator.step(20)
+
+        snapshot = simulator.get_published_state()
+        assert snapshot.step == 20
+        assert snapshot.time == pytest.approx(simulator.data.time)
+        np.testing.assert_array_equal(snapshot.qpos, simulator.data.qpos)
+        np.testing.assert_array_equal(snapshot.xquat, simulator.data.xquat)
+        with pytest.raises(ValueError):
+            snapshot.qpos[0] = 1.0
+
+        # A copy survives later publishes, the shared snapshot does not
+        state = simulator.get_published_state(copy=True)
+        simulator.step(1)
+        simulator.step(1)
+        assert state["step"] == 20
+        assert simulator.get_published_state().step == 22
+
+    def test_reset_and_restore_are_published(self, make_headless_simulator, basic_config):
+        """Test that state changes outside of stepping are published too."""
+        basic_config.mujoco_config.publish_state = True
+        simulator = make_headless_simulator()
+        saved = simulator.save_state()
+        simulator.step(10)
+
+        simulator.restore_state(saved)
+        assert simulator.get_published_state().step == 0
+        simulator.step(5)
+        simulator.reset()
+        assert simulator.get_published_state().time == 0.0
+
+    def test_robot_state_served_from_snapshot(
+        self, make_headless_simulator, basic_config, arm_robot_config
+    ):
+        """Test that robot getters read the snapshot without the simulator lock."""
+        basic_config.mujoco_config.publish_state = True
+        simulator = make_headless_simulator(robot_configs=[arm_robot_config])
+        robot = simulator.get_robot("/World/Arm")
+        joint_names = robot.get_joint_names()
+        robot.set_joint_positions([0.5, -0.3], joint_names)
+        simulator.step(200)
+        expected = robot.get_joint_positions()
+
+        # Another thread holds the lock, as a stepping loop would
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with simulator.lock:
+                acquired.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        acquired.wait()
+        try:
+            state = simulator.get_robot_state("/World/Arm")
+            positions = simulator.get_joint_positions(robot, joint_names)
+        finally:
+            release.set()
+            holder.join()
+
+        np.testing.assert_allclose(state["joint_positions"], expected)
+        np.testing.assert_allclose(positions, expected)
+        assert state["joint_velocities"].shape == (2,)
+        assert state["orientation"].shape == (4,)
@@ -0,0 +1,110 @@
+"""
+Tests for the compiled flat state vector layout.
+"""
+import numpy as np
+import pytest
+from synthnova_config import CuboidConfig
+
+_ROBOT = "/World/Arm"
+_CAMERA = "/World/Arm/base/arm_camera"
+
+
+@pytest.mark.mujoco
+class TestStateSchema:
+    """Test suite for StateSchema layouts, gathering and views."""
+
+    def test_vector_matches_state_getters(
+        self, make_headless_simulator, arm_robot_config, arm_camera_config
+    ):
+        """Test that the gathered vector holds the same values as the dict getters."""
+        simulator = make_headless_simulator(
+            robot_configs=[arm_robot_config], sensor_configs=[arm_camera_config]
+        )
+        simulator.step(20)
+        simulator.forward()
+
+        schema = simulator.compile_state_schema()
+        assert list(schema.layout) == [_ROBOT, "/World/Cuboid0", "/World/Cuboid1", _CAMERA]
+        vector = simulator.get_state_vector(schema)
+        assert vector.shape == (schema.size,)
+
+        robot_state = simulator.get_robot_state(_ROBOT)
+        for field in ("position", "orientation", "joint_positions", "joint_velocities"):
+            np.testing.assert_allclose(schema.views[_ROBOT][field], robot_state[field])
+        for prim_path in ("/World/Cuboid0", "/World/Cuboid1"):
+            object_state = simulator.get_object_state(prim_path)
+            np.testing.assert_allclose(schema.views[prim_path]["position"], object_state["position"])
+            np.testing.assert_allclose(
+                schema.views[prim_path]["orientation"], object_state["orientation"]
+            )
+
+        camera_id = simulator.model.camera_name2id(simulator.get_sensor(_CAMERA).name)
+        np.testing.assert_allclose(
+            schema.views[_CAMERA]["rotation_matrix"], simulator.data.cam_xmat[camera_id]
+        )
+
+    def test_views_share_memory_and_dtype(self, make_headless_simulator):
+        """Test that views follow later gathers and honour the requested dtype."""
+        simulator = make_headless_simulator()
+        schema = simulator.compile_state_schema(["/World/Cuboid1"], dtype=np.float32)
+        position = schema.views["/World/Cuboid1"]["position"]
+        assert position.dtype == np.float32
+        assert np.shares_memory(position, schema.buffer)
+        assert schema.describe() == [
+            ("/World/Cuboid1", "position", 0, 3),
+            ("/World/Cuboid1", "orientation", 3, 7),
+        ]
+
+        simulator.get_state_vector(schema)
+        first = position.copy()
+        simulator.step(50)
+        simulator.forward()
+        simulator.get_state_vector(schema)
+        assert position[2] < first[2]
+
+        out = np.zeros((2, schema.size), dtype=np.float32)
+        schema.gather_batch([simulator.data._data, simulator.data._data], out=out)
+        np.testing.assert_array_equal(out[1], schema.buffer)
+
+    def test_unknown_prim_path_and_stale_schema(self, make_headless_simulator):
+        """Test that unknown entities and schemas of a previous model are rejected."""
+        simulator = make_headless_simulator()
+        with pytest.raises(KeyError):
+            simulator.compile_state_schema(["/World/Missing"])
+
+        schema = simulator.compile_state_schema()
+        simulator.add_object(
+            CuboidConfig(
+                prim_path="/World/Extra",
+                position=[0, 1, 0.5],
+                orientation=[0, 0, 0, 1],
+                scale=[0.1, 0.1, 0.1],
+                color=[0, 1, 0],
+            )
+        )
+        with pytest.raises(RuntimeError):
+            simulator.get_state_vector(schema)
+        assert "/World/Extra" in simulator.compile_state_schema().layout
+
+    def test_missing_joint_and_camera_lookup(
+        self, make_headless_simulator, arm_robot_config, arm_camera_config
+    ):
+        """Test that missing joints are rejected and cameras are found by their compiled name."""
+        simulator = make_headless_simulator(
+            robot_configs=[arm_robot_config], sensor_configs=[arm_camera_config]
+        )
+        camera = simulator.get_sensor(_CAMERA)
+        camera_id = simulator.model.camera_name2id(camera.sensor_model.camera_name)
+        # The schema reads the camera name of the sensor model, not the sensor name
+        camera.name = "renamed"
+        schema = simulator.compile_state_schema([_CAMERA])
+        simulator.forward()
+        simulator.get_state_vector(schema)
+        np.testing.assert_allclose(
+            schema.views[_CAMERA]["position"], simulator.data.cam_xpos[camera_id]
+        )
+
+        robot = simulator.get_robot(_ROBOT)
+        robot.joint_names = list(robot.joint_names) + ["arm/missing_joint"]
+        with pytest.raises(ValueError, match="missing_joint"):
+            simulator.compile_state_schema([_ROBOT])
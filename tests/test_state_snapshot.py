@@ -0,0 +1,67 @@
+"""
+Tests for MujocoSimulator state snapshot, restore, branch and reset.
+"""
+import pytest
+import numpy as np
+
+
+@pytest.mark.mujoco
+class TestStateSnapshot:
+    """Test suite for full physics state save/restore."""
+
+    def test_restore_rewinds_simulation(self, make_headless_simulator):
+        """Test that restoring a snapshot reproduces the same trajectory."""
+        simulator = make_headless_simulator()
+
+        simulator.step(10)
+        state = simulator.save_state()
+        simulator.step(30)
+        qpos_after = simulator.data.qpos.copy()
+        time_after = simulator.get_simulation_time()
+
+        simulator.restore_state(state)
+        assert simulator.get_simulation_time() == pytest.approx(10 * simulator.get_physics_dt())
+
+        simulator.step(30)
+        np.testing.assert_allclose(simulator.data.qpos, qpos_after)
+        assert simulator.get_simulation_time() == pytest.approx(time_after)
+
+    def test_save_state_reuses_buffer(self, make_headless_simulator):
+        """Test that passing a handle overwrites it in place."""
+        simulator = make_headless_simulator()
+
+        state = simulator.save_state()
+        assert state.shape == (simulator.get_state_size(),)
+        assert state.dtype == np.float64
+
+        simulator.step(5)
+        assert simulator.save_state(out=state) is state
+
+    def test_restore_rejects_mismatched_state(self, make_headless_simulator):
+        """Test that a buffer of the wrong size is rejected."""
+        simulator = make_headless_simulator()
+
+        with pytest.raises(ValueError, match="float64"):
+            simulator.restore_state(np.zeros(3))
+
+    def test_branch_does_not_disturb_live_data(self, make_headless_simulator):
+        """Test stepping a branch leaves the live simulation untouched."""
+        import mujoco
+
+        simulator = make_headless_simulator()
+        qpos_before = simulator.data.qpos.copy()
+
+        branch = simulator.branch()
+        mujoco.mj_step(simulator.model._model, branch, 20)
+
+        np.testing.assert_array_equal(simulator.data.qpos, qpos_before)
+        assert branch.time > simulator.get_simulation_time()
+
+    def test_reset_restores_initial_state(self, make_headless_simulator):
+        """Test that reset() returns the simulation to time zero."""
+        simulator = make_headless_simulator()
+
+        simulator.step(20)
+        simulator.reset()
+
+        assert simulator.get_simulation_time() == 0
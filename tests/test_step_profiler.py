@@ -0,0 +1,70 @@
+"""
+Tests for the per-step timing breakdown of MujocoSimulator.
+"""
+import mujoco
+import pytest
+from physics_simulator.simulator.profiler import StepProfiler
+
+
+@pytest.mark.unit
+class TestStepProfiler:
+    """Test suite for rolling statistics and formatting."""
+
+    def test_rolling_window_and_percentiles(self):
+        """Test that only the last samples are kept and percentiles are ordered."""
+        profiler = StepProfiler(window=10)
+        for i in range(100):
+            profiler.record("work", float(i))
+
+        entry = profiler.get_profile()["work"]
+        assert entry["count"] == 10
+        assert entry["max"] == 99.0
+        assert entry["mean"] == pytest.approx(94.5)
+        assert entry["p50"] <= entry["p90"] <= entry["p99"] <= entry["max"]
+        assert "work" in profiler.format_profile()
+
+    def test_invalid_window_raises_error(self):
+        """Test that an empty window is rejected."""
+        with pytest.raises(ValueError, match="window"):
+            StepProfiler(window=0)
+
+
+@pytest.mark.mujoco
+class TestSimulatorProfiling:
+    """Test suite for enable_profiling/get_profile on MujocoSimulator."""
+
+    def test_disabled_by_default(self, make_headless_simulator):
+        """Test that no clock is installed and the profile is unavailable by default."""
+        simulator = make_headless_simulator()
+
+        assert not simulator.is_profiling()
+        assert mujoco.get_mjcb_time() is None
+        with pytest.raises(RuntimeError, match="enable_profiling"):
+            simulator.get_profile()
+
+    def test_collects_mujoco_timers_and_callbacks(self, make_headless_simulator):
+        """Test that pipeline stages and callback spans are recorded per step."""
+        simulator = make_headless_simulator()
+        simulator.add_physics_callback("noop", lambda: None)
+        simulator.enable_profiling(window=100)
+
+        simulator.loop(real_time_factor=None, duration=50 * simulator.get_physics_dt())
+        profile = simulator.get_profile()
+
+        assert profile["mujoco/step"]["count"] == 50
+        assert profile["mujoco/pos_collision"]["mean"] > 0
+        assert profile["mujoco/constraint"]["count"] == 50
+        assert profile["callbacks/post_step"]["count"] == 50
+        assert "callbacks/post_step" in simulator.format_profile()
+
+    def test_disable_removes_clock(self, make_headless_simulator):
+        """Test that disabling restores the MuJoCo clock callback."""
+        simulator = make_headless_simulator()
+        simulator.enable_profiling()
+        simulator.step(5)
+        assert simulator.get_profile()["mujoco/step"]["count"] == 1
+
+        simulator.disable_profiling()
+
+        assert mujoco.get_mjcb_time() is None
+        assert not simulator.is_profiling()
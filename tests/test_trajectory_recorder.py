@@ -0,0 +1,77 @@
+"""
+Tests for the chunked trajectory recorder and its memory-mapped reader.
+"""
+import numpy as np
+import pytest
+from physics_simulator.simulator.recorder import TrajectoryRecorder, TrajectoryReader
+
+
+@pytest.mark.mujoco
+class TestTrajectoryRecorder:
+    """Test suite for recording loop() steps to chunked files."""
+
+    def test_records_every_step_across_chunks(self, make_headless_simulator, tmp_path):
+        """Test that a partial last chunk is flushed and samples stay in order."""
+        simulator = make_headless_simulator()
+        timestep = simulator.get_physics_dt()
+        output_dir = tmp_path / "run"
+
+        with TrajectoryRecorder(
+            simulator, str(output_dir), chunk_size=16, num_buffers=2
+        ) as recorder:
+            simulator.loop(real_time_factor=None, duration=50 * timestep)
+            final_qpos = simulator.data.qpos.copy()
+
+        assert recorder.num_samples == 50
+        assert not simulator.physics_callback_exists(recorder.callback_name)
+
+        reader = TrajectoryReader(str(output_dir))
+        assert len(reader) == 50
+        assert reader.num_chunks == 4
+        assert isinstance(reader.chunk("qpos", 0), np.memmap)
+        np.testing.assert_allclose(
+            reader["time"], timestep * np.arange(1, 51), rtol=1e-9
+        )
+        np.testing.assert_array_equal(reader["qpos"][-1], final_qpos)
+        np.testing.assert_array_equal(
+            reader.read("qvel", 10, 40), reader["qvel"][10:40]
+        )
+        assert reader.metadata["complete"]
+
+    def test_compressed_manual_recording(self, make_headless_simulator, tmp_path):
+        """Test compressed chunks and explicit record() calls with selected fields."""
+        simulator = make_headless_simulator()
+        recorder = TrajectoryRecorder(
+            simulator,
+            str(tmp_path),
+            fields=("time", "qpos"),
+            chunk_size=4,
+            compress=True,
+            attach=False,
+        )
+        recorder.start()
+        for _ in range(10):
+            simulator.step(2)
+            recorder.record()
+        recorder.stop()
+
+        reader = TrajectoryReader(str(tmp_path))
+        assert reader.fields == ("time", "qpos")
+        assert reader.num_chunks == 3
+        assert reader["qpos"].shape == (10, simulator.model.nq)
+        with pytest.raises(KeyError):
+            reader.read("qvel")
+
+    def test_unknown_field_raises_error(self, make_headless_simulator, tmp_path):
+        """Test that only MjData fields of the recorder can be selected."""
+        simulator = make_headless_simulator()
+
+        with pytest.raises(ValueError, match="Unknown trajectory fields"):
+            TrajectoryRecorder(simulator, str(tmp_path), fields=("qpos", "xpos"))
+
+    def test_invalid_period_raises_error(self, make_headless_simulator, tmp_path):
+        """Test that the recording period is checked before anything starts."""
+        simulator = make_headless_simulator()
+
+        with pytest.raises(ValueError, match="period must be positive"):
+            TrajectoryRecorder(simulator, str(tmp_path), period=0)
@@ -0,0 +1,170 @@
+"""
+Tests for VectorizedMujocoSimulator class.
+"""
+import pytest
+import numpy as np
+from physics_simulator.simulator import VectorizedMujocoSimulator
+
+
+@pytest.mark.mujoco
+class TestVectorizedMujocoSimulator:
+    """Test suite for multi-environment stepping on one compiled model."""
+
+    def test_invalid_num_envs_raises_error(self, basic_config):
+        """Test that a non-positive number of environments is rejected."""
+        with pytest.raises(ValueError, match="num_envs"):
+            VectorizedMujocoSimulator(basic_config, num_envs=0)
+
+    def test_batched_state_shapes(self, make_headless_simulator):
+        """Test batched qpos/qvel/ctrl arrays have a leading env dimension."""
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=4)
+        model = simulator.model._model
+
+        assert simulator.qpos.shape == (4, model.nq)
+        assert simulator.qvel.shape == (4, model.nv)
+        assert simulator.ctrl.shape == (4, model.nu)
+        assert simulator.get_env_data(0) is simulator.data._data
+
+    def test_step_matches_serial_stepping(self, make_headless_simulator):
+        """Test threaded stepping gives the same result as stepping one env."""
+        import mujoco
+
+        simulator = make_headless_simulator(
+            VectorizedMujocoSimulator, num_envs=3, num_threads=3
+        )
+        model = simulator.model._model
+
+        # Drop each env from a different height
+        qpos = np.repeat(simulator.qpos[:1], 3, axis=0)
+        qpos[:, 2] += np.array([0.0, 0.2, 0.4])
+        simulator.set_qpos(qpos)
+
+        reference = mujoco.MjData(model)
+        reference.qpos[:] = qpos[2]
+        mujoco.mj_forward(model, reference)
+
+        simulator.step(50)
+        mujoco.mj_step(model, reference, 50)
+
+        np.testing.assert_allclose(simulator.time, 50 * model.opt.timestep)
+        np.testing.assert_allclose(simulator.qpos[2], reference.qpos)
+        assert not np.allclose(simulator.qpos[0], simulator.qpos[2])
+
+    def test_reset_selected_envs(self, make_headless_simulator):
+        """Test resetting a subset of environments leaves the others untouched."""
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=2)
+
+        simulator.step(20)
+        simulator.reset(env_ids=[1])
+
+        time = simulator.time
+        assert time[0] > 0
+        assert time[1] == 0
+
+    def test_env_index_out_of_range(self, make_headless_simulator):
+        """Test that invalid environment indices are rejected."""
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=2)
+
+        with pytest.raises(IndexError):
+            simulator.reset(env_ids=[2])
+
+    def test_step_samplers_follow_env_0(self, make_headless_simulator):
+        """Test that an IMU samples every step of environment 0."""
+        from synthnova_config import ImuConfig, ImuSensorConfig
+
+        imu_config = ImuConfig(
+            name="imu",
+            prim_path="/World/Imu",
+            position=[3.0, 3.0, 1.0],
+            orientation=[0, 0, 0, 1],
+            sensor_config=ImuSensorConfig(),
+        )
+        simulator = make_headless_simulator(
+            VectorizedMujocoSimulator, num_envs=3, num_threads=3, sensor_configs=[imu_config]
+        )
+        simulator.step(10)
+
+        samples = simulator.get_sensor("/World/Imu").get_samples()
+        np.testing.assert_allclose(samples.time, np.arange(10) * simulator.get_physics_dt())
+        np.testing.assert_allclose(simulator.time, 10 * simulator.get_physics_dt())
+
+    def test_step_publishes_state(self, make_headless_simulator, basic_config):
+        """Test that the state of environment 0 is published after every step call."""
+        basic_config.mujoco_config.publish_state = True
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=2)
+        simulator.step(20)
+
+        snapshot = simulator.get_published_state()
+        assert snapshot.step == 20
+        np.testing.assert_array_equal(snapshot.qpos, simulator.qpos[0])
+
+    def test_step_samples_profiler_timers(self, make_headless_simulator):
+        """Test that the MuJoCo pipeline timers are recorded after every step call."""
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=2)
+        simulator.enable_profiling(window=100)
+        for _ in range(5):
+            simulator.step(2)
+
+        assert simulator.get_profile()["mujoco/step"]["count"] == 5
+
+    def test_runtime_edits_reallocate_envs(self, make_headless_simulator):
+        """Test that adding and removing objects rebuilds every environment on the new model."""
+        from synthnova_config import CuboidConfig
+
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=3, num_threads=3)
+        simulator.use_env_models()
+        simulator.step(5)
+        nq = simulator.model.nq
+
+        simulator.add_object(
+            CuboidConfig(
+                prim_path="/World/Extra",
+                position=[0, 1, 0.5],
+                orientation=[0, 0, 0, 1],
+                scale=[0.1, 0.1, 0.1],
+                color=[0, 1, 0],
+            )
+        )
+        model = simulator.model._model
+        assert model.nq == nq + 7
+        assert simulator.get_env_data(0) is simulator.data._data
+        for env_id in range(3):
+            assert simulator.get_env_model(env_id) is model
+            assert simulator.get_env_data(env_id).qpos.shape == (model.nq,)
+        assert simulator.qpos.shape == (3, model.nq)
+        # Environments restart from the state of environment 0
+        np.testing.assert_array_equal(simulator.qpos[1], simulator.qpos[0])
+
+        simulator.step(5)
+        np.testing.assert_allclose(simulator.time, 10 * simulator.get_physics_dt())
+
+        simulator.remove_object("/World/Extra")
+        assert simulator.qpos.shape == (3, nq)
+        assert simulator.get_env_data(2).qpos.shape == (nq,)
+
+    def test_env_access_before_initialize_raises_error(self, basic_config):
+        """Test that per-environment access requires an initialized simulator."""
+        from unittest.mock import Mock, patch
+
+        with patch.object(VectorizedMujocoSimulator, "_load_logger", return_value=Mock()):
+            simulator = VectorizedMujocoSimulator(basic_config, num_envs=2)
+        for access in (
+            lambda: simulator.get_env_data(0),
+            lambda: simulator.get_env_model(0),
+            simulator.use_env_models,
+        ):
+            with pytest.raises(RuntimeError, match="initialize"):
+                access()
+
+    def test_reset_publishes_env_0(self, make_headless_simulator, basic_config):
+        """Test that resetting environment 0 publishes its reset state."""
+        basic_config.mujoco_config.publish_state = True
+        simulator = make_headless_simulator(VectorizedMujocoSimulator, num_envs=2)
+        simulator.step(20)
+
+        simulator.reset(env_ids=[1])
+        assert simulator.get_published_state().time > 0
+        simulator.reset(env_ids=[0])
+        snapshot = simulator.get_published_state()
+        assert snapshot.time == 0
+        np.testing.assert_array_equal(snapshot.qpos, simulator.qpos[0])